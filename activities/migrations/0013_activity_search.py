@@ -0,0 +1,53 @@
+from django.db import migrations
+
+# Frozen copy of the search index of utils.search as of this migration.
+FIELDS = ("title", "content", "location")
+INDEX_NAME = "activities_activity_search_idx"
+SQLITE_CREATE = [
+    'CREATE VIRTUAL TABLE IF NOT EXISTS "activities_activity_fts" USING fts5("title", "content", "location", content=\'activities_activity\', content_rowid=\'id\', tokenize=\'unicode61 remove_diacritics 2\')',
+    'CREATE TRIGGER IF NOT EXISTS "activities_activity_fts_insert" AFTER INSERT ON "activities_activity" BEGIN INSERT INTO "activities_activity_fts"(rowid, "title", "content", "location") VALUES (new."id", new."title", new."content", new."location"); END',
+    'CREATE TRIGGER IF NOT EXISTS "activities_activity_fts_delete" AFTER DELETE ON "activities_activity" BEGIN INSERT INTO "activities_activity_fts"("activities_activity_fts", rowid, "title", "content", "location") VALUES (\'delete\', old."id", old."title", old."content", old."location"); END',
+    'CREATE TRIGGER IF NOT EXISTS "activities_activity_fts_update" AFTER UPDATE OF "title", "content", "location" ON "activities_activity" BEGIN INSERT INTO "activities_activity_fts"("activities_activity_fts", rowid, "title", "content", "location") VALUES (\'delete\', old."id", old."title", old."content", old."location"); INSERT INTO "activities_activity_fts"(rowid, "title", "content", "location") VALUES (new."id", new."title", new."content", new."location"); END',
+    'INSERT INTO "activities_activity_fts"("activities_activity_fts") VALUES (\'rebuild\')',
+]
+SQLITE_DROP = [
+    'DROP TRIGGER IF EXISTS "activities_activity_fts_insert"',
+    'DROP TRIGGER IF EXISTS "activities_activity_fts_delete"',
+    'DROP TRIGGER IF EXISTS "activities_activity_fts_update"',
+    'DROP TABLE IF EXISTS "activities_activity_fts"',
+]
+
+
+def create_activity_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        from django.contrib.postgres.indexes import GinIndex
+        from django.contrib.postgres.search import SearchVector
+
+        schema_editor.add_index(
+            apps.get_model("activities", "Activity"),
+            GinIndex(SearchVector(*FIELDS, config="dutch"), name=INDEX_NAME),
+        )
+    elif vendor == "sqlite":
+        for statement in SQLITE_CREATE:
+            schema_editor.execute(statement)
+
+
+def drop_activity_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{INDEX_NAME}"')
+    elif vendor == "sqlite":
+        for statement in SQLITE_DROP:
+            schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("activities", "0012_activity_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_activity_search_index, drop_activity_search_index),
+    ]
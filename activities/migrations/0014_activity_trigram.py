@@ -0,0 +1,37 @@
+from django.db import migrations
+
+# Frozen copy of the trigram indexes of utils.search as of this migration.
+CREATE = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    'CREATE INDEX IF NOT EXISTS "activities_activity_title_trgm_idx" ON "activities_activity" USING gin (UPPER("title"::text) gin_trgm_ops)',
+    'CREATE INDEX IF NOT EXISTS "activities_activity_location_trgm_idx" ON "activities_activity" USING gin (UPPER("location"::text) gin_trgm_ops)',
+]
+DROP = [
+    'DROP INDEX IF EXISTS "activities_activity_title_trgm_idx"',
+    'DROP INDEX IF EXISTS "activities_activity_location_trgm_idx"',
+]
+
+
+def create_activity_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        for statement in CREATE:
+            schema_editor.execute(statement)
+
+
+def drop_activity_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        for statement in DROP:
+            schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("activities", "0013_activity_search"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            create_activity_trigram_indexes, drop_activity_trigram_indexes
+        ),
+    ]
@@ -1,5 +1,7 @@
 """Database models for the activities application."""
 
+from collections import defaultdict
+
 from django.db import models
 from django.utils import timezone
 from django.urls import reverse
@@ -7,7 +9,10 @@ from committees.models import Committee
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 from utils.upload_paths import hashed_upload_path
-from utils.slug import generate_unique_slug
+from utils.rows import Row
+from utils.cache import invalidate_activities
+from utils.search import search
+from utils.slug import bulk_create_with_unique_slugs, save_with_unique_slug
 
 
 def start_date_not_in_past(date):
@@ -19,6 +24,62 @@ def start_date_not_in_past(date):
         )
 
 
+# Fields matched by :meth:`ActivityQuerySet.search`.
+SEARCH_FIELDS = ("title", "content", "location")
+
+
+class ActivityQuerySet(models.QuerySet):
+    """Custom queryset for :class:`Activity`."""
+
+    def rows(self):
+        """Return the activities as :class:`~utils.rows.Row` objects for list pages.
+
+        Only the fields displayed in activity lists are loaded.
+        """
+        return [
+            Row.for_model(
+                Activity,
+                values["id"],
+                values["title"],
+                title=values["title"],
+                slug=values["slug"],
+                start=values["start"],
+                location=values["location"],
+                created_at=values["created_at"],
+            )
+            for values in self.values(
+                "id", "title", "slug", "start", "location", "created_at"
+            )
+        ]
+
+    def search(self, query):
+        """Return the activities matching ``query``, best matches first.
+
+        See :func:`utils.search.search`.
+        """
+        return search(self, query, SEARCH_FIELDS)
+
+    def bulk_create_with_slugs(self, objs, batch_size=500):
+        """Insert ``objs`` in batches, generating the missing slugs from their titles.
+
+        Unlike :meth:`bulk_create`, this invalidates the cached activity lists.
+        """
+        activities = bulk_create_with_unique_slugs(self, objs, "title", batch_size)
+        committee_slugs = dict(
+            Committee.objects.filter(
+                pk__in={activity.committee_id for activity in activities}
+            ).values_list("pk", "slug")
+        )
+        dates = defaultdict(list)
+        for activity in activities:
+            dates[committee_slugs.get(activity.committee_id)].append(
+                activity.created_at
+            )
+        for committee_slug, created in dates.items():
+            invalidate_activities(committee_slug, dates=created)
+        return activities
+
+
 class Activity(models.Model):
     """Model representing an activity organised by a committee."""
 
@@ -28,6 +89,19 @@ class Activity(models.Model):
         verbose_name = _("Activity")
         verbose_name_plural = _("Activities")
         ordering = ["start"]
+        indexes = [
+            # Upcoming activities, of all committees or of one.
+            models.Index(fields=["start"], name="activity_start_idx"),
+            models.Index(
+                fields=["committee", "start"], name="activity_committee_start_idx"
+            ),
+            # Archive months, of all committees or of one.
+            models.Index(fields=["created_at"], name="activity_created_idx"),
+            models.Index(
+                fields=["committee", "created_at"],
+                name="activity_committee_created_idx",
+            ),
+        ]
 
     title = models.CharField(_("title"), max_length=200)
     slug = models.SlugField(max_length=200, unique=True)
@@ -47,11 +121,14 @@ class Activity(models.Model):
     created_at = models.DateTimeField(_("created at"), default=timezone.now)
     updated_at = models.DateTimeField(_("updated at"), auto_now=True)
 
+    objects = ActivityQuerySet.as_manager()
+
     def save(self, *args, **kwargs):
         """Generate a unique slug from the title on first save."""
-        if not self.slug:
-            self.slug = generate_unique_slug(self, self.title)
-        super().save(*args, **kwargs)
+        if self.slug:
+            super().save(*args, **kwargs)
+        else:
+            save_with_unique_slug(self, self.title, super().save, *args, **kwargs)
 
     def clean(self):
         """Validate that the end date is not before the start date."""
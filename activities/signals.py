@@ -0,0 +1,56 @@
+"""Signal handlers keeping the activity caches in sync with the database."""
+
+from django.db import connections
+from django.db.models.signals import post_delete, post_migrate, post_save, pre_save
+from django.dispatch import receiver
+
+from committees.models import Committee
+from utils.cache import invalidate_activities
+from utils.search import restore_search_index
+from .models import SEARCH_FIELDS, Activity
+
+
+def _committee_slug(activity):
+    """Return the slug of the activity's committee, if it still exists."""
+    try:
+        return activity.committee.slug
+    except Committee.DoesNotExist:
+        return None
+
+
+@receiver(pre_save, sender=Activity)
+def remember_previous_values(sender, instance, **kwargs):
+    """Record the committee and creation date of an activity before it is changed."""
+    instance._previous_committee_slug = None
+    instance._previous_created_at = None
+    if instance.pk and not instance._state.adding:
+        previous = (
+            sender.objects.filter(pk=instance.pk)
+            .values_list("committee__slug", "created_at")
+            .first()
+        )
+        if previous:
+            instance._previous_committee_slug, instance._previous_created_at = previous
+
+
+@receiver(post_save, sender=Activity)
+def invalidate_activity_caches(sender, instance, **kwargs):
+    """Evict the cached activity lists containing the saved activity."""
+    invalidate_activities(
+        _committee_slug(instance),
+        getattr(instance, "_previous_committee_slug", None),
+        dates=[instance.created_at, getattr(instance, "_previous_created_at", None)],
+    )
+
+
+@receiver(post_delete, sender=Activity)
+def invalidate_deleted_activity_caches(sender, instance, **kwargs):
+    """Evict the cached activity lists containing the deleted activity."""
+    invalidate_activities(_committee_slug(instance), dates=[instance.created_at])
+
+
+@receiver(post_migrate)
+def restore_activity_search_index(sender, using, **kwargs):
+    """Recreate the search triggers dropped by migrations remaking the table."""
+    if sender.name == "activities":
+        restore_search_index(connections[using], Activity, SEARCH_FIELDS)
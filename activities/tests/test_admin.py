@@ -1,6 +1,8 @@
 import datetime
 from django.utils import timezone
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.contrib.auth.models import User, Group, Permission
 from committees.models import Committee
@@ -82,3 +84,41 @@ class ActivityAdminTest(TestCase):
         )
         self.assertEqual(response.status_code, 200)  # Form displayed with errors
         self.assertContains(response, "error")  # Error message displayed
+
+    def test_changelist_lists_only_own_committee_activities(self):
+        """Test that the changelist leaves out activities of other committees."""
+        other_committee = Committee.objects.create(
+            group=Group.objects.create(name="Other Committee"),
+            slug="other-committee",
+            description="Another committee",
+            email="other@example.com",
+        )
+        Activity.objects.create(
+            title="Other Activity",
+            content="Other content",
+            start=timezone.now(),
+            end=timezone.now() + datetime.timedelta(hours=2),
+            location="Other Location",
+            committee=other_committee,
+        )
+        response = self.client.get(reverse("admin:activities_activity_changelist"))
+        self.assertContains(response, "Test Activity")
+        self.assertNotContains(response, "Other Activity")
+        self.assertEqual(response.context["cl"].result_count, 1)
+
+    def test_changelist_queries_do_not_grow_with_activities(self):
+        """Test that the committees of listed activities are loaded with them."""
+        url = reverse("admin:activities_activity_changelist")
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(url)
+        for number in range(5):
+            Activity.objects.create(
+                title=f"Activity {number}",
+                content="Content",
+                start=timezone.now(),
+                end=timezone.now() + datetime.timedelta(hours=2),
+                location="Location",
+                committee=self.committee,
+            )
+        with self.assertNumQueries(len(queries)):
+            self.client.get(url)
@@ -339,3 +339,33 @@ class ActivityModelEndDate(TestCase):
         )
         with self.assertRaises(ValidationError):
             activity.full_clean()
+
+
+class ActivityBulkCreateWithSlugsTest(TestCase):
+    def test_slugs_are_allocated_for_the_whole_batch(self):
+        """Test that activities sharing a title get distinct slugs."""
+        committee = Committee.objects.create(
+            group=Group.objects.create(name="Test Committee"),
+            slug="test-committee",
+            description="A test committee",
+            email="test@example.com",
+        )
+        start = timezone.now() + datetime.timedelta(days=1)
+        activities = Activity.objects.bulk_create_with_slugs(
+            [
+                Activity(
+                    title="Monthly Meeting",
+                    content="Content",
+                    start=start,
+                    end=start + datetime.timedelta(hours=2),
+                    location="Community Center",
+                    committee=committee,
+                )
+                for _ in range(3)
+            ]
+        )
+        self.assertEqual(
+            [activity.slug for activity in activities],
+            ["monthly-meeting", "monthly-meeting-1", "monthly-meeting-2"],
+        )
+        self.assertEqual(Activity.objects.count(), 3)
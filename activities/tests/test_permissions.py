@@ -87,4 +87,5 @@ class ActivityPermissionsTest(TestCase):
         self.client.login(username="another_user", password="password")
         edit_url = reverse("admin:activities_activity_change", args=[self.activity.id])
         response = self.client.get(edit_url)
-        self.assertEqual(response.status_code, 403)
+        # Activities of other committees are not part of the admin queryset.
+        self.assertRedirects(response, reverse("admin:index"))
@@ -0,0 +1,75 @@
+import datetime
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User, Group
+from django.core.cache import cache
+from django.utils import timezone
+from committees.models import Committee
+from activities.models import Activity
+from utils.cache import activities_archive_key, upcoming_activities_key
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class ActivityCacheInvalidationTest(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(
+            username="testuser", email="user@example.com", password="password"
+        )
+        self.committee1 = Committee.objects.create(
+            group=Group.objects.create(name="Committee 1"),
+            slug="committee-1",
+            description="Committee 1 description",
+            contact_person=user,
+            email="committee1@example.com",
+        )
+        self.committee2 = Committee.objects.create(
+            group=Group.objects.create(name="Committee 2"),
+            slug="committee-2",
+            description="Committee 2 description",
+            contact_person=user,
+            email="committee2@example.com",
+        )
+        self.activity = Activity.objects.create(
+            title="Test Activity",
+            slug="test-activity",
+            content="Test content",
+            start=timezone.now() + datetime.timedelta(days=1),
+            end=timezone.now() + datetime.timedelta(days=1, hours=2),
+            location="Test Location",
+            committee=self.committee1,
+        )
+        cache.clear()
+        cache.set_many(
+            {
+                upcoming_activities_key(): ["cached"],
+                activities_archive_key(): {"cached": {}},
+                activities_archive_key("committee-1"): {"cached": {}},
+                activities_archive_key("committee-2"): {"cached": {}},
+            }
+        )
+
+    def test_saving_activity_evicts_affected_keys(self):
+        """Test that saving an activity evicts only the lists containing it."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.activity.location = "Elsewhere"
+            self.activity.save()
+        self.assertIsNone(cache.get(upcoming_activities_key()))
+        self.assertIsNone(cache.get(activities_archive_key()))
+        self.assertIsNone(cache.get(activities_archive_key("committee-1")))
+        self.assertIsNotNone(cache.get(activities_archive_key("committee-2")))
+
+    def test_moving_activity_evicts_both_committees(self):
+        """Test that moving an activity evicts the old and new archives."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.activity.committee = self.committee2
+            self.activity.save()
+        self.assertIsNone(cache.get(activities_archive_key("committee-1")))
+        self.assertIsNone(cache.get(activities_archive_key("committee-2")))
+
+    def test_deleting_activity_evicts_affected_keys(self):
+        """Test that deleting an activity evicts the lists containing it."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.activity.delete()
+        self.assertIsNone(cache.get(upcoming_activities_key()))
+        self.assertIsNotNone(cache.get(activities_archive_key("committee-2")))
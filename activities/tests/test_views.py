@@ -1,8 +1,11 @@
-from django.test import TestCase, Client
+from django.test import TestCase, Client, override_settings
 from django.urls import reverse
+from django.core.cache import cache
 from django.contrib.auth.models import User, Group
 from committees.models import Committee
 from activities.models import Activity
+from utils.tests.helpers import loaded_columns
+from utils.cache import upcoming_activities_key
 import datetime
 from django.utils import timezone
 
@@ -251,10 +254,19 @@ class ActivitiesArchiveViewTest(TestCase):
         self.assertIn("grouped_activities", response.context)
         self.assertIn("all_committees", response.context)
 
-        # Check years in grouped_activities
-        grouped_activities = response.context["grouped_activities"]
-        self.assertIn(2022, grouped_activities)
-        self.assertIn(2023, grouped_activities)
+        # Only the latest month is shown, the others are linked
+        self.assertEqual(
+            response.context["grouped_activities"],
+            {2023: {datetime.date(2023, 2, 1): [self.activity2]}},
+        )
+        self.assertEqual(
+            response.context["archive_months"],
+            [
+                (datetime.date(2023, 2, 1), 1),
+                (datetime.date(2023, 1, 1), 2),
+                (datetime.date(2022, 12, 1), 1),
+            ],
+        )
 
         # Check committees in all_committees
         all_committees = response.context["all_committees"]
@@ -262,6 +274,18 @@ class ActivitiesArchiveViewTest(TestCase):
         self.assertIn(self.committee1, all_committees)
         self.assertIn(self.committee2, all_committees)
 
+    def test_archive_month_view(self):
+        """Test that an archive month shows the activities of that month only."""
+        response = self.client.get(reverse("activities:archive_month", args=[2022, 12]))
+        self.assertEqual(
+            response.context["grouped_activities"],
+            {2022: {datetime.date(2022, 12, 1): [self.activity3]}},
+        )
+        self.assertEqual(response.context["newer_month"], datetime.date(2023, 1, 1))
+        self.assertIsNone(response.context["older_month"])
+        response = self.client.get(reverse("activities:archive_month", args=[2021, 1]))
+        self.assertEqual(response.status_code, 404)
+
     def test_archive_view_with_committee_filter(self):
         """Test that the archive view correctly filters activities by committee."""
         # Filter by committee1
@@ -272,20 +296,125 @@ class ActivitiesArchiveViewTest(TestCase):
         self.assertIn("filtered_committee", response.context)
         self.assertEqual(response.context["filtered_committee"], self.committee1)
 
-        grouped_activities = response.context["grouped_activities"]
-
-        # Committee 1 had activities in 2023 (January and February)
-        self.assertIn(2023, grouped_activities)
+        # Committee 1 had activities in 2023 (January and February), not in 2022
+        self.assertEqual(
+            response.context["archive_months"],
+            [(datetime.date(2023, 2, 1), 1), (datetime.date(2023, 1, 1), 1)],
+        )
+        self.assertEqual(
+            response.context["grouped_activities"],
+            {2023: {datetime.date(2023, 2, 1): [self.activity2]}},
+        )
 
         # Check January 2023 - should only have Committee 1's activity
-        january_activities = grouped_activities[2023]["January"]
-        self.assertEqual(len(january_activities), 1)
-        self.assertEqual(january_activities[0], self.activity1)
+        response = self.client.get(
+            f"{reverse('activities:archive_month', args=[2023, 1])}"
+            f"?committee={self.committee1.slug}"
+        )
+        self.assertEqual(
+            response.context["grouped_activities"],
+            {2023: {datetime.date(2023, 1, 1): [self.activity1]}},
+        )
 
-        # Check February 2023 - should only have Committee 1's activity
-        february_activities = grouped_activities[2023]["February"]
-        self.assertEqual(len(february_activities), 1)
-        self.assertEqual(february_activities[0], self.activity2)
 
-        # 2022 should not be present for Committee 1
-        self.assertNotIn(2022, grouped_activities)
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class ActivitiesConditionalGetTest(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(
+            username="testuser", email="user@example.com", password="password"
+        )
+        self.committee = Committee.objects.create(
+            group=Group.objects.create(name="Test Committee"),
+            slug="test-committee",
+            description="A test committee",
+            contact_person=user,
+            email="test@example.com",
+        )
+        self.activity = Activity.objects.create(
+            title="Test Activity",
+            content="Content",
+            start=timezone.now() + datetime.timedelta(days=1),
+            end=timezone.now() + datetime.timedelta(days=1, hours=2),
+            location="Test Location",
+            committee=self.committee,
+        )
+        cache.clear()
+
+    def test_unchanged_index_is_not_modified(self):
+        """Test that the index is answered with 304 without querying the database."""
+        url = reverse("activities:index")
+        etag = self.client.get(url)["ETag"]
+        with self.assertNumQueries(0):
+            response = self.client.get(url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 304)
+
+    def test_index_etag_changes_when_activity_starts(self):
+        """Test that the index ETag changes once its first activity started."""
+        url = reverse("activities:index")
+        etag = self.client.get(url)["ETag"]
+        Activity.objects.filter(pk=self.activity.pk).update(
+            start=timezone.now() - datetime.timedelta(hours=1)
+        )
+        # The cached list expires when its first activity starts.
+        cache.delete(upcoming_activities_key())
+        response = self.client.get(url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, "Test Activity")
+
+
+class ActivitiesListColumnsTest(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(
+            username="testuser", email="user@example.com", password="password"
+        )
+        self.committee = Committee.objects.create(
+            group=Group.objects.create(name="Test Committee"),
+            slug="test-committee",
+            description="A test committee",
+            contact_person=user,
+            email="test@example.com",
+        )
+        start = timezone.now() + datetime.timedelta(days=1)
+        Activity.objects.create(
+            title="Test Activity",
+            content="Large content",
+            start=start,
+            end=start + datetime.timedelta(hours=2),
+            location="Community Center",
+            committee=self.committee,
+        )
+
+    def assert_list_columns(self, url):
+        """Assert that rendering ``url`` only loads the columns lists display."""
+        with loaded_columns() as columns:
+            self.assertEqual(self.client.get(url).status_code, 200)
+        self.assertTrue(columns["activities_activity"])
+        self.assertLessEqual(
+            columns["activities_activity"],
+            {
+                "id",
+                "title",
+                "slug",
+                "start",
+                "location",
+                "created_at",
+                "updated_at",
+                "committee_id",
+            },
+        )
+        self.assertLessEqual(
+            columns["committees_committee"], {"id", "slug", "group_id"}
+        )
+
+    def test_index_loads_list_columns(self):
+        """Test that the index never loads the content or files of activities."""
+        self.assert_list_columns(reverse("activities:index"))
+
+    def test_archive_loads_list_columns(self):
+        """Test that the archive never loads the content or files of activities."""
+        self.assert_list_columns(reverse("activities:archive"))
+        self.assert_list_columns(
+            f"{reverse('activities:archive')}?committee={self.committee.slug}"
+        )
@@ -1,18 +1,94 @@
 """Views for the activities application."""
 
 import logging
+from functools import partial
+
 from django.utils import timezone
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
 from django.views.generic import ListView, DetailView, base
-from django.core.cache import cache
 
 from committees.models import Committee
+from utils.archive import (
+    archive_page,
+    cached_archive,
+    cached_archive_months,
+    canonical_archive_query,
+)
+from utils.cache import (
+    ACTIVITIES,
+    ARCHIVE_TIMEOUT,
+    COMMITTEES,
+    COMMITTEE_TIMEOUT,
+    activities_archive_key,
+    activities_archive_month_keys,
+    activities_namespace,
+    all_committees_key,
+    archive_page_namespaces,
+    get_or_set,
+    last_modified,
+    upcoming_activities_key,
+    upcoming_timeout,
+    versioned_cache_page,
+    versioned_condition,
+    versioned_etag,
+)
 from .models import Activity
 
 logger = logging.getLogger(__name__)
 
 
+def upcoming_activities():
+    """Return the next five upcoming activities."""
+    return get_or_set(
+        upcoming_activities_key(),
+        lambda: Activity.objects.filter(start__gte=timezone.now())
+        .order_by("start")[:5]
+        .rows(),
+        upcoming_timeout,
+        compact=True,
+    )
+
+
+def upcoming_activities_etag(request):
+    """Return the ETag of the activities index.
+
+    The index changes when its first activity starts, without any activity
+    being modified, so the ETag includes the activities it lists.
+    """
+    return versioned_etag(
+        [ACTIVITIES], *(activity.pk for activity in upcoming_activities())
+    )
+
+
+def activity_last_modified(request, slug):
+    """Return when the activity ``slug`` was last modified."""
+    return last_modified(
+        f"activity_{slug}", Activity.objects.filter(slug=slug), ACTIVITIES, COMMITTEES
+    )
+
+
+def archive_last_modified(request, year=None, month=None):
+    """Return when the activities in the archive were last modified.
+
+    Every month of the archive lists the other months, so it depends on all of
+    them.
+    """
+    committee_slug = request.GET.get("committee")
+    if committee_slug:
+        return last_modified(
+            f"activities_archive_{committee_slug}",
+            Activity.objects.filter(committee__slug=committee_slug),
+            activities_namespace(committee_slug),
+            COMMITTEES,
+        )
+    return last_modified(
+        "activities_archive_all", Activity.objects.all(), ACTIVITIES, COMMITTEES
+    )
+
+
+@method_decorator(
+    versioned_condition(etag_func=upcoming_activities_etag), name="dispatch"
+)
 class IndexView(ListView):
     """Display a list of upcoming activities."""
 
@@ -22,18 +98,15 @@ class IndexView(ListView):
     def get_queryset(self):
         """Return the next five upcoming activities."""
         logger.debug("Fetching upcoming activities for index view")
-        cache_key = "upcoming_activities"
-        return cache.get_or_set(
-            cache_key,
-            lambda: list(
-                Activity.objects.select_related("committee")
-                .filter(start__gte=timezone.now())
-                .order_by("start")[:5]
-            ),
-            60 * 15,
-        )
+        return upcoming_activities()
 
 
+@method_decorator(
+    versioned_condition(
+        lambda request: [ACTIVITIES, COMMITTEES], activity_last_modified
+    ),
+    name="dispatch",
+)
 class DetailView(DetailView):
     """Display the details of a single activity."""
 
@@ -41,7 +114,15 @@ class DetailView(DetailView):
     template_name = "activities/detail.html"
 
 
-@method_decorator(cache_page(60 * 15), name="dispatch")
+@method_decorator(canonical_archive_query, name="dispatch")
+@method_decorator(
+    versioned_condition(archive_page_namespaces(ACTIVITIES), archive_last_modified),
+    name="dispatch",
+)
+@method_decorator(
+    versioned_cache_page(ARCHIVE_TIMEOUT, archive_page_namespaces(ACTIVITIES)),
+    name="dispatch",
+)
 class ActivitiesArchiveView(base.TemplateView):
     """Render an archive of activities grouped by date."""
 
@@ -51,7 +132,7 @@ class ActivitiesArchiveView(base.TemplateView):
     def get_queryset(self):
         """Return activities optionally filtered by committee slug."""
         # Filter activities by committee if a query parameter is provided
-        queryset = Activity.objects.select_related("committee").all()
+        queryset = Activity.objects.all()
         committee_slug = self.request.GET.get("committee")
         if committee_slug:
             logger.info("Filtering activities for committee %s", committee_slug)
@@ -64,34 +145,36 @@ class ActivitiesArchiveView(base.TemplateView):
         """Build the context with grouped activities and committees."""
         context = super().get_context_data(**kwargs)
         committee_slug = self.request.GET.get("committee")
-        cache_key = f"activities_archive_{committee_slug or 'all'}"
-        grouped_activities = cache.get(cache_key)
-        if grouped_activities is None:
-            queryset = self.get_queryset()
-
-            grouped_activities = {}
-            for activity in queryset:
-                year = activity.created_at.year
-                month = activity.created_at.strftime("%B")
-                grouped_activities.setdefault(year, {}).setdefault(month, []).append(
-                    activity
-                )
-            cache.set(cache_key, grouped_activities, 60 * 15)
+        queryset = self.get_queryset()
+        months = cached_archive_months(
+            queryset, "created_at", activities_archive_key(committee_slug)
+        )
+        page = archive_page(months, self.kwargs.get("year"), self.kwargs.get("month"))
+        current = page["current_month"]
+        grouped_activities = cached_archive(
+            queryset,
+            "created_at",
+            [[current.year, current.month]] if current else [],
+            partial(activities_archive_month_keys, committee_slug),
+        )
+        context.update(page)
 
         context["grouped_activities"] = grouped_activities
-        context["all_committees"] = cache.get_or_set(
-            "all_committees",
-            lambda: list(Committee.objects.all()),
-            60 * 60,
+        context["all_committees"] = get_or_set(
+            all_committees_key(),
+            lambda: list(Committee.objects.for_filter()),
+            COMMITTEE_TIMEOUT,
+            local=True,
+        )
+        # The filter only needs the fields loaded for the list of committees.
+        context["filtered_committee"] = next(
+            (
+                committee
+                for committee in context["all_committees"]
+                if committee.slug == committee_slug
+            ),
+            None,
         )
-        if committee_slug:
-            context["filtered_committee"] = cache.get_or_set(
-                f"committee_{committee_slug}",
-                lambda: Committee.objects.filter(slug=committee_slug).first(),
-                60 * 60,
-            )
-        else:
-            context["filtered_committee"] = None
         logger.debug(
             "Prepared context with %d activities",
             sum(
@@ -9,7 +9,7 @@ class CommitteeAdmin(admin.ModelAdmin):
     """Admin interface definition for :class:`~committees.models.Committee`."""
 
     list_display = ("group", "email", "contact_person")
-    search_fields = ("group", "email", "contact_person")
+    search_fields = ("group__name", "email", "contact_person__username")
     fieldsets = [
         (None, {"fields": ["group", "email", "contact_person", "description"]}),
     ]
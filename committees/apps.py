@@ -10,3 +10,8 @@ class CommitteesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "committees"
     verbose_name = _("Committees")
+
+    def ready(self):
+        """Connect the cache invalidation signal handlers."""
+        # pylint: disable-next=import-outside-toplevel,unused-import
+        from . import signals  # noqa: F401
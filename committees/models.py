@@ -7,6 +7,14 @@ from django.contrib.auth.models import Group, User
 from django.utils.translation import gettext_lazy as _
 
 
+class CommitteeQuerySet(models.QuerySet):
+    """Custom queryset for :class:`Committee`."""
+
+    def for_filter(self):
+        """Return the committees loading only the fields committee filters show."""
+        return self.select_related("group").only("slug", "group__name")
+
+
 class Committee(models.Model):
     """Model representing a committee within the community."""
 
@@ -31,6 +39,8 @@ class Committee(models.Model):
     )
     email = models.EmailField(_("email"))
 
+    objects = CommitteeQuerySet.as_manager()
+
     def save(self, *args, **kwargs):
         """Generate a slug from the group's name on first save."""
         if not self.slug:
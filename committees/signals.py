@@ -0,0 +1,71 @@
+"""Signal handlers keeping the committee caches in sync with the database."""
+
+from django.contrib.auth.models import Group, User
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from utils.cache import invalidate_committee_members, invalidate_committees
+from .models import Committee
+
+
+@receiver(pre_save, sender=Committee)
+def remember_previous_slug(sender, instance, **kwargs):
+    """Record the slug a committee had before it is saved."""
+    instance._previous_slug = None
+    if instance.pk and not instance._state.adding:
+        instance._previous_slug = (
+            sender.objects.filter(pk=instance.pk).values_list("slug", flat=True).first()
+        )
+
+
+@receiver(post_save, sender=Committee)
+def invalidate_committee_caches(sender, instance, **kwargs):
+    """Evict the cached data displaying the saved committee."""
+    invalidate_committees(instance.slug, getattr(instance, "_previous_slug", None))
+
+
+@receiver(post_delete, sender=Committee)
+def invalidate_deleted_committee_caches(sender, instance, **kwargs):
+    """Evict the cached data displaying the deleted committee."""
+    invalidate_committees(instance.slug)
+
+
+@receiver(post_save, sender=Group)
+def invalidate_group_caches(sender, instance, created, **kwargs):
+    """Evict the cached data displaying the committee of a renamed group."""
+    if created:
+        return
+    slugs = Committee.objects.filter(group=instance).values_list("slug", flat=True)
+    if slugs:
+        invalidate_committees(*slugs)
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+def invalidate_membership_caches(sender, instance, action, reverse, pk_set, **kwargs):
+    """Evict the cached pages listing the members of a committee that changed."""
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if reverse:
+        groups = [instance.pk]
+    elif action == "pre_clear":
+        groups = instance.groups.values_list("pk", flat=True)
+    else:
+        groups = pk_set
+    slugs = Committee.objects.filter(group__in=groups).values_list("slug", flat=True)
+    if slugs:
+        invalidate_committee_members(*slugs)
+
+
+@receiver(post_save, sender=User)
+def invalidate_member_caches(sender, instance, created, update_fields, **kwargs):
+    """Evict the cached pages displaying the name or email of a saved user."""
+    if created or update_fields == frozenset(["last_login"]):
+        return
+    slugs = (
+        Committee.objects.filter(Q(group__user=instance) | Q(contact_person=instance))
+        .values_list("slug", flat=True)
+        .distinct()
+    )
+    if slugs:
+        invalidate_committee_members(*slugs)
@@ -49,3 +49,13 @@ class CommitteeAdminTest(TestCase):
         self.assertContains(response, "Test Committee")
         self.assertContains(response, "A test committee")
         self.assertContains(response, "test@example.com")
+
+    def test_committee_admin_search(self):
+        """Test that committees can be searched by group name and contact person."""
+        url = reverse("admin:committees_committee_changelist")
+        response = self.client.get(url, {"q": "test"})
+        self.assertContains(response, "Test Committee")
+        response = self.client.get(url, {"q": "staff_user"})
+        self.assertContains(response, "Test Committee")
+        response = self.client.get(url, {"q": "unknown"})
+        self.assertNotContains(response, "Test Committee")
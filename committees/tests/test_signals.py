@@ -0,0 +1,102 @@
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User, Group
+from django.core.cache import cache
+from committees.models import Committee
+from utils.cache import (
+    all_committees_key,
+    committee_index_key,
+    committee_key,
+    latest_posts_key,
+    news_archive_key,
+)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class CommitteeCacheInvalidationTest(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(
+            username="testuser", email="user@example.com", password="password"
+        )
+        self.group = Group.objects.create(name="Test Committee")
+        self.committee = Committee.objects.create(
+            group=self.group,
+            slug="test-committee",
+            description="A test committee",
+            contact_person=user,
+            email="test@example.com",
+        )
+        self.other_group = Group.objects.create(name="Unrelated Group")
+        cache.clear()
+        cache.set_many(
+            {
+                all_committees_key(): ["cached"],
+                committee_index_key(): ["cached"],
+                committee_key("test-committee"): "cached",
+                committee_key("other-committee"): "cached",
+                latest_posts_key(): ["cached"],
+                news_archive_key("test-committee"): {"cached": {}},
+            }
+        )
+
+    def test_saving_committee_evicts_affected_keys(self):
+        """Test that saving a committee evicts the data displaying it."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.committee.description = "Updated description"
+            self.committee.save()
+        self.assertIsNone(cache.get(all_committees_key()))
+        self.assertIsNone(cache.get(committee_index_key()))
+        self.assertIsNone(cache.get(committee_key("test-committee")))
+        self.assertIsNone(cache.get(latest_posts_key()))
+        self.assertIsNone(cache.get(news_archive_key("test-committee")))
+        self.assertIsNotNone(cache.get(committee_key("other-committee")))
+
+    def test_renaming_group_evicts_committee_keys(self):
+        """Test that renaming a committee's group evicts its cached data."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.group.name = "Renamed Committee"
+            self.group.save()
+        self.assertIsNone(cache.get(committee_index_key()))
+        self.assertIsNone(cache.get(committee_key("test-committee")))
+
+    def test_saving_unrelated_group_keeps_keys(self):
+        """Test that groups without a committee do not evict anything."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.other_group.name = "Still Unrelated"
+            self.other_group.save()
+        self.assertIsNotNone(cache.get(committee_index_key()))
+        self.assertIsNotNone(cache.get(committee_key("test-committee")))
+
+    def test_deleting_committee_evicts_affected_keys(self):
+        """Test that deleting a committee evicts its cached data."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.committee.delete()
+        self.assertIsNone(cache.get(all_committees_key()))
+        self.assertIsNone(cache.get(committee_key("test-committee")))
+
+    def test_adding_member_evicts_committee_key(self):
+        """Test that a new member evicts the committee page listing members."""
+        member = User.objects.create_user(username="member", password="password")
+        with self.captureOnCommitCallbacks(execute=True):
+            member.groups.add(self.group)
+        self.assertIsNone(cache.get(committee_key("test-committee")))
+        self.assertIsNotNone(cache.get(committee_index_key()))
+
+    def test_removing_members_evicts_committee_key(self):
+        """Test that clearing a group's members evicts the committee page."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.group.user_set.clear()
+        self.assertIsNone(cache.get(committee_key("test-committee")))
+
+    def test_login_keeps_committee_key(self):
+        """Test that recording a login does not evict the contact's committee."""
+        user = self.committee.contact_person
+        with self.captureOnCommitCallbacks(execute=True):
+            user.first_name = "Renamed"
+            user.save()
+        self.assertIsNone(cache.get(committee_key("test-committee")))
+        cache.set(committee_key("test-committee"), "cached")
+        with self.captureOnCommitCallbacks(execute=True):
+            user.save(update_fields=["last_login"])
+        self.assertIsNotNone(cache.get(committee_key("test-committee")))
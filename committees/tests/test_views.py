@@ -1,4 +1,5 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.contrib.auth.models import User, Group
 from committees.models import Committee
@@ -93,6 +94,16 @@ class CommitteesDetailViewTest(TestCase):
         response = self.client.get(url)
         self.assertEqual(response.status_code, 404)
 
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    )
+    def test_unknown_slugs_leave_no_version_keys(self):
+        """Test that requests for unknown committees cache nothing under their slug."""
+        url = reverse("committees:detail", kwargs={"slug": "random-slug"})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(cache.has_key("ns:committee:random-slug"))
+
     def test_detail_view_template(self):
         """Test that the detail view uses the correct template."""
         response = self.client.get(self.url)
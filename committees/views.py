@@ -1,14 +1,26 @@
 """Views for the committees application."""
 
 import logging
+from django.utils.decorators import method_decorator
 from django.views.generic import ListView, DetailView
-from django.core.cache import cache
 
+from utils.archive import existing_committee
+from utils.cache import (
+    COMMITTEE_TIMEOUT,
+    COMMITTEES,
+    committee_index_key,
+    committee_key,
+    committee_namespace,
+    get_or_set,
+    versioned_condition,
+    versioned_etag,
+)
 from .models import Committee
 
 logger = logging.getLogger(__name__)
 
 
+@method_decorator(versioned_condition(lambda request: [COMMITTEES]), name="dispatch")
 class IndexView(ListView):
     """Display a list of committees."""
 
@@ -18,26 +30,36 @@ class IndexView(ListView):
     def get_queryset(self):
         """Return all committees ordered by group name descending."""
         logger.debug("Fetching committee list ordered by group")
-        return cache.get_or_set(
-            "committee_index_list",
-            lambda: list(Committee.objects.order_by("-group")),
-            60 * 60,
+        return get_or_set(
+            committee_index_key(),
+            lambda: list(Committee.objects.select_related("group").order_by("-group")),
+            COMMITTEE_TIMEOUT,
+            local=True,
         )
 
 
+@method_decorator(existing_committee, name="dispatch")
+@method_decorator(
+    versioned_condition(
+        etag_func=lambda request, slug: versioned_etag([committee_namespace(slug)])
+    ),
+    name="dispatch",
+)
 class DetailView(DetailView):
     """Display details for a single committee."""
 
-    model = Committee
+    queryset = Committee.objects.select_related("group", "contact_person")
     template_name = "committees/detail.html"
 
     def get_object(self, queryset=None):
         """Return the committee instance for the view."""
         slug = self.kwargs.get("slug")
-        cache_key = f"committee_{slug}"
-        committee = cache.get(cache_key)
-        if committee is None:
-            committee = super().get_object(queryset)
-            cache.set(cache_key, committee, 60 * 60)
+        get_object = super().get_object
+        committee = get_or_set(
+            committee_key(slug),
+            lambda: get_object(queryset),
+            COMMITTEE_TIMEOUT,
+            local=True,
+        )
         logger.debug("Retrieved committee detail for %s", committee)
         return committee
@@ -76,6 +76,7 @@ INSTALLED_APPS = [
     "news.apps.NewsConfig",
     "activities.apps.ActivitiesConfig",
     "committees.apps.CommitteesConfig",
+    "utils.apps.UtilsConfig",
     "django.contrib.admin",
     "django.contrib.auth",
     "django.contrib.contenttypes",
@@ -131,6 +132,71 @@ DATABASES = {
     }
 }
 
+# Connections are kept open between requests for DB_CONN_MAX_AGE seconds and
+# checked before being reused, sparing each request the connection setup (TCP,
+# TLS and authentication on PostgreSQL). With DB_POOL=True, PostgreSQL
+# connections are instead shared by the threads of each worker through a
+# psycopg pool, which cannot be combined with persistent connections.
+if DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql" and (
+    os.getenv("DB_POOL", "False") == "True"
+):
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": int(os.getenv("DB_POOL_MIN_SIZE", 2)),
+            "max_size": int(os.getenv("DB_POOL_MAX_SIZE", 10)),
+            # Seconds a request waits for a free connection before failing.
+            "timeout": float(os.getenv("DB_POOL_TIMEOUT", 10)),
+            # Seconds after which idle connections above min_size are closed.
+            "max_idle": float(os.getenv("DB_POOL_MAX_IDLE", 600)),
+            # Seconds after which connections are replaced.
+            "max_lifetime": float(os.getenv("DB_POOL_MAX_LIFETIME", 3600)),
+        }
+    }
+else:
+    DATABASES["default"]["CONN_MAX_AGE"] = int(os.getenv("DB_CONN_MAX_AGE", 60))
+    DATABASES["default"]["CONN_HEALTH_CHECKS"] = (
+        os.getenv("DB_CONN_HEALTH_CHECKS", "True") == "True"
+    )
+
+# PRAGMAs applied to every SQLite connection (see utils/signals.py). The WAL
+# journal lets readers carry on while a write is in progress, NORMAL
+# synchronisation is safe with it, and writers wait up to busy_timeout
+# milliseconds for each other instead of failing with "database is locked".
+SQLITE_PRAGMAS = {
+    # First, as switching the journal mode may have to wait for other workers.
+    "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT", 5000)),
+    "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+    "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", 128 * 1024 * 1024)),
+    # Negative sizes are in KiB.
+    "cache_size": int(os.getenv("SQLITE_CACHE_SIZE", -20_000)),
+}
+if DATABASES["default"]["ENGINE"] == "django.db.backends.sqlite3":
+    # Transactions take the write lock when they start, so that busy_timeout
+    # applies, rather than failing when a read upgrades to a write.
+    DATABASES["default"]["OPTIONS"] = {
+        "transaction_mode": os.getenv("SQLITE_TRANSACTION_MODE", "IMMEDIATE"),
+    }
+
+# Read replicas of the PostgreSQL primary, as a comma-separated list of hosts
+# sharing its database, user and password. The public pages read from them,
+# see utils/db_router.py.
+for number, host in enumerate(
+    filter(None, os.getenv("POSTGRES_REPLICA_HOSTS", "").split(",")), start=1
+):
+    DATABASES[f"replica_{number}"] = {
+        **DATABASES["default"],
+        "OPTIONS": dict(DATABASES["default"].get("OPTIONS", {})),
+        "HOST": host.strip(),
+        "PORT": os.getenv("POSTGRES_REPLICA_PORT", DATABASES["default"]["PORT"]),
+        "TEST": {"MIRROR": "default"},
+    }
+if len(DATABASES) > 1:
+    DATABASE_ROUTERS = ["utils.db_router.ReplicaRouter"]
+    MIDDLEWARE.insert(1, "utils.db_router.ReplicaRouterMiddleware")
+# Seconds reads stay on the primary after a write, while replicas catch up.
+REPLICA_PIN_SECONDS = int(os.getenv("REPLICA_PIN_SECONDS", 5))
+
 
 # Caching
 # Disable caching in development to ensure controllers always receive
@@ -143,17 +209,50 @@ if DEBUG:
             "BACKEND": "django.core.cache.backends.dummy.DummyCache",
         }
     }
+    LOCAL_CACHE = {"TIMEOUT": 0}
 else:
     CACHES = {
         "default": {
-            "BACKEND": "django_redis.cache.RedisCache",
+            # django-redis, falling back to a local cache during Redis outages
+            # (see utils/cache_backends.py).
+            "BACKEND": "utils.cache_backends.CircuitBreakerRedisCache",
             "LOCATION": os.getenv("REDIS_URL", "redis://127.0.0.1:6379/1"),
             "OPTIONS": {
                 "CLIENT_CLASS": "django_redis.client.DefaultClient",
                 "IGNORE_EXCEPTIONS": True,
+                # Fail fast when Redis does not answer.
+                "SOCKET_CONNECT_TIMEOUT": float(os.getenv("REDIS_SOCKET_TIMEOUT", 0.5)),
+                "SOCKET_TIMEOUT": float(os.getenv("REDIS_SOCKET_TIMEOUT", 0.5)),
+                # Ping idle connections, such as the one listening for local
+                # cache invalidations (see utils/local_cache.py), so that
+                # dropped ones are noticed.
+                "CONNECTION_POOL_KWARGS": {"health_check_interval": 30},
+                "CIRCUIT_BREAKER": {
+                    "FAILURE_THRESHOLD": int(os.getenv("REDIS_FAILURE_THRESHOLD", 5)),
+                    "COOLDOWN": int(os.getenv("REDIS_COOLDOWN", 30)),
+                    "FALLBACK_MAX_ENTRIES": 1000,
+                    "FALLBACK_TIMEOUT": 300,
+                    # Shared cache metric counters (see utils/metrics.py).
+                    "SHARED_PREFIXES": ["metrics:"],
+                },
             },
         }
     }
+    # In-process tier in front of Redis for small, very hot values such as
+    # namespace versions and committee lists (see utils/local_cache.py).
+    LOCAL_CACHE = {
+        "MAX_ENTRIES": int(os.getenv("LOCAL_CACHE_MAX_ENTRIES", 512)),
+        "TIMEOUT": int(os.getenv("LOCAL_CACHE_TIMEOUT", 30)),
+    }
+
+# Errors hidden by IGNORE_EXCEPTIONS are logged to the "django_redis.cache"
+# logger, which counts them in the cache metrics (see utils/metrics.py).
+DJANGO_REDIS_LOG_IGNORED_EXCEPTIONS = True
+# Bearer token allowing scrapers to read /metrics/ (staff members always can).
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+# Admin changelists of more rows than this are counted from the planner's
+# estimates on PostgreSQL (see utils/paginator.py).
+ESTIMATED_COUNT_THRESHOLD = int(os.getenv("ESTIMATED_COUNT_THRESHOLD", 10_000))
 
 
 # Password validation
@@ -201,6 +300,8 @@ STATIC_URL = "static/"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+TEST_RUNNER = "config.test_runner.CacheClearingRunner"
+
 # Logging configuration
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
@@ -228,6 +329,17 @@ LOGGING = {
             "formatter": "verbose",
             "encoding": "utf-8",
         },
+        "cache_metrics": {
+            "class": "utils.metrics.IgnoredExceptionHandler",
+        },
+    },
+    "loggers": {
+        # One traceback per failed cache operation would flood the logs while
+        # Redis is down: count them instead.
+        "django_redis.cache": {
+            "handlers": ["cache_metrics"],
+            "propagate": False,
+        },
     },
     "root": {
         "handlers": ["console", "file"],
@@ -0,0 +1,67 @@
+"""Test runner starting every test with empty caches."""
+
+import unittest
+
+from django.conf import settings
+from django.core.cache import caches
+from django.test import override_settings
+from django.test.runner import DiscoverRunner
+
+from utils.local_cache import local_cache
+
+# Backends keeping their values in the test process, which may be cleared.
+LOCAL_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+def local_caches():
+    """Return ``CACHES`` with shared backends, such as Redis, made local.
+
+    Tests must neither read the entries of a running site nor empty its cache.
+    """
+    return {
+        alias: (
+            config
+            if config["BACKEND"] in LOCAL_BACKENDS
+            else {"BACKEND": LOCAL_BACKENDS[0], "LOCATION": f"test-{alias}"}
+        )
+        for alias, config in settings.CACHES.items()
+    }
+
+
+class CacheClearingResultMixin:
+    """Empty the caches before each test, so tests never see stale values.
+
+    Versions are bumped on commit, which ``TestCase`` never reaches.
+    """
+
+    def startTest(self, test):
+        for cache in caches.all():
+            cache.clear()
+        local_cache.clear()
+        super().startTest(test)
+
+
+class CacheClearingRunner(DiscoverRunner):
+    """``DiscoverRunner`` using local caches, emptied before each test."""
+
+    _test_caches = None
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._test_caches = override_settings(CACHES=local_caches())
+        self._test_caches.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self._test_caches.disable()
+        super().teardown_test_environment(**kwargs)
+
+    def get_resultclass(self):
+        resultclass = super().get_resultclass() or unittest.TextTestResult
+        return type(
+            f"CacheClearing{resultclass.__name__}",
+            (CacheClearingResultMixin, resultclass),
+            {},
+        )
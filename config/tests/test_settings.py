@@ -1,5 +1,6 @@
 from django.test import TestCase
 from django.conf import settings
+from config import settings as project_settings
 from pathlib import Path
 import os
 
@@ -59,8 +60,11 @@ class SettingsTest(TestCase):
 
     def test_cache_configuration(self):
         """Test that Redis caching is configured with a sensible default."""
-        cache_config = settings.CACHES["default"]
-        self.assertEqual(cache_config["BACKEND"], "django_redis.cache.RedisCache")
+        # The test runner swaps the caches of settings for local ones.
+        cache_config = project_settings.CACHES["default"]
+        self.assertEqual(
+            cache_config["BACKEND"], "utils.cache_backends.CircuitBreakerRedisCache"
+        )
         self.assertEqual(
             cache_config["LOCATION"],
             os.getenv("REDIS_URL", "redis://127.0.0.1:6379/1"),
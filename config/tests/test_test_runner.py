@@ -0,0 +1,40 @@
+from django.test import SimpleTestCase, override_settings
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+
+from config.test_runner import local_caches
+
+
+class TestRunnerTest(SimpleTestCase):
+    """Tests for the caches the test runner uses."""
+
+    def test_tests_use_local_cache(self):
+        """Test that tests never use the cache of the configured Redis server."""
+        self.assertEqual(
+            settings.CACHES["default"]["BACKEND"],
+            "django.core.cache.backends.locmem.LocMemCache",
+        )
+        self.assertIsInstance(caches["default"], LocMemCache)
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "utils.cache_backends.CircuitBreakerRedisCache",
+                "LOCATION": "redis://127.0.0.1:6379/1",
+            },
+            "local": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+        }
+    )
+    def test_local_caches_replace_shared_backends(self):
+        """Test that only shared backends are replaced by local ones."""
+        self.assertEqual(
+            local_caches(),
+            {
+                "default": {
+                    "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                    "LOCATION": "test-default",
+                },
+                "local": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+            },
+        )
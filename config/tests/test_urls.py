@@ -13,6 +13,7 @@ from committees.views import (
     IndexView as CommitteesIndexView,
     DetailView as CommitteesDetailView,
 )
+from utils.views import SearchView, TypeaheadView
 from django.contrib.admin.sites import AdminSite
 
 
@@ -57,6 +58,16 @@ class URLConfigTest(TestCase):
         self.assertEqual(url, "/committees/")
         self.assertEqual(resolve(url).func.view_class, CommitteesIndexView)
 
+    def test_search_url_resolves(self):
+        """Test that the search URL resolves to the search view."""
+        url = reverse("search")
+        self.assertEqual(resolve(url).func.view_class, SearchView)
+
+    def test_typeahead_url_resolves(self):
+        """Test that the typeahead URL resolves to the typeahead view."""
+        url = reverse("typeahead")
+        self.assertEqual(resolve(url).func.view_class, TypeaheadView)
+
     def test_admin_url_resolves(self):
         """Test that the admin URL resolves correctly."""
         url = reverse("admin:index")
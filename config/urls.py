@@ -20,13 +20,17 @@ from django.urls import include, path
 from django.conf import settings
 from django.conf.urls.static import static
 from news.views import HomePageView
+from utils.views import SearchView, TypeaheadView, cache_metrics
 
 urlpatterns = [
     path("", HomePageView.as_view(), name="home"),
+    path("search/", SearchView.as_view(), name="search"),
+    path("search/suggest/", TypeaheadView.as_view(), name="typeahead"),
     path("news/", include("news.urls")),
     path("activities/", include("activities.urls")),
     path("committees/", include("committees.urls")),
     path("admin/", admin.site.urls),
+    path("metrics/", cache_metrics, name="metrics"),
 ]
 
 if settings.DEBUG:
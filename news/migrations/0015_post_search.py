@@ -0,0 +1,53 @@
+from django.db import migrations
+
+# Frozen copy of the search index of utils.search as of this migration.
+FIELDS = ("title", "content")
+INDEX_NAME = "news_post_search_idx"
+SQLITE_CREATE = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS \"news_post_fts\" USING fts5(\"title\", \"content\", content='news_post', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    'CREATE TRIGGER IF NOT EXISTS "news_post_fts_insert" AFTER INSERT ON "news_post" BEGIN INSERT INTO "news_post_fts"(rowid, "title", "content") VALUES (new."id", new."title", new."content"); END',
+    'CREATE TRIGGER IF NOT EXISTS "news_post_fts_delete" AFTER DELETE ON "news_post" BEGIN INSERT INTO "news_post_fts"("news_post_fts", rowid, "title", "content") VALUES (\'delete\', old."id", old."title", old."content"); END',
+    'CREATE TRIGGER IF NOT EXISTS "news_post_fts_update" AFTER UPDATE OF "title", "content" ON "news_post" BEGIN INSERT INTO "news_post_fts"("news_post_fts", rowid, "title", "content") VALUES (\'delete\', old."id", old."title", old."content"); INSERT INTO "news_post_fts"(rowid, "title", "content") VALUES (new."id", new."title", new."content"); END',
+    'INSERT INTO "news_post_fts"("news_post_fts") VALUES (\'rebuild\')',
+]
+SQLITE_DROP = [
+    'DROP TRIGGER IF EXISTS "news_post_fts_insert"',
+    'DROP TRIGGER IF EXISTS "news_post_fts_delete"',
+    'DROP TRIGGER IF EXISTS "news_post_fts_update"',
+    'DROP TABLE IF EXISTS "news_post_fts"',
+]
+
+
+def create_post_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        from django.contrib.postgres.indexes import GinIndex
+        from django.contrib.postgres.search import SearchVector
+
+        schema_editor.add_index(
+            apps.get_model("news", "Post"),
+            GinIndex(SearchVector(*FIELDS, config="dutch"), name=INDEX_NAME),
+        )
+    elif vendor == "sqlite":
+        for statement in SQLITE_CREATE:
+            schema_editor.execute(statement)
+
+
+def drop_post_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{INDEX_NAME}"')
+    elif vendor == "sqlite":
+        for statement in SQLITE_DROP:
+            schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("news", "0014_post_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_post_search_index, drop_post_search_index),
+    ]
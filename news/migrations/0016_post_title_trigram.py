@@ -0,0 +1,33 @@
+from django.db import migrations
+
+# Frozen copy of the trigram indexes of utils.search as of this migration.
+CREATE = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    'CREATE INDEX IF NOT EXISTS "news_post_title_trgm_idx" ON "news_post" USING gin (UPPER("title"::text) gin_trgm_ops)',
+]
+DROP = [
+    'DROP INDEX IF EXISTS "news_post_title_trgm_idx"',
+]
+
+
+def create_post_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        for statement in CREATE:
+            schema_editor.execute(statement)
+
+
+def drop_post_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        for statement in DROP:
+            schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("news", "0015_post_search"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_post_trigram_indexes, drop_post_trigram_indexes),
+    ]
@@ -1,12 +1,80 @@
 """Database models for the news application."""
 
+from collections import defaultdict
+
 from django.db import models
 from django.utils import timezone
 from django.urls import reverse
 from committees.models import Committee
 from django.utils.translation import gettext_lazy as _
 from utils.upload_paths import hashed_upload_path
-from utils.slug import generate_unique_slug
+from utils.rows import Row
+from utils.cache import invalidate_news
+from utils.search import search
+from utils.slug import bulk_create_with_unique_slugs, save_with_unique_slug
+
+# Fields matched by :meth:`PostQuerySet.search`.
+SEARCH_FIELDS = ("title", "content")
+
+
+class PostQuerySet(models.QuerySet):
+    """Custom queryset for :class:`Post`."""
+
+    def rows(self):
+        """Return the posts as :class:`~utils.rows.Row` objects for list pages.
+
+        Only the fields displayed in post lists are loaded.
+        """
+        return [
+            Row.for_model(
+                Post,
+                values["id"],
+                values["title"],
+                title=values["title"],
+                slug=values["slug"],
+                created_at=values["created_at"],
+                committee=Row.for_model(
+                    Committee,
+                    values["committee_id"],
+                    values["committee__group__name"],
+                    slug=values["committee__slug"],
+                ),
+            )
+            for values in self.values(
+                "id",
+                "title",
+                "slug",
+                "created_at",
+                "committee_id",
+                "committee__slug",
+                "committee__group__name",
+            )
+        ]
+
+    def search(self, query):
+        """Return the posts matching ``query``, best matches first.
+
+        See :func:`utils.search.search`.
+        """
+        return search(self, query, SEARCH_FIELDS)
+
+    def bulk_create_with_slugs(self, objs, batch_size=500):
+        """Insert ``objs`` in batches, generating the missing slugs from their titles.
+
+        Unlike :meth:`bulk_create`, this invalidates the cached news lists.
+        """
+        posts = bulk_create_with_unique_slugs(self, objs, "title", batch_size)
+        committee_slugs = dict(
+            Committee.objects.filter(
+                pk__in={post.committee_id for post in posts}
+            ).values_list("pk", "slug")
+        )
+        dates = defaultdict(list)
+        for post in posts:
+            dates[committee_slugs.get(post.committee_id)].append(post.created_at)
+        for committee_slug, created in dates.items():
+            invalidate_news(committee_slug, dates=created)
+        return posts
 
 
 class Post(models.Model):
@@ -18,6 +86,14 @@ class Post(models.Model):
         verbose_name = _("Post")
         verbose_name_plural = _("News")
         ordering = ["-created_at"]
+        indexes = [
+            # Latest posts and archive months of all committees.
+            models.Index(fields=["-created_at"], name="post_created_idx"),
+            # The same for a single committee.
+            models.Index(
+                fields=["committee", "-created_at"], name="post_committee_created_idx"
+            ),
+        ]
 
     title = models.CharField(_("title"), max_length=200)
     slug = models.SlugField(max_length=200, unique=True)
@@ -40,11 +116,14 @@ class Post(models.Model):
     created_at = models.DateTimeField(_("created at"), default=timezone.now)
     updated_at = models.DateTimeField(_("updated at"), auto_now=True)
 
+    objects = PostQuerySet.as_manager()
+
     def save(self, *args, **kwargs):
         """Generate a unique slug from the title on first save."""
-        if not self.slug:
-            self.slug = generate_unique_slug(self, self.title)
-        super().save(*args, **kwargs)
+        if self.slug:
+            super().save(*args, **kwargs)
+        else:
+            save_with_unique_slug(self, self.title, super().save, *args, **kwargs)
 
     def get_absolute_url(self):
         """Return the URL for the post detail page."""
@@ -0,0 +1,56 @@
+"""Signal handlers keeping the news caches in sync with the database."""
+
+from django.db import connections
+from django.db.models.signals import post_delete, post_migrate, post_save, pre_save
+from django.dispatch import receiver
+
+from committees.models import Committee
+from utils.cache import invalidate_news
+from utils.search import restore_search_index
+from .models import SEARCH_FIELDS, Post
+
+
+def _committee_slug(post):
+    """Return the slug of the post's committee, if it still exists."""
+    try:
+        return post.committee.slug
+    except Committee.DoesNotExist:
+        return None
+
+
+@receiver(pre_save, sender=Post)
+def remember_previous_values(sender, instance, **kwargs):
+    """Record the committee and creation date of a post before it is changed."""
+    instance._previous_committee_slug = None
+    instance._previous_created_at = None
+    if instance.pk and not instance._state.adding:
+        previous = (
+            sender.objects.filter(pk=instance.pk)
+            .values_list("committee__slug", "created_at")
+            .first()
+        )
+        if previous:
+            instance._previous_committee_slug, instance._previous_created_at = previous
+
+
+@receiver(post_save, sender=Post)
+def invalidate_post_caches(sender, instance, **kwargs):
+    """Evict the cached news lists containing the saved post."""
+    invalidate_news(
+        _committee_slug(instance),
+        getattr(instance, "_previous_committee_slug", None),
+        dates=[instance.created_at, getattr(instance, "_previous_created_at", None)],
+    )
+
+
+@receiver(post_delete, sender=Post)
+def invalidate_deleted_post_caches(sender, instance, **kwargs):
+    """Evict the cached news lists containing the deleted post."""
+    invalidate_news(_committee_slug(instance), dates=[instance.created_at])
+
+
+@receiver(post_migrate)
+def restore_post_search_index(sender, using, **kwargs):
+    """Recreate the search triggers dropped by migrations remaking the table."""
+    if sender.name == "news":
+        restore_search_index(connections[using], Post, SEARCH_FIELDS)
@@ -1,4 +1,6 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.contrib.auth.models import User, Group, Permission
 from committees.models import Committee
@@ -69,3 +71,52 @@ class NewsAdminTest(TestCase):
         response = self.client.post(reverse("admin:news_post_add"), data=invalid_data)
         self.assertEqual(response.status_code, 200)  # Form displayed with errors
         self.assertContains(response, "error")  # Error message displayed
+
+    def test_changelist_lists_only_own_committee_posts(self):
+        """Test that the changelist leaves out posts of other committees."""
+        other_committee = Committee.objects.create(
+            group=Group.objects.create(name="Other Committee"),
+            slug="other-committee",
+            description="Another committee",
+            email="other@example.com",
+        )
+        Post.objects.create(
+            title="Other Post", content="Other content", committee=other_committee
+        )
+        response = self.client.get(reverse("admin:news_post_changelist"))
+        self.assertContains(response, "Test Post")
+        self.assertNotContains(response, "Other Post")
+        self.assertEqual(response.context["cl"].result_count, 1)
+
+    def test_changelist_queries_do_not_grow_with_posts(self):
+        """Test that the committees of listed posts are loaded with the posts."""
+        url = reverse("admin:news_post_changelist")
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(url)
+        for number in range(5):
+            Post.objects.create(
+                title=f"Post {number}", content="Content", committee=self.committee
+            )
+        with self.assertNumQueries(len(queries)):
+            self.client.get(url)
+
+    def test_changelist_search_uses_full_text_index(self):
+        """Test that the admin search matches every word of the query."""
+        Post.objects.create(
+            title="Other Post", content="Unrelated", committee=self.committee
+        )
+        url = reverse("admin:news_post_changelist")
+        response = self.client.get(url, {"q": "test content"})
+        self.assertContains(response, "Test Post")
+        self.assertNotContains(response, "Other Post")
+        self.assertEqual(response.context["cl"].result_count, 1)
+
+    def test_changelist_search_finds_partial_words(self):
+        """Test that the admin search still matches the start of words."""
+        Post.objects.create(
+            title="Vergadering", content="Agenda", committee=self.committee
+        )
+        url = reverse("admin:news_post_changelist")
+        response = self.client.get(url, {"q": "vergad"})
+        self.assertContains(response, "Vergadering")
+        self.assertEqual(response.context["cl"].result_count, 1)
@@ -1,3 +1,4 @@
+from unittest import mock
 from django.test import TestCase
 from news.models import Post
 
@@ -250,3 +251,88 @@ class PostModelStringRepresentation(TestCase):
             committee=self.committee,
         )
         self.assertEqual(str(post), "Test Post Title")
+
+
+class PostBulkCreateWithSlugsTest(TestCase):
+    def setUp(self):
+        self.committee = Committee.objects.create(
+            group=Group.objects.create(name="Test Committee"),
+            slug="test-committee",
+            description="A test committee",
+            email="test@example.com",
+        )
+        Post.objects.create(
+            title="Weekly Update", content="Content", committee=self.committee
+        )
+
+    def test_slugs_are_allocated_for_the_whole_batch(self):
+        """Test that a batch gets unique slugs with a fixed number of queries."""
+        posts = [
+            Post(title="Weekly Update", content="Content", committee=self.committee)
+            for _ in range(20)
+        ]
+        posts.append(
+            Post(
+                title="Weekly Update",
+                slug="custom",
+                content="Content",
+                committee=self.committee,
+            )
+        )
+        # Savepoint, existing slugs, insert, release and committee slugs.
+        with self.assertNumQueries(5):
+            Post.objects.bulk_create_with_slugs(posts, batch_size=100)
+        self.assertEqual(posts[0].slug, "weekly-update-1")
+        self.assertEqual(posts[19].slug, "weekly-update-20")
+        self.assertEqual(posts[20].slug, "custom")
+        self.assertEqual(Post.objects.count(), 22)
+
+    def test_only_slugs_of_the_batch_are_fetched(self):
+        """Test that existing slugs are fetched per chunk of base slugs."""
+        Post.objects.create(
+            title="Unrelated", content="Content", committee=self.committee
+        )
+        posts = [
+            Post(title=title, content="Content", committee=self.committee)
+            for title in ["Weekly Update", "Street Party"]
+        ]
+        with mock.patch("utils.slug.SLUG_PREFIXES_PER_QUERY", 1):
+            # One query per base slug instead of one for the whole table.
+            with self.assertNumQueries(6):
+                Post.objects.bulk_create_with_slugs(posts)
+        self.assertEqual(
+            [post.slug for post in posts], ["weekly-update-1", "street-party"]
+        )
+
+    def test_titles_without_slug_use_model_name(self):
+        """Test that titles slugifying to nothing never fetch every slug."""
+        posts = [
+            Post(title=title, content="Content", committee=self.committee)
+            for title in ["!!!", "🎉"]
+        ]
+        with self.assertNumQueries(5):
+            Post.objects.bulk_create_with_slugs(posts)
+        self.assertEqual([post.slug for post in posts], ["post", "post-1"])
+
+    def test_slugs_are_unique_across_filtered_querysets(self):
+        """Test that slugs of posts outside the queryset are not reused."""
+        other = Committee.objects.create(
+            group=Group.objects.create(name="Other Committee"),
+            slug="other-committee",
+            description="Another committee",
+            email="other@example.com",
+        )
+        posts = Post.objects.filter(committee=other).bulk_create_with_slugs(
+            [Post(title="Weekly Update", content="Content", committee=other)]
+        )
+        self.assertEqual(posts[0].slug, "weekly-update-1")
+
+    def test_cached_lists_are_invalidated(self):
+        """Test that the news lists of the created posts are invalidated."""
+        with mock.patch("news.models.invalidate_news") as invalidate:
+            posts = Post.objects.bulk_create_with_slugs(
+                [Post(title="Imported", content="Content", committee=self.committee)]
+            )
+        invalidate.assert_called_once_with(
+            "test-committee", dates=[posts[0].created_at]
+        )
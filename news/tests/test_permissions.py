@@ -87,5 +87,5 @@ class NewsPermissionsTest(TestCase):
         edit_url = reverse("admin:news_post_change", args=[self.post.id])
         response = self.client.get(edit_url)
 
-        # The user should be denied access to edit another committee's post
-        self.assertEqual(response.status_code, 403)
+        # Posts of other committees are not part of the admin queryset
+        self.assertRedirects(response, reverse("admin:index"))
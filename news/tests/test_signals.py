@@ -0,0 +1,108 @@
+import datetime
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User, Group
+from django.core.cache import cache
+from committees.models import Committee
+from news.models import Post
+from utils.cache import latest_posts_key, news_archive_key, news_archive_month_keys
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class PostCacheInvalidationTest(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(
+            username="testuser", email="user@example.com", password="password"
+        )
+        self.committee1 = Committee.objects.create(
+            group=Group.objects.create(name="Committee 1"),
+            slug="committee-1",
+            description="Committee 1 description",
+            contact_person=user,
+            email="committee1@example.com",
+        )
+        self.committee2 = Committee.objects.create(
+            group=Group.objects.create(name="Committee 2"),
+            slug="committee-2",
+            description="Committee 2 description",
+            contact_person=user,
+            email="committee2@example.com",
+        )
+        self.post = Post.objects.create(
+            title="Test Post",
+            slug="test-post",
+            content="Test content",
+            committee=self.committee1,
+            created_at=datetime.datetime(2024, 5, 10, tzinfo=datetime.timezone.utc),
+        )
+        cache.clear()
+        cache.set_many(
+            {
+                latest_posts_key(): ["cached"],
+                news_archive_key(): {"cached": {}},
+                news_archive_key("committee-1"): {"cached": {}},
+                news_archive_key("committee-2"): {"cached": {}},
+            }
+        )
+
+    def test_saving_post_evicts_affected_keys(self):
+        """Test that saving a post evicts only the lists containing it."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post.title = "Updated title"
+            self.post.save()
+        self.assertIsNone(cache.get(latest_posts_key()))
+        self.assertIsNone(cache.get(news_archive_key()))
+        self.assertIsNone(cache.get(news_archive_key("committee-1")))
+        self.assertIsNotNone(cache.get(news_archive_key("committee-2")))
+
+    def test_moving_post_evicts_both_committees(self):
+        """Test that moving a post evicts the old and new committee archives."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post.committee = self.committee2
+            self.post.save()
+        self.assertIsNone(cache.get(news_archive_key("committee-1")))
+        self.assertIsNone(cache.get(news_archive_key("committee-2")))
+
+    def test_deleting_post_evicts_affected_keys(self):
+        """Test that deleting a post evicts the lists containing it."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post.delete()
+        self.assertIsNone(cache.get(latest_posts_key()))
+        self.assertIsNone(cache.get(news_archive_key("committee-1")))
+        self.assertIsNotNone(cache.get(news_archive_key("committee-2")))
+
+    def test_eviction_waits_for_commit(self):
+        """Test that keys are only evicted once the transaction commits."""
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            self.post.save()
+        self.assertIsNotNone(cache.get(latest_posts_key()))
+        for callback in callbacks:
+            callback()
+        self.assertIsNone(cache.get(latest_posts_key()))
+
+    def test_saving_post_evicts_only_its_month(self):
+        """Test that saving a post keeps the other months of the archive."""
+        may, april = news_archive_month_keys("committee-1", [[2024, 5], [2024, 4]])
+        cache.set_many({may: ["cached"], april: ["cached"]})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post.save()
+        may_after, april_after = news_archive_month_keys(
+            "committee-1", [[2024, 5], [2024, 4]]
+        )
+        self.assertNotEqual(may, may_after)
+        self.assertEqual(april, april_after)
+        self.assertIsNone(cache.get(may_after))
+        self.assertIsNotNone(cache.get(april_after))
+
+    def test_changing_creation_date_evicts_both_months(self):
+        """Test that moving a post to another month evicts both months."""
+        months = [[2024, 5], [2024, 4]]
+        keys = news_archive_month_keys(None, months)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post.created_at = datetime.datetime(
+                2024, 4, 1, tzinfo=datetime.timezone.utc
+            )
+            self.post.save()
+        for key, new_key in zip(keys, news_archive_month_keys(None, months)):
+            self.assertNotEqual(key, new_key)
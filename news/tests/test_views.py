@@ -1,9 +1,13 @@
-from django.test import TestCase, Client
+from django.test import TestCase, Client, override_settings
 from django.urls import reverse
+from django.core.cache import cache
 from django.contrib.auth.models import User, Group
 from committees.models import Committee
 from news.models import Post
+from utils.tests.helpers import loaded_columns
 import datetime
+import time
+from unittest import mock
 from django.utils import timezone
 
 
@@ -199,20 +203,35 @@ class NewsArchiveViewTest(TestCase):
         response = self.client.get(self.url)
         self.assertTemplateUsed(response, "news/archive.html")
 
+    def test_month_headings_follow_language(self):
+        """Test that month headings are in the language of the page."""
+        response = self.client.get(self.url, headers={"accept-language": "nl"})
+        self.assertContains(response, "<h4>februari</h4>", html=True)
+        response = self.client.get(self.url, headers={"accept-language": "en"})
+        self.assertContains(response, "<h4>February</h4>", html=True)
+
     def test_archive_view_context(self):
         """Test that the archive view provides the correct context."""
         response = self.client.get(self.url)
         self.assertIn("grouped_news", response.context)
         self.assertIn("all_committees", response.context)
 
-        # Check years in grouped_news
-        grouped_news = response.context["grouped_news"]
-        self.assertIn(2022, grouped_news)
-        self.assertIn(2023, grouped_news)
-
-        # Check months in 2023
-        self.assertIn("January", grouped_news[2023])
-        self.assertIn("February", grouped_news[2023])
+        # Only the latest month is shown
+        self.assertEqual(
+            response.context["grouped_news"],
+            {2023: {datetime.date(2023, 2, 1): [self.post2]}},
+        )
+        self.assertEqual(response.context["current_month"], datetime.date(2023, 2, 1))
+        self.assertEqual(
+            response.context["archive_months"],
+            [
+                (datetime.date(2023, 2, 1), 1),
+                (datetime.date(2023, 1, 1), 2),
+                (datetime.date(2022, 12, 1), 1),
+            ],
+        )
+        self.assertIsNone(response.context["newer_month"])
+        self.assertEqual(response.context["older_month"], datetime.date(2023, 1, 1))
 
         # Check committees in all_committees
         all_committees = response.context["all_committees"]
@@ -220,6 +239,25 @@ class NewsArchiveViewTest(TestCase):
         self.assertIn(self.committee1, all_committees)
         self.assertIn(self.committee2, all_committees)
 
+    def test_archive_month_view(self):
+        """Test that an archive month shows the posts of that month only."""
+        response = self.client.get(reverse("news:archive_month", args=[2023, 1]))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.context["grouped_news"],
+            {2023: {datetime.date(2023, 1, 1): [self.post4, self.post1]}},
+        )
+        self.assertEqual(response.context["newer_month"], datetime.date(2023, 2, 1))
+        self.assertEqual(response.context["older_month"], datetime.date(2022, 12, 1))
+        self.assertContains(response, reverse("news:archive_month", args=[2022, 12]))
+        # Months are listed with their number of posts
+        self.assertContains(response, "(2)</strong>")
+
+    def test_archive_month_without_posts(self):
+        """Test that months without posts are not found."""
+        response = self.client.get(reverse("news:archive_month", args=[2023, 3]))
+        self.assertEqual(response.status_code, 404)
+
     def test_archive_view_with_committee_filter(self):
         """Test that the archive view correctly filters posts by committee."""
         # Filter by committee1
@@ -230,20 +268,243 @@ class NewsArchiveViewTest(TestCase):
         self.assertIn("filtered_committee", response.context)
         self.assertEqual(response.context["filtered_committee"], self.committee1)
 
-        grouped_news = response.context["grouped_news"]
-
-        # Committee 1 had posts in 2023 (January and February)
-        self.assertIn(2023, grouped_news)
+        # Committee 1 had posts in 2023 (January and February), not in 2022
+        self.assertEqual(
+            response.context["archive_months"],
+            [(datetime.date(2023, 2, 1), 1), (datetime.date(2023, 1, 1), 1)],
+        )
+        self.assertEqual(
+            response.context["grouped_news"],
+            {2023: {datetime.date(2023, 2, 1): [self.post2]}},
+        )
+        self.assertContains(
+            response,
+            f"{reverse('news:archive_month', args=[2023, 1])}?committee={self.committee1.slug}",
+        )
 
         # Check January 2023 - should only have Committee 1's post
-        january_posts = grouped_news[2023]["January"]
-        self.assertEqual(len(january_posts), 1)
-        self.assertEqual(january_posts[0], self.post1)
+        response = self.client.get(
+            f"{reverse('news:archive_month', args=[2023, 1])}?committee={self.committee1.slug}"
+        )
+        self.assertEqual(
+            response.context["grouped_news"],
+            {2023: {datetime.date(2023, 1, 1): [self.post1]}},
+        )
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class NewsArchivePageCacheTest(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(
+            username="testuser", email="user@example.com", password="password"
+        )
+        self.committee = Committee.objects.create(
+            group=Group.objects.create(name="Test Committee"),
+            slug="test-committee",
+            description="A test committee",
+            contact_person=user,
+            email="test@example.com",
+        )
+        self.url = reverse("news:archive")
+        cache.clear()
+
+    def test_cached_page_is_served_until_content_changes(self):
+        """Test that the cached archive page is replaced once a post is added."""
+        self.client.get(self.url)
+        # Bypass the signal handlers: the cached page is served unchanged.
+        Post.objects.bulk_create(
+            [Post(title="Silent Post", slug="silent", committee=self.committee)]
+        )
+        self.assertNotContains(self.client.get(self.url), "Silent Post")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Post.objects.create(
+                title="Published Post", content="Content", committee=self.committee
+            )
+        response = self.client.get(self.url)
+        self.assertContains(response, "Published Post")
+        self.assertContains(response, "Silent Post")
+
+    def test_only_the_changed_month_is_recomputed(self):
+        """Test that publishing a post keeps the cached posts of other months."""
+        april = timezone.now() - datetime.timedelta(days=62)
+        april_url = reverse("news:archive_month", args=[april.year, april.month])
+        Post.objects.create(
+            title="April Post",
+            content="Content",
+            committee=self.committee,
+            created_at=april,
+        )
+        self.client.get(april_url)
+        # Bypass the signal handlers: the cached month is served unchanged.
+        Post.objects.bulk_create(
+            [
+                Post(
+                    title="Silent Post",
+                    slug="silent",
+                    committee=self.committee,
+                    created_at=april,
+                )
+            ]
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            Post.objects.create(
+                title="Published Post", content="Content", committee=self.committee
+            )
+        self.assertContains(self.client.get(self.url), "Published Post")
+        response = self.client.get(april_url)
+        self.assertContains(response, "April Post")
+        self.assertNotContains(response, "Silent Post")
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class NewsConditionalGetTest(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(
+            username="testuser", email="user@example.com", password="password"
+        )
+        self.committee = Committee.objects.create(
+            group=Group.objects.create(name="Test Committee"),
+            slug="test-committee",
+            description="A test committee",
+            contact_person=user,
+            email="test@example.com",
+        )
+        self.post = Post.objects.create(
+            title="Test Post", content="Content", committee=self.committee
+        )
+        cache.clear()
+
+    def test_unchanged_pages_are_not_modified(self):
+        """Test that pages are answered with 304 without querying the database."""
+        for url in [
+            reverse("news:index"),
+            reverse("news:archive"),
+            reverse("news:detail", args=[self.post.slug]),
+        ]:
+            response = self.client.get(url)
+            self.assertTrue(response.has_header("ETag"))
+            self.assertTrue(response.has_header("Last-Modified"))
+            with self.assertNumQueries(0):
+                response = self.client.get(
+                    url, headers={"if-none-match": response["ETag"]}
+                )
+            self.assertEqual(response.status_code, 304)
+
+    def test_etag_changes_with_content(self):
+        """Test that publishing a post changes the ETag of the index."""
+        url = reverse("news:index")
+        etag = self.client.get(url)["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            Post.objects.create(
+                title="Published Post", content="Content", committee=self.committee
+            )
+        response = self.client.get(url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_deletions_change_last_modified(self):
+        """Test that deleting the newest post is not hidden by If-Modified-Since."""
+        older = Post.objects.create(
+            title="Older Post", content="Content", committee=self.committee
+        )
+        Post.objects.filter(pk=older.pk).update(
+            updated_at=timezone.now() - datetime.timedelta(days=1)
+        )
+        url = reverse("news:index")
+        last_modified = self.client.get(url)["Last-Modified"]
+        response = self.client.get(url, headers={"if-modified-since": last_modified})
+        self.assertEqual(response.status_code, 304)
+        # Last-Modified only counts whole seconds.
+        with mock.patch("utils.cache.time.time", return_value=time.time() + 10):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.post.delete()
+        response = self.client.get(url, headers={"if-modified-since": last_modified})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, "Test Post")
+
+    def test_etag_depends_on_language(self):
+        """Test that each language gets its own ETag."""
+        url = reverse("news:index")
+        english = self.client.get(url, headers={"accept-language": "en"})["ETag"]
+        dutch = self.client.get(url, headers={"accept-language": "nl"})["ETag"]
+        self.assertNotEqual(english, dutch)
+
+
+class NewsArchiveCanonicalQueryTest(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(
+            username="testuser", email="user@example.com", password="password"
+        )
+        self.committee = Committee.objects.create(
+            group=Group.objects.create(name="Test Committee"),
+            slug="test-committee",
+            description="A test committee",
+            contact_person=user,
+            email="test@example.com",
+        )
+        self.url = reverse("news:archive")
 
-        # Check February 2023 - should only have Committee 1's post
-        february_posts = grouped_news[2023]["February"]
-        self.assertEqual(len(february_posts), 1)
-        self.assertEqual(february_posts[0], self.post2)
+    def test_canonical_query_is_served(self):
+        """Test that canonical archive URLs are rendered."""
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        response = self.client.get(self.url, {"committee": "test-committee"})
+        self.assertEqual(response.status_code, 200)
 
-        # 2022 should not be present for Committee 1
-        self.assertNotIn(2022, grouped_news)
+    def test_unknown_committee_redirects_to_archive(self):
+        """Test that unknown or empty committee filters are dropped."""
+        for committee in ["unknown", ""]:
+            response = self.client.get(self.url, {"committee": committee})
+            self.assertRedirects(response, self.url)
+
+    def test_unknown_parameters_are_dropped(self):
+        """Test that parameters other than the committee filter are dropped."""
+        response = self.client.get(
+            self.url, {"committee": "test-committee", "utm_source": "bot"}
+        )
+        self.assertRedirects(response, f"{self.url}?committee=test-committee")
+
+
+class NewsListColumnsTest(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(
+            username="testuser", email="user@example.com", password="password"
+        )
+        self.committee = Committee.objects.create(
+            group=Group.objects.create(name="Test Committee"),
+            slug="test-committee",
+            description="A test committee",
+            contact_person=user,
+            email="test@example.com",
+        )
+        Post.objects.create(
+            title="Test Post", content="Large content", committee=self.committee
+        )
+
+    def assert_list_columns(self, url):
+        """Assert that rendering ``url`` only loads the columns lists display."""
+        with loaded_columns() as columns:
+            self.assertEqual(self.client.get(url).status_code, 200)
+        self.assertTrue(columns["news_post"])
+        self.assertLessEqual(
+            columns["news_post"],
+            {"id", "title", "slug", "created_at", "updated_at", "committee_id"},
+        )
+        self.assertLessEqual(
+            columns["committees_committee"], {"id", "slug", "group_id"}
+        )
+
+    def test_index_loads_list_columns(self):
+        """Test that the index never loads the content or files of posts."""
+        self.assert_list_columns(reverse("news:index"))
+
+    def test_archive_loads_list_columns(self):
+        """Test that the archive never loads the content or files of posts."""
+        self.assert_list_columns(reverse("news:archive"))
+        self.assert_list_columns(
+            f"{reverse('news:archive')}?committee={self.committee.slug}"
+        )
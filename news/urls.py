@@ -8,5 +8,10 @@ app_name = "news"
 urlpatterns = [
     path("", views.IndexView.as_view(), name="index"),
     path("archive/", views.NewsArchiveView.as_view(), name="archive"),
+    path(
+        "archive/<int:year>/<int:month>/",
+        views.NewsArchiveView.as_view(),
+        name="archive_month",
+    ),
     path("<slug:slug>/", views.DetailView.as_view(), name="detail"),
 ]
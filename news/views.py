@@ -1,23 +1,79 @@
 """Views for the news application."""
 
 import logging
+from functools import partial
+
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
 from django.views.generic import ListView, DetailView, base, TemplateView
-from django.core.cache import cache
 
 from committees.models import Committee
+from utils.archive import (
+    archive_page,
+    cached_archive,
+    cached_archive_months,
+    canonical_archive_query,
+)
+from utils.cache import (
+    ARCHIVE_TIMEOUT,
+    COMMITTEE_TIMEOUT,
+    LIST_TIMEOUT,
+    COMMITTEES,
+    NEWS,
+    all_committees_key,
+    archive_page_namespaces,
+    get_or_set,
+    last_modified,
+    latest_posts_key,
+    news_archive_key,
+    news_archive_month_keys,
+    news_namespace,
+    versioned_cache_page,
+    versioned_condition,
+)
 from .models import Post
 
 logger = logging.getLogger(__name__)
 
 
+def latest_posts_last_modified(request):
+    """Return when the posts on the news index were last modified."""
+    return last_modified("latest_posts", Post.objects.all(), NEWS, COMMITTEES)
+
+
+def post_last_modified(request, slug):
+    """Return when the post ``slug`` was last modified."""
+    return last_modified(
+        f"post_{slug}", Post.objects.filter(slug=slug), NEWS, COMMITTEES
+    )
+
+
+def archive_last_modified(request, year=None, month=None):
+    """Return when the posts in the news archive were last modified.
+
+    Every month of the archive lists the other months, so it depends on all of
+    them.
+    """
+    committee_slug = request.GET.get("committee")
+    if committee_slug:
+        return last_modified(
+            f"news_archive_{committee_slug}",
+            Post.objects.filter(committee__slug=committee_slug),
+            news_namespace(committee_slug),
+            COMMITTEES,
+        )
+    return last_modified("news_archive_all", Post.objects.all(), NEWS, COMMITTEES)
+
+
 class HomePageView(TemplateView):
     """Render the site's home page."""
 
     template_name = "home.html"
 
 
+@method_decorator(
+    versioned_condition(lambda request: [NEWS, COMMITTEES], latest_posts_last_modified),
+    name="dispatch",
+)
 class IndexView(ListView):
     """Display a list of the latest news posts."""
 
@@ -27,13 +83,18 @@ class IndexView(ListView):
     def get_queryset(self):
         """Return the five most recent posts."""
         logger.debug("Fetching latest posts for index view")
-        return cache.get_or_set(
-            "latest_posts",
-            lambda: list(Post.objects.select_related("committee").all()[:5]),
-            60 * 15,
+        return get_or_set(
+            latest_posts_key(),
+            lambda: Post.objects.all()[:5].rows(),
+            LIST_TIMEOUT,
+            compact=True,
         )
 
 
+@method_decorator(
+    versioned_condition(lambda request: [NEWS, COMMITTEES], post_last_modified),
+    name="dispatch",
+)
 class DetailView(DetailView):
     """Display details for a single news post."""
 
@@ -41,7 +102,15 @@ class DetailView(DetailView):
     template_name = "news/detail.html"
 
 
-@method_decorator(cache_page(60 * 15), name="dispatch")
+@method_decorator(canonical_archive_query, name="dispatch")
+@method_decorator(
+    versioned_condition(archive_page_namespaces(NEWS), archive_last_modified),
+    name="dispatch",
+)
+@method_decorator(
+    versioned_cache_page(ARCHIVE_TIMEOUT, archive_page_namespaces(NEWS)),
+    name="dispatch",
+)
 class NewsArchiveView(base.TemplateView):
     """Render an archive of news posts grouped by date."""
 
@@ -51,7 +120,7 @@ class NewsArchiveView(base.TemplateView):
     def get_queryset(self):
         """Return posts optionally filtered by committee slug."""
         # Filter posts by committee if a query parameter is provided
-        queryset = Post.objects.select_related("committee").all()
+        queryset = Post.objects.all()
         committee_slug = self.request.GET.get("committee")
         if committee_slug:
             logger.info("Filtering posts for committee %s", committee_slug)
@@ -64,32 +133,36 @@ class NewsArchiveView(base.TemplateView):
         """Build the context with grouped news and committees."""
         context = super().get_context_data(**kwargs)
         committee_slug = self.request.GET.get("committee")
-        cache_key = f"news_archive_{committee_slug or 'all'}"
-        grouped_news = cache.get(cache_key)
-        if grouped_news is None:
-            queryset = self.get_queryset()
-
-            grouped_news = {}
-            for post in queryset:
-                year = post.created_at.year
-                month = post.created_at.strftime("%B")
-                grouped_news.setdefault(year, {}).setdefault(month, []).append(post)
-            cache.set(cache_key, grouped_news, 60 * 15)
+        queryset = self.get_queryset()
+        months = cached_archive_months(
+            queryset, "created_at", news_archive_key(committee_slug)
+        )
+        page = archive_page(months, self.kwargs.get("year"), self.kwargs.get("month"))
+        current = page["current_month"]
+        grouped_news = cached_archive(
+            queryset,
+            "created_at",
+            [[current.year, current.month]] if current else [],
+            partial(news_archive_month_keys, committee_slug),
+        )
+        context.update(page)
 
         context["grouped_news"] = grouped_news
-        context["all_committees"] = cache.get_or_set(
-            "all_committees",
-            lambda: list(Committee.objects.all()),
-            60 * 60,
+        context["all_committees"] = get_or_set(
+            all_committees_key(),
+            lambda: list(Committee.objects.for_filter()),
+            COMMITTEE_TIMEOUT,
+            local=True,
+        )
+        # The filter only needs the fields loaded for the list of committees.
+        context["filtered_committee"] = next(
+            (
+                committee
+                for committee in context["all_committees"]
+                if committee.slug == committee_slug
+            ),
+            None,
         )
-        if committee_slug:
-            context["filtered_committee"] = cache.get_or_set(
-                f"committee_{committee_slug}",
-                lambda: Committee.objects.filter(slug=committee_slug).first(),
-                60 * 60,
-            )
-        else:
-            context["filtered_committee"] = None
         logger.debug(
             "Prepared context with %d posts",
             sum(
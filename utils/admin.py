@@ -0,0 +1,85 @@
+"""Admin helpers shared by the applications."""
+
+from django.db.models import Q
+
+from committees.models import Committee
+
+
+def committee_ids(request):
+    """Return the IDs of the committees of the requesting user.
+
+    They are fetched in a single query and kept on the request, as the admin
+    checks the permissions of the user many times while rendering a page.
+    """
+    if not hasattr(request, "_committee_ids"):
+        request._committee_ids = frozenset(
+            Committee.objects.filter(group__user=request.user).values_list(
+                "pk", flat=True
+            )
+        )
+    return request._committee_ids
+
+
+class CommitteePermissionMixin:
+    """Restrict a model admin to the objects of the user's committees.
+
+    The model must have a ``committee`` foreign key. Other committees' objects
+    are left out of the admin queries, and permission checks compare the ID of
+    the committee with the user's committees instead of loading it.
+    """
+
+    list_select_related = ("committee__group",)
+
+    def get_queryset(self, request):
+        """Return only the objects of the user's committees, unless a superuser."""
+        queryset = super().get_queryset(request).select_related("committee__group")
+        if request.user.is_superuser:
+            return queryset
+        return queryset.filter(committee_id__in=committee_ids(request))
+
+    def has_committee_permission(self, request, obj=None):
+        """Return whether ``obj`` belongs to one of the user's committees."""
+        if obj is None or request.user.is_superuser:
+            return True
+        return obj.committee_id in committee_ids(request)
+
+    def has_change_permission(self, request, obj=None):
+        """Restrict edits to objects belonging to the user's committees."""
+        return super().has_change_permission(
+            request, obj
+        ) and self.has_committee_permission(request, obj)
+
+    def has_delete_permission(self, request, obj=None):
+        """Restrict deletions to objects belonging to the user's committees."""
+        return super().has_delete_permission(
+            request, obj
+        ) and self.has_committee_permission(request, obj)
+
+    def has_view_permission(self, request, obj=None):
+        """Restrict viewing to objects belonging to the user's committees."""
+        return super().has_view_permission(
+            request, obj
+        ) and self.has_committee_permission(request, obj)
+
+
+class FullTextSearchMixin:
+    """Search a model admin through the ``search`` method of its queryset.
+
+    Words are matched through the full-text index of the model, which also
+    finds their inflections, and through the ``icontains`` lookups of
+    ``search_fields``, which find partial words such as "vergad" in
+    "vergadering".
+    """
+
+    def get_search_results(self, request, queryset, search_term):
+        """Return the objects matching ``search_term`` and whether to deduplicate."""
+        if not search_term.strip():
+            return queryset, False
+        partial, may_have_duplicates = super().get_search_results(
+            request, queryset, search_term
+        )
+        matches = queryset.search(search_term).values("pk")
+        return (
+            queryset.filter(Q(pk__in=matches) | Q(pk__in=partial.values("pk"))),
+            may_have_duplicates,
+        )
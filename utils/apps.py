@@ -0,0 +1,16 @@
+"""Configuration for the shared utilities."""
+
+from django.apps import AppConfig
+from django.utils.translation import gettext_lazy as _
+
+
+class UtilsConfig(AppConfig):
+    """Application configuration hosting the cache management commands."""
+
+    name = "utils"
+    verbose_name = _("Utilities")
+
+    def ready(self):
+        """Connect the database connection signal handlers."""
+        # pylint: disable-next=import-outside-toplevel,unused-import
+        from . import signals  # noqa: F401
@@ -0,0 +1,189 @@
+"""Archive pages grouping content by the month it was created in."""
+
+import datetime
+from functools import wraps
+from typing import NamedTuple
+from urllib.parse import urlencode
+
+from django.db.models import Count
+from django.db.models.functions import TruncMonth
+from django.http import Http404
+from django.shortcuts import redirect
+
+from committees.models import Committee
+from .cache import (
+    ARCHIVE_STALE_TIMEOUT,
+    ARCHIVE_TIMEOUT,
+    COMMITTEE_TIMEOUT,
+    committee_slugs_key,
+    get_many_or_set,
+    get_or_set,
+)
+
+
+def committee_slugs():
+    """Return the set of the slugs of all committees."""
+    return get_or_set(
+        committee_slugs_key(),
+        lambda: frozenset(Committee.objects.values_list("slug", flat=True)),
+        COMMITTEE_TIMEOUT,
+        local=True,
+    )
+
+
+def canonical_archive_query(view_func):
+    """Redirect archive requests to their canonical query string.
+
+    Only the ``committee`` parameter is kept, and only when it names an
+    existing committee, so the number of cached variants of an archive page is
+    bounded by the number of committees.
+    """
+
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        committee_slug = request.GET.get("committee")
+        query = ""
+        if committee_slug and committee_slug in committee_slugs():
+            query = urlencode({"committee": committee_slug})
+        if request.META.get("QUERY_STRING", "") != query:
+            # Not permanent: an unknown slug may become a committee later.
+            return redirect(f"{request.path}?{query}" if query else request.path)
+        return view_func(request, *args, **kwargs)
+
+    return wrapper
+
+
+def existing_committee(view_func):
+    """Return a 404 before any cache lookup for slugs naming no committee.
+
+    Cache keys and validators of committee pages are versioned by the slug,
+    so unknown slugs would otherwise each leave a version key in the cache.
+    """
+
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        if kwargs.get("slug") not in committee_slugs():
+            raise Http404("No committee found matching the query")
+        return view_func(request, *args, **kwargs)
+
+    return wrapper
+
+
+def archive_months(queryset, field):
+    """Return the ``[year, month, count]`` of the months of ``field`` in ``queryset``.
+
+    Months are truncated in UTC and counted by the database, newest first.
+    """
+    return [
+        [row["month"].year, row["month"].month, row["count"]]
+        for row in queryset.order_by()
+        .annotate(month=TruncMonth(field, tzinfo=datetime.timezone.utc))
+        .values("month")
+        .annotate(count=Count("pk"))
+        .order_by("-month")
+    ]
+
+
+def _month_start(year, month):
+    """Return the first moment of a month, in UTC."""
+    return datetime.datetime(year, month, 1, tzinfo=datetime.timezone.utc)
+
+
+def rows_by_month(queryset, field, months):
+    """Return the rows of ``queryset`` created in each of ``months``."""
+    grouped = {tuple(month): [] for month in months}
+    first_year, first_month = min(grouped)
+    last_year, last_month = max(grouped)
+    end = _month_start(last_year + last_month // 12, last_month % 12 + 1)
+    queryset = queryset.filter(
+        **{
+            f"{field}__gte": _month_start(first_year, first_month),
+            f"{field}__lt": end,
+        }
+    )
+    for row in queryset.rows():
+        value = getattr(row, field).astimezone(datetime.timezone.utc)
+        rows = grouped.get((value.year, value.month))
+        if rows is not None:
+            rows.append(row)
+    return grouped
+
+
+def cached_archive_months(queryset, field, index_key):
+    """Return the :func:`archive_months` of ``queryset``, cached under ``index_key``."""
+    return get_or_set(
+        index_key,
+        lambda: archive_months(queryset, field),
+        ARCHIVE_TIMEOUT,
+        stale_while_revalidate=ARCHIVE_STALE_TIMEOUT,
+        compact=True,
+    )
+
+
+def cached_archive(queryset, field, months, month_keys):
+    """Return the rows of ``queryset`` created in ``months``, by year and month.
+
+    Months are the :class:`datetime.date` of their first day, for templates
+    to format in the active language.
+
+    The rows of each month are cached under its own key, returned by
+    ``month_keys(months)``, so that a change only recomputes the month it
+    belongs to. All months are fetched in a single round trip.
+    """
+    if not months:
+        return {}
+    month_of = dict(zip(month_keys(months), months))
+
+    def compute(keys):
+        rows = rows_by_month(queryset, field, [month_of[key] for key in keys])
+        return {key: rows[tuple(month_of[key])] for key in keys}
+
+    chunks = get_many_or_set(
+        list(month_of),
+        compute,
+        ARCHIVE_TIMEOUT,
+        stale_while_revalidate=ARCHIVE_STALE_TIMEOUT,
+        compact=True,
+    )
+    grouped = {}
+    for key, (year, month) in month_of.items():
+        if chunks.get(key):
+            grouped.setdefault(year, {})[datetime.date(year, month, 1)] = chunks[key]
+    return grouped
+
+
+class ArchiveMonth(NamedTuple):
+    """A month of an archive and the number of items created during it."""
+
+    date: datetime.date
+    count: int
+
+
+def archive_page(months, year=None, month=None):
+    """Return the month shown by an archive page and the months around it.
+
+    An archive page shows a single month, the latest one having content
+    unless ``year`` and ``month`` are given, so that it renders a bounded
+    number of rows however old the site gets. ``months`` are the
+    :func:`archive_months` of the archive.
+
+    Raises :class:`~django.http.Http404` for a month without content.
+    """
+    archive = [
+        ArchiveMonth(datetime.date(year, month, 1), count)
+        for year, month, count in months
+    ]
+    dates = [archive_month.date for archive_month in archive]
+    pairs = [(date.year, date.month) for date in dates]
+    if year is None:
+        index = 0
+    elif (year, month) in pairs:
+        index = pairs.index((year, month))
+    else:
+        raise Http404("No content was archived in this month.")
+    return {
+        "current_month": dates[index] if dates else None,
+        "archive_months": archive,
+        "newer_month": dates[index - 1] if index > 0 else None,
+        "older_month": dates[index + 1] if index + 1 < len(dates) else None,
+    }
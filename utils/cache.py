@@ -0,0 +1,819 @@
+"""Cache keys, timeouts and invalidation helpers shared by the public views.
+
+Every key embeds the current version of the namespaces its value depends on,
+e.g. ``news_archive_sports:1718000000000.1718000000042``. Invalidating a
+namespace increments its version, which makes all dependent keys unreachable
+with a single ``INCR`` and no key scanning; the orphaned entries simply expire.
+
+Namespaces:
+
+``news`` / ``activities``
+    Bumped whenever any post or activity changes.
+``news:<slug>`` / ``activities:<slug>``
+    Bumped whenever content of the committee ``<slug>`` changes.
+``committees``
+    Bumped whenever any committee (or its group) changes.
+``committee:<slug>``
+    Bumped whenever the committee ``<slug>`` itself changes.
+``<namespace>/<year>-<month>``
+    Bumped whenever content of ``<namespace>`` created in that month changes.
+
+Values are read and written through :func:`get_or_set`, which protects the
+database against cache stampedes when hot keys expire or are invalidated.
+"""
+
+import datetime
+import logging
+import math
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from functools import wraps
+
+from django.core.cache import cache
+from django.db import close_old_connections, transaction
+from django.db.models import Max
+from django.middleware.cache import CacheMiddleware
+from django.utils import timezone, translation
+from django.views.decorators.http import condition
+
+from .db_router import pin_replicas
+from .local_cache import invalidate as invalidate_local
+from .local_cache import is_coherent, local_cache
+from .metrics import key_family, track
+from .rows import pack, unpack
+
+logger = logging.getLogger(__name__)
+
+# Entries are invalidated by the signal handlers of each app as soon as the
+# underlying data changes, so these timeouts only bound how long an entry may
+# live when nothing is published.
+LIST_TIMEOUT = 60 * 60 * 6
+ARCHIVE_TIMEOUT = 60 * 60 * 6
+COMMITTEE_TIMEOUT = 60 * 60 * 24
+# Namespace versions outlive the entries depending on them. As they start
+# from the clock, an expired version only makes its entries unreachable.
+VERSION_TIMEOUT = 60 * 60 * 24 * 30
+# Archive entries are served for up to an hour past their timeout while a
+# background thread recomputes them.
+ARCHIVE_STALE_TIMEOUT = 60 * 60
+
+# Stampede protection: only the worker holding the lease of a key recomputes
+# it, for at most ``LEASE_TIMEOUT`` seconds. Other workers serve the previous
+# value, kept for ``STALE_TIMEOUT`` seconds past its expiry, or wait up to
+# ``LEASE_WAIT`` seconds for the new one when there is none.
+LEASE_TIMEOUT = 10
+LEASE_WAIT = 2
+STALE_TIMEOUT = 60 * 10
+# Larger values recompute hot entries earlier before they expire.
+EARLY_RECOMPUTE_BETA = 1.0
+# Threads recomputing stale-while-revalidate entries in each worker.
+REFRESH_THREADS = 2
+
+# Set when a stale value was served while building the current response.
+_served_stale = ContextVar("served_stale", default=False)
+
+NEWS = "news"
+ACTIVITIES = "activities"
+COMMITTEES = "committees"
+
+
+def news_namespace(committee_slug):
+    """Return the namespace of the posts of ``committee_slug``."""
+    return f"{NEWS}:{committee_slug}"
+
+
+def activities_namespace(committee_slug):
+    """Return the namespace of the activities of ``committee_slug``."""
+    return f"{ACTIVITIES}:{committee_slug}"
+
+
+def committee_namespace(committee_slug):
+    """Return the namespace of the committee ``committee_slug`` itself."""
+    return f"committee:{committee_slug}"
+
+
+def month_namespace(namespace, year, month):
+    """Return the namespace of the content of ``namespace`` created in a month."""
+    return f"{namespace}/{year}-{month:02d}"
+
+
+def _version_key(namespace):
+    """Return the cache key holding the version of ``namespace``."""
+    return f"ns:{namespace}"
+
+
+def _bumped_at_key(namespace):
+    """Return the cache key holding when ``namespace`` was last bumped."""
+    return f"{_version_key(namespace)}:ts"
+
+
+def namespace_versions(*namespaces):
+    """Return the current versions of ``namespaces``.
+
+    Versions are served from the in-process tier when possible and otherwise
+    fetched in a single round trip. Missing versions are initialised from the
+    clock rather than from ``1`` so that a counter evicted by Redis never
+    points back at stale entries.
+    """
+    keys = [_version_key(namespace) for namespace in namespaces]
+    coherent = is_coherent()
+    generation = local_cache.generation
+    versions = {}
+    if coherent:
+        for key in keys:
+            version = local_cache.get(key)
+            if version is not None:
+                versions[key] = version
+    missing = [key for key in keys if key not in versions]
+    if missing:
+        stored = cache.get_many(missing)
+        for key in missing:
+            version = stored.get(key)
+            if version is None:
+                initial = time.time_ns() // 1_000_000
+                if cache.add(key, initial, VERSION_TIMEOUT):
+                    version = initial
+                else:
+                    version = cache.get(key)
+            if version is None:
+                # The cache is unavailable: use a throwaway generation.
+                version = initial
+            elif coherent:
+                local_cache.set(key, version, generation)
+            versions[key] = version
+    return [versions[key] for key in keys]
+
+
+def versioned_key(base, *namespaces):
+    """Return ``base`` suffixed with the current versions of ``namespaces``."""
+    return versioned_keys([(base, namespaces)])[0]
+
+
+def versioned_keys(bases):
+    """Return the versioned key of each ``(base, namespaces)`` pair of ``bases``.
+
+    The versions of all namespaces are fetched in a single round trip.
+    """
+    namespaces = list(dict.fromkeys(ns for _, names in bases for ns in names))
+    versions = dict(zip(namespaces, namespace_versions(*namespaces)))
+    return [
+        f"{base}:{'.'.join(str(versions[namespace]) for namespace in names)}"
+        for base, names in bases
+    ]
+
+
+def _bump_namespaces(namespaces):
+    """Increment the versions of ``namespaces`` in every worker."""
+    namespaces = list(dict.fromkeys(namespaces))
+    keys = [_version_key(namespace) for namespace in namespaces]
+    # Stored before the versions change, so that the validators computed for
+    # the new versions see it (see last_modified()).
+    now = time.time()
+    cache.set_many(
+        {_bumped_at_key(namespace): now for namespace in namespaces}, VERSION_TIMEOUT
+    )
+    for key in keys:
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Not initialised yet: the next read starts a fresh generation.
+            pass
+    invalidate_local(*keys)
+    # Replicas may not have the change yet, see utils/db_router.py.
+    pin_replicas()
+
+
+def bump_namespaces(*namespaces):
+    """Invalidate ``namespaces`` once the current transaction has committed.
+
+    Bumping earlier would allow a concurrent request to cache the old rows
+    under the new version before the change becomes visible to it.
+    """
+    namespaces = list(namespaces)
+    transaction.on_commit(lambda: _bump_namespaces(namespaces))
+
+
+def _base_key(key):
+    """Return ``key`` without its version suffix."""
+    return key.rsplit(":", 1)[0]
+
+
+def _stale_key(key):
+    """Return the key keeping the last value computed for any version of ``key``."""
+    return f"{_base_key(key)}:stale"
+
+
+def _lease_key(key):
+    """Return the key of the lease held while ``key`` is recomputed."""
+    return f"{_base_key(key)}:lease"
+
+
+def _compute(key, default, timeout, stale_while_revalidate=0, keep_stale=True):
+    """Compute ``default()`` and cache it under ``key``."""
+    started = time.monotonic()
+    value = default()
+    duration = time.monotonic() - started
+    if value is None:
+        # Like a miss in Django's cache API, ``None`` is never cached.
+        return value
+    if callable(timeout):
+        timeout = timeout(value)
+    _store({key: value}, duration, timeout, stale_while_revalidate, keep_stale)
+    return value
+
+
+def _compute_many(keys, default, timeout, stale_while_revalidate=0):
+    """Compute ``default(keys)`` and cache each of its values."""
+    started = time.monotonic()
+    values = default(keys)
+    duration = (time.monotonic() - started) / len(keys)
+    _store(
+        {key: value for key, value in values.items() if value is not None},
+        duration,
+        timeout,
+        stale_while_revalidate,
+    )
+    return values
+
+
+def _store(values, duration, timeout, stale_while_revalidate, keep_stale=True):
+    """Cache ``values`` along with their expiry and computation time."""
+    # Entries expire after ``timeout`` seconds but are kept for another
+    # ``stale_while_revalidate`` seconds. The computation time drives how early
+    # they are recomputed.
+    expiry = time.time() + timeout
+    entries = {key: (value, expiry, duration) for key, value in values.items()}
+    timeout += stale_while_revalidate
+    cache.set_many(entries, timeout)
+    if keep_stale:
+        cache.set_many(
+            {_stale_key(key): entry for key, entry in entries.items()},
+            timeout + STALE_TIMEOUT,
+        )
+
+
+def _compute_with_lease(
+    key, default, timeout, stale_while_revalidate=0, keep_stale=True
+):
+    """Compute ``default()`` while holding the lease of ``key``."""
+    try:
+        return _compute(key, default, timeout, stale_while_revalidate, keep_stale)
+    finally:
+        cache.delete(_lease_key(key))
+
+
+_executor = None
+_executor_pid = None
+
+
+def _refresh_executor():
+    """Return this worker's pool of background refresh threads."""
+    global _executor, _executor_pid  # pylint: disable=global-statement
+    # Threads do not survive a fork, so each worker creates its own pool.
+    if _executor_pid != os.getpid():
+        _executor = ThreadPoolExecutor(REFRESH_THREADS, "cache-refresh")
+        _executor_pid = os.getpid()
+    return _executor
+
+
+def _refresh(key, default, timeout, stale_while_revalidate, keep_stale):
+    """Recompute ``key`` in a background thread."""
+    close_old_connections()
+    try:
+        _compute_with_lease(key, default, timeout, stale_while_revalidate, keep_stale)
+    except Exception:  # pylint: disable=broad-exception-caught
+        logger.exception("Background refresh of %s failed", key)
+    finally:
+        close_old_connections()
+
+
+def _refresh_in_background(
+    key, default, timeout, stale_while_revalidate, keep_stale=True
+):
+    """Schedule the recomputation of ``key``, whose lease is already held."""
+    _refresh_executor().submit(
+        _refresh, key, default, timeout, stale_while_revalidate, keep_stale
+    )
+
+
+def _should_recompute_early(expiry, duration):
+    """Return whether an entry should be recomputed before it expires.
+
+    Implements probabilistic early expiration ("XFetch"): the closer an entry
+    is to its expiry and the longer it took to compute, the more likely a
+    request is to refresh it, spreading recomputations over time.
+    """
+    jitter = -math.log(1.0 - random.random())
+    return time.time() + duration * EARLY_RECOMPUTE_BETA * jitter >= expiry
+
+
+def _wait_for(key):
+    """Wait while another worker computes ``key`` and return its entry."""
+    lease_key = _lease_key(key)
+    deadline = time.monotonic() + LEASE_WAIT
+    while time.monotonic() < deadline:
+        found = cache.get_many([key, lease_key])
+        if key in found:
+            return found[key]
+        if lease_key not in found:
+            # The lease was released without a value or the cache is down.
+            return None
+        time.sleep(0.05)
+    return None
+
+
+def _use_entry(key, entry, default, timeout, stale_while_revalidate, keep_stale=True):
+    """Return the value of the cached ``entry`` and whether it is up to date."""
+    value, expiry, duration = entry
+    fresh = time.time() < expiry
+    if not _should_recompute_early(expiry, duration):
+        return value, fresh
+    if not cache.add(_lease_key(key), True, LEASE_TIMEOUT):
+        return value, fresh
+    if stale_while_revalidate:
+        _refresh_in_background(
+            key, default, timeout, stale_while_revalidate, keep_stale
+        )
+        return value, fresh
+    return _compute_with_lease(key, default, timeout, keep_stale=keep_stale), True
+
+
+def _fetch(key, default, timeout, stale_while_revalidate, keep_stale=True):
+    """Return the value of ``key`` and whether it is up to date."""
+    entry = cache.get(key)
+    if entry is not None:
+        return _use_entry(
+            key, entry, default, timeout, stale_while_revalidate, keep_stale
+        )
+
+    # Invalidated or evicted: recompute right away so that changes are
+    # published immediately, at least for the lease holder.
+    if cache.add(_lease_key(key), True, LEASE_TIMEOUT):
+        value = _compute_with_lease(
+            key, default, timeout, stale_while_revalidate, keep_stale
+        )
+        return value, True
+    stale = cache.get(_stale_key(key)) if keep_stale else None
+    if stale is not None:
+        return stale[0], False
+    entry = _wait_for(key)
+    if entry is not None:
+        return entry[0], True
+    return _compute(key, default, timeout, stale_while_revalidate, keep_stale), True
+
+
+def _compact(default, timeout):
+    """Wrap ``default`` and ``timeout`` to cache packed values instead."""
+
+    def compute():
+        value = default()
+        return None if value is None else pack(value)
+
+    if callable(timeout):
+        return compute, lambda payload: timeout(unpack(payload))
+    return compute, timeout
+
+
+def _compact_many(default):
+    """Wrap ``default`` of :func:`get_many_or_set` to cache packed values."""
+
+    def compute(keys):
+        return {
+            key: None if value is None else pack(value)
+            for key, value in default(keys).items()
+        }
+
+    return compute
+
+
+def get_or_set(
+    key,
+    default,
+    timeout,
+    local=False,
+    stale_while_revalidate=0,
+    compact=False,
+    keep_stale=True,
+):
+    """Return the value cached under ``key``, computing it with ``default()``.
+
+    Unlike :meth:`~django.core.cache.cache.get_or_set`, only one worker at a
+    time computes a missing or expiring value while the others keep serving
+    the previous one. ``timeout`` may be a callable receiving the computed
+    value and returning the number of seconds to cache it for.
+
+    With ``local=True`` the value is also kept in the in-process tier of
+    :mod:`utils.local_cache`. Only use it for small values read by most
+    requests, and never modify the returned value.
+
+    With ``stale_while_revalidate`` seconds, an expired value is still served
+    during that time while a background thread recomputes it, so that no
+    request waits for an expensive ``default()`` when an entry merely times
+    out. ``default`` then runs in another thread, outside of the request's
+    transaction.
+
+    With ``compact=True`` the value, made of :class:`~utils.rows.Row` objects
+    and msgpack types, is cached in the compact format of :mod:`utils.rows`.
+
+    With ``keep_stale=False`` no copy of the value is kept for the next
+    versions of ``key``, which are then computed or waited for instead of
+    served stale. Use it for many small keys cheap to compute.
+    """
+    with track(key_family(key)) as done:
+        if local and is_coherent():
+            value = local_cache.get(key)
+            if value is not None:
+                done(hits=1)
+                return value
+        computed = []
+
+        def compute():
+            computed.append(True)
+            return default()
+
+        if compact:
+            compute, timeout = _compact(compute, timeout)
+        value, fresh = _fetch(key, compute, timeout, stale_while_revalidate, keep_stale)
+        if compact and value is not None:
+            value = unpack(value)
+        if not fresh:
+            _served_stale.set(True)
+        elif local and value is not None and is_coherent():
+            local_cache.set(key, value)
+        if computed:
+            done(misses=1)
+        else:
+            done(hits=1)
+    return value
+
+
+def get_many_or_set(keys, default, timeout, stale_while_revalidate=0, compact=False):
+    """Return a dict of the values cached under ``keys``.
+
+    All keys are read in a single round trip. Missing values are computed
+    together by ``default(missing_keys)``, which returns a dict mapping each of
+    these keys to its value. Stampede protection, ``stale_while_revalidate``
+    and ``compact`` work as in :func:`get_or_set`, but ``timeout`` must be a
+    number of seconds.
+    """
+    if not keys:
+        return {}
+    with track(key_family(keys[0])) as done:
+        values, missing = _get_many_or_set(
+            keys, default, timeout, stale_while_revalidate, compact
+        )
+        done(hits=len(keys) - len(missing), misses=len(missing))
+    return values
+
+
+def _get_many_or_set(keys, default, timeout, stale_while_revalidate, compact):
+    """Return the values of :func:`get_many_or_set` and the keys computed."""
+    if compact:
+        default = _compact_many(default)
+    found = cache.get_many(keys)
+    values = {}
+    missing = []
+    leased = []
+    for key in keys:
+        if key in found:
+            value, fresh = _use_entry(
+                key,
+                found[key],
+                lambda key=key: default([key])[key],
+                timeout,
+                stale_while_revalidate,
+            )
+        elif cache.add(_lease_key(key), True, LEASE_TIMEOUT):
+            leased.append(key)
+            missing.append(key)
+            continue
+        else:
+            entry, fresh = cache.get(_stale_key(key)), False
+            if entry is None:
+                entry, fresh = _wait_for(key), True
+            if entry is None:
+                missing.append(key)
+                continue
+            value = entry[0]
+        values[key] = value
+        if not fresh:
+            _served_stale.set(True)
+    if missing:
+        try:
+            values.update(
+                _compute_many(missing, default, timeout, stale_while_revalidate)
+            )
+        finally:
+            cache.delete_many([_lease_key(key) for key in leased])
+    if compact:
+        values = {
+            key: None if value is None else unpack(value)
+            for key, value in values.items()
+        }
+    return values, missing
+
+
+def latest_posts_key():
+    """Return the cache key of the latest posts on the news index."""
+    # The index shows each post's committee name.
+    return versioned_key("latest_posts", NEWS, COMMITTEES)
+
+
+def upcoming_activities_key():
+    """Return the cache key of the upcoming activities on the index."""
+    return versioned_key("upcoming_activities", ACTIVITIES)
+
+
+def news_archive_key(committee_slug=None):
+    """Return the cache key of the months in the news archive of ``committee_slug``."""
+    if not committee_slug:
+        return versioned_key("news_archive_all_months", NEWS)
+    return versioned_key(
+        f"news_archive_{committee_slug}_months",
+        news_namespace(committee_slug),
+        committee_namespace(committee_slug),
+    )
+
+
+def activities_archive_key(committee_slug=None):
+    """Return the cache key of the months in the activities archive."""
+    if not committee_slug:
+        return versioned_key("activities_archive_all_months", ACTIVITIES)
+    return versioned_key(
+        f"activities_archive_{committee_slug}_months",
+        activities_namespace(committee_slug),
+        committee_namespace(committee_slug),
+    )
+
+
+def _archive_month_keys(content_namespace, committee_slug, months):
+    """Return the cache keys of the archived content of each month of ``months``.
+
+    Unlike the list of months, each month only depends on the content created
+    during that month, so a change only evicts the month it belongs to.
+    """
+    if committee_slug:
+        base = f"{content_namespace}_archive_{committee_slug}"
+        namespace = f"{content_namespace}:{committee_slug}"
+        dependencies = [committee_namespace(committee_slug)]
+    else:
+        base = f"{content_namespace}_archive_all"
+        namespace = content_namespace
+        dependencies = []
+    return versioned_keys(
+        [
+            (
+                f"{base}_{year}_{month:02d}",
+                [month_namespace(namespace, year, month), *dependencies],
+            )
+            for year, month in months
+        ]
+    )
+
+
+def news_archive_month_keys(committee_slug, months):
+    """Return the cache keys of the posts of ``months`` in the news archive."""
+    return _archive_month_keys(NEWS, committee_slug, months)
+
+
+def activities_archive_month_keys(committee_slug, months):
+    """Return the cache keys of the activities of ``months`` in the archive."""
+    return _archive_month_keys(ACTIVITIES, committee_slug, months)
+
+
+def all_committees_key():
+    """Return the cache key of the committees in the archive filters."""
+    return versioned_key("all_committees", COMMITTEES)
+
+
+def committee_index_key():
+    """Return the cache key of the committee index list."""
+    return versioned_key("committee_index_list", COMMITTEES)
+
+
+def committee_slugs_key():
+    """Return the cache key of the set of committee slugs."""
+    return versioned_key("committee_slugs", COMMITTEES)
+
+
+def committee_key(committee_slug):
+    """Return the cache key of a single committee."""
+    return versioned_key(
+        f"committee_{committee_slug}", committee_namespace(committee_slug)
+    )
+
+
+def archive_page_namespaces(content_namespace):
+    """Return a callable listing the namespaces of a rendered archive page.
+
+    ``content_namespace`` is :data:`NEWS` or :data:`ACTIVITIES`. The page
+    depends on the archived content and on the names in the committee filter.
+    """
+
+    def get_namespaces(request):
+        committee_slug = request.GET.get("committee")
+        if committee_slug:
+            return [f"{content_namespace}:{committee_slug}", COMMITTEES]
+        return [content_namespace, COMMITTEES]
+
+    return get_namespaces
+
+
+def _call_tracking_stale(view_func, request, *args, **kwargs):
+    """Call ``view_func`` and return its response and whether it served stale values."""
+    token = _served_stale.set(False)
+    try:
+        response = view_func(request, *args, **kwargs)
+        stale = _served_stale.get()
+    finally:
+        _served_stale.reset(token)
+    if stale:
+        # Let the enclosing views know as well.
+        _served_stale.set(True)
+    return response, stale
+
+
+def versioned_cache_page(timeout, get_namespaces):
+    """Cache a view like ``cache_page`` under versioned keys.
+
+    ``get_namespaces`` receives the request and returns the namespaces the
+    rendered page depends on. Bumping any of them makes every cached copy of
+    the page unreachable, whatever its URL or ``Vary`` headers.
+    """
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            rendered = []
+
+            def get_response(request):
+                rendered.append(True)
+                response, stale = _call_tracking_stale(
+                    view_func, request, *args, **kwargs
+                )
+                if stale:
+                    # Never keep a page built from stale values.
+                    request._cache_update_cache = False
+                return response
+
+            middleware = CacheMiddleware(
+                get_response,
+                page_timeout=timeout,
+                key_prefix=versioned_key("page", *get_namespaces(request)),
+            )
+            with track("cache_page") as done:
+                response = middleware(request)
+                if rendered:
+                    done(misses=1)
+                else:
+                    done(hits=1)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def versioned_etag(namespaces, *extra):
+    """Return an ETag for a page depending on ``namespaces`` and ``extra`` values.
+
+    The page is rendered in the active language, which is part of the ETag.
+    """
+    parts = [*namespace_versions(*namespaces), *extra, translation.get_language()]
+    return "-".join(str(part) for part in parts)
+
+
+def _bumped_at(namespaces):
+    """Return when one of ``namespaces`` was last bumped, as an aware datetime.
+
+    Namespaces whose bump time is unknown count as bumped now, so that no
+    change can be hidden by an evicted timestamp.
+    """
+    keys = [_bumped_at_key(namespace) for namespace in namespaces]
+    stored = cache.get_many(keys)
+    timestamp = max(
+        (stored[key] if key in stored else time.time() for key in keys), default=0
+    )
+    return datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc)
+
+
+def last_modified(base, queryset, *namespaces):
+    """Return when the content of ``queryset`` and ``namespaces`` last changed.
+
+    That is the latest ``updated_at`` of ``queryset``, or the last time one of
+    ``namespaces`` was bumped if later, as deletions and changes to related
+    objects such as committee names leave ``updated_at`` as it is. The value
+    is cached under ``base`` until one of ``namespaces`` changes.
+    """
+
+    def compute():
+        updated_at = queryset.aggregate(last_modified=Max("updated_at"))[
+            "last_modified"
+        ]
+        bumped_at = _bumped_at(namespaces)
+        return max(updated_at, bumped_at) if updated_at else bumped_at
+
+    return get_or_set(
+        versioned_key(f"last_modified_{base}", *namespaces), compute, LIST_TIMEOUT
+    )
+
+
+def versioned_condition(get_namespaces=None, last_modified_func=None, etag_func=None):
+    """Answer conditional GETs of a view from cached validators.
+
+    Like :func:`~django.views.decorators.http.condition`, but the ETag is
+    built by :func:`versioned_etag` from the namespaces returned by
+    ``get_namespaces(request)``, unless an ``etag_func`` is given. Unchanged
+    pages are answered with a 304 response without rendering them or querying
+    the database. Validators are left out of pages built from stale values.
+    """
+    if etag_func is None:
+
+        def etag_func(request, *args, **kwargs):
+            return versioned_etag(get_namespaces(request))
+
+    conditional = condition(etag_func=etag_func, last_modified_func=last_modified_func)
+
+    def decorator(view_func):
+        view_func = conditional(view_func)
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            response, stale = _call_tracking_stale(view_func, request, *args, **kwargs)
+            if stale:
+                # A later request must not revalidate these stale values.
+                del response["ETag"]
+                del response["Last-Modified"]
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def upcoming_timeout(activities):
+    """Return how long a list of upcoming ``activities`` stays accurate.
+
+    The list is only valid until its first activity starts, after which that
+    activity should no longer be shown as upcoming.
+    """
+    if not activities:
+        return LIST_TIMEOUT
+    remaining = (activities[0].start - timezone.now()).total_seconds()
+    return max(1, min(LIST_TIMEOUT, int(remaining)))
+
+
+def archive_month(value):
+    """Return the ``(year, month)`` under which ``value`` is archived."""
+    value = value.astimezone(datetime.timezone.utc)
+    return value.year, value.month
+
+
+def _with_months(namespaces, dates):
+    """Return ``namespaces`` and their month namespaces for each of ``dates``."""
+    months = dict.fromkeys(archive_month(date) for date in dates if date)
+    return [
+        *namespaces,
+        *(
+            month_namespace(namespace, year, month)
+            for namespace in namespaces
+            for year, month in months
+        ),
+    ]
+
+
+def invalidate_news(*committee_slugs, dates=()):
+    """Invalidate the cached news affected by a change in ``committee_slugs``.
+
+    ``dates`` are the creation dates of the changed posts.
+    """
+    namespaces = [NEWS, *(news_namespace(slug) for slug in committee_slugs if slug)]
+    bump_namespaces(*_with_months(namespaces, dates))
+
+
+def invalidate_activities(*committee_slugs, dates=()):
+    """Invalidate the cached activities affected by ``committee_slugs``.
+
+    ``dates`` are the creation dates of the changed activities.
+    """
+    namespaces = [
+        ACTIVITIES,
+        *(activities_namespace(slug) for slug in committee_slugs if slug),
+    ]
+    bump_namespaces(*_with_months(namespaces, dates))
+
+
+def invalidate_committee_members(*committee_slugs):
+    """Invalidate the cached pages listing the members of ``committee_slugs``."""
+    bump_namespaces(*(committee_namespace(slug) for slug in committee_slugs if slug))
+
+
+def invalidate_committees(*committee_slugs):
+    """Invalidate the cached committees and everything displaying their names."""
+    bump_namespaces(
+        COMMITTEES,
+        *(committee_namespace(slug) for slug in committee_slugs if slug),
+    )
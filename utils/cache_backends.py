@@ -0,0 +1,300 @@
+"""Redis cache backend degrading to a local cache while Redis is unavailable.
+
+With ``IGNORE_EXCEPTIONS`` alone, every cache operation during a Redis outage
+waits for a connection timeout and then misses, so every request recomputes
+everything from the database. This backend counts consecutive connection
+failures and, once ``FAILURE_THRESHOLD`` is reached, stops contacting Redis
+for ``COOLDOWN`` seconds. Meanwhile operations are served by a bounded
+in-process cache whose entries live at most ``FALLBACK_TIMEOUT`` seconds.
+
+After the cooldown a single operation probes Redis again. When it succeeds,
+the keys incremented or deleted locally during the outage, such as namespace
+versions, are deleted from Redis too so that it does not serve data those
+changes invalidated. Keys starting with one of the ``SHARED_PREFIXES``, such as
+counters adding up the values of all workers, are never added or incremented
+locally: a local copy would lose what it counted, and deleting the key from
+Redis afterwards would reset the totals of every worker.
+"""
+
+import logging
+import threading
+import time
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.locmem import LocMemCache
+from django_redis.cache import RedisCache
+from django_redis.exceptions import ConnectionInterrupted
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """Thread-safe failure counter deciding whether Redis may be contacted."""
+
+    def __init__(self, failure_threshold, cooldown, max_dirty_keys):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_dirty_keys = max_dirty_keys
+        self.failures = 0
+        self.opened_at = None
+        self.dirty_keys = set()
+        self.lost_dirty_keys = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        """Return whether Redis is currently being skipped."""
+        return self.opened_at is not None
+
+    def allow(self):
+        """Return whether the next operation may contact Redis."""
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self.opened_at < self.cooldown:
+                return False
+            # Let this operation probe Redis while the others keep skipping it.
+            self.opened_at = now
+            return True
+
+    def record_success(self):
+        """Close the circuit and return the keys changed while it was open.
+
+        Returns ``None`` if the circuit was already closed.
+        """
+        with self._lock:
+            self.failures = 0
+            if self.opened_at is None:
+                return None
+            self.opened_at = None
+            dirty_keys, self.dirty_keys = self.dirty_keys, set()
+            if self.lost_dirty_keys:
+                logger.warning(
+                    "More than %d keys changed during the Redis outage; "
+                    "some cached values may be outdated",
+                    self.max_dirty_keys,
+                )
+                self.lost_dirty_keys = False
+        logger.warning("Redis is available again, closing the circuit")
+        return dirty_keys
+
+    def record_failure(self):
+        """Count a failure, opening the circuit once the threshold is reached."""
+        with self._lock:
+            self.failures += 1
+            if self.failures < self.failure_threshold:
+                return
+            if self.opened_at is None:
+                logger.error(
+                    "Redis failed %d times in a row, skipping it for %d seconds",
+                    self.failures,
+                    self.cooldown,
+                )
+            self.opened_at = time.monotonic()
+
+    def mark_dirty(self, keys):
+        """Remember ``keys`` changed locally while the circuit is open."""
+        with self._lock:
+            for key in keys:
+                if len(self.dirty_keys) >= self.max_dirty_keys:
+                    self.lost_dirty_keys = True
+                    return
+                self.dirty_keys.add(key)
+
+
+# Threads get their own backend instances, but share the state of the circuit
+# and the local cache of each Redis server.
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def _breaker(server, options):
+    """Return the circuit breaker of ``server``."""
+    with _breakers_lock:
+        if server not in _breakers:
+            _breakers[server] = CircuitBreaker(
+                options.get("FAILURE_THRESHOLD", 5),
+                options.get("COOLDOWN", 30),
+                options.get("FALLBACK_MAX_ENTRIES", 1000),
+            )
+        return _breakers[server]
+
+
+class CircuitBreakerRedisCache(RedisCache):
+    """django-redis backend falling back to a local cache during outages.
+
+    Configured through ``OPTIONS["CIRCUIT_BREAKER"]``, which accepts
+    ``FAILURE_THRESHOLD``, ``COOLDOWN``, ``FALLBACK_MAX_ENTRIES``,
+    ``FALLBACK_TIMEOUT`` and ``SHARED_PREFIXES``. Operations of the Django cache API never raise
+    connection errors, whatever ``IGNORE_EXCEPTIONS`` says.
+    """
+
+    def __init__(self, server, params):
+        params = {**params, "OPTIONS": dict(params.get("OPTIONS", {}))}
+        options = params["OPTIONS"].pop("CIRCUIT_BREAKER", {})
+        super().__init__(server, params)
+        self._breaker = _breaker(server, options)
+        self._fallback_timeout = options.get("FALLBACK_TIMEOUT", 300)
+        self._shared_prefixes = tuple(options.get("SHARED_PREFIXES", ()))
+        self._fallback = LocMemCache(
+            f"circuit-breaker:{server}",
+            {
+                "TIMEOUT": self._fallback_timeout,
+                "OPTIONS": {"MAX_ENTRIES": options.get("FALLBACK_MAX_ENTRIES", 1000)},
+            },
+        )
+
+    def _run(self, method, fallback, *args, **kwargs):
+        """Call ``method`` of the Redis client, or ``fallback()`` without Redis."""
+        if self._breaker.allow():
+            try:
+                result = getattr(self.client, method)(*args, **kwargs)
+            except ConnectionInterrupted:
+                if self._log_ignored_exceptions:
+                    self.logger.exception("Exception ignored")
+                self._breaker.record_failure()
+            else:
+                dirty_keys = self._breaker.record_success()
+                if dirty_keys is not None:
+                    self._recover(dirty_keys)
+                return result
+        return fallback()
+
+    def _recover(self, dirty_keys):
+        """Drop the entries made outdated during the outage."""
+        self._fallback.clear()
+        if dirty_keys:
+            try:
+                self.client.delete_many(list(dirty_keys))
+            except ConnectionInterrupted:
+                logger.warning("Could not delete %d outdated keys", len(dirty_keys))
+
+    def _is_shared(self, key):
+        """Return whether ``key`` must only be changed in Redis."""
+        return key.startswith(self._shared_prefixes)
+
+    def _local_timeout(self, timeout):
+        """Return ``timeout`` bounded by the lifetime of local entries."""
+        if timeout is DEFAULT_TIMEOUT or timeout is None:
+            return self._fallback_timeout
+        return min(timeout, self._fallback_timeout)
+
+    @property
+    def is_available(self):
+        """Return whether Redis is currently being used."""
+        return not self._breaker.is_open
+
+    def get(self, key, default=None, version=None, client=None):
+        return self._run(
+            "get",
+            lambda: self._fallback.get(key, default, version),
+            key,
+            default=default,
+            version=version,
+            client=client,
+        )
+
+    def get_many(self, keys, version=None, client=None):
+        return self._run(
+            "get_many",
+            lambda: self._fallback.get_many(keys, version),
+            keys,
+            version=version,
+            client=client,
+        )
+
+    def has_key(self, key, version=None, client=None):
+        return self._run(
+            "has_key",
+            lambda: self._fallback.has_key(key, version),
+            key,
+            version=version,
+            client=client,
+        )
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None, **kwargs):
+        # Return None like Django's backends: ``cache_page`` registers ``set``
+        # as a post-render callback, whose return value replaces the response.
+        self._run(
+            "set",
+            lambda: self._fallback.set(
+                key, value, self._local_timeout(timeout), version
+            ),
+            key,
+            value,
+            timeout=timeout,
+            version=version,
+            **kwargs,
+        )
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None, client=None):
+        def fallback():
+            if self._is_shared(key):
+                return False
+            return self._fallback.add(key, value, self._local_timeout(timeout), version)
+
+        return self._run(
+            "add",
+            fallback,
+            key,
+            value,
+            timeout=timeout,
+            version=version,
+            client=client,
+        )
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None, client=None):
+        return self._run(
+            "set_many",
+            lambda: self._fallback.set_many(
+                data, self._local_timeout(timeout), version
+            ),
+            data,
+            timeout=timeout,
+            version=version,
+            client=client,
+        )
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None, client=None):
+        return self._run(
+            "touch",
+            lambda: self._fallback.touch(key, self._local_timeout(timeout), version),
+            key,
+            timeout=timeout,
+            version=version,
+            client=client,
+        )
+
+    def incr(self, key, delta=1, version=None, client=None):
+        def fallback():
+            if self._is_shared(key):
+                raise ValueError(f"Key '{key}' can only be incremented in Redis.")
+            self._breaker.mark_dirty([key])
+            return self._fallback.incr(key, delta, version)
+
+        return self._run(
+            "incr", fallback, key, delta=delta, version=version, client=client
+        )
+
+    def decr(self, key, delta=1, version=None, client=None):
+        return self.incr(key, -delta, version=version, client=client)
+
+    def delete(self, key, version=None, client=None):
+        def fallback():
+            self._breaker.mark_dirty([key])
+            return self._fallback.delete(key, version)
+
+        return bool(self._run("delete", fallback, key, version=version, client=client))
+
+    def delete_many(self, keys, version=None, client=None):
+        keys = list(keys)
+
+        def fallback():
+            self._breaker.mark_dirty(keys)
+            return self._fallback.delete_many(keys, version)
+
+        return self._run("delete_many", fallback, keys, version=version, client=client)
+
+    def clear(self):
+        return self._run("clear", self._fallback.clear)
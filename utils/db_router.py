@@ -0,0 +1,149 @@
+"""Database router sending the reads of the public pages to read replicas.
+
+Replicas are the databases whose alias starts with ``replica`` (see the
+``POSTGRES_REPLICA_HOSTS`` setting). Reads go to the primary instead:
+
+* during requests to the admin site and requests that are not ``GET``,
+  ``HEAD`` or ``OPTIONS``;
+* after a write, for the rest of the request and for ``REPLICA_PIN_SECONDS``
+  in the same browser, through a cookie, so users see their own changes;
+* for ``REPLICA_PIN_SECONDS`` in every worker after content changed, so that
+  no page computed from a lagging replica is cached under the new version of
+  its namespaces (see :func:`utils.cache.bump_namespaces`).
+"""
+
+import random
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.urls import reverse
+
+from .local_cache import invalidate, is_coherent, local_cache
+
+# Applications whose reads may be served by replicas. Related objects of other
+# applications are read from the database of the object they belong to.
+REPLICATED_APPS = {"news", "activities", "committees"}
+PIN_COOKIE = "primary_until"
+# Cache key of the time until which every worker reads from the primary.
+PINNED_UNTIL_KEY = "replicas_pinned_until"
+
+# Whether the current request reads from the primary, None outside requests.
+_use_primary = ContextVar("use_primary", default=None)
+# Whether the current request wrote to the primary, None outside requests.
+_wrote = ContextVar("wrote", default=None)
+
+
+def replicas():
+    """Return the aliases of the configured replicas."""
+    return [alias for alias in settings.DATABASES if alias.startswith("replica")]
+
+
+def _pin_seconds():
+    """Return the seconds reads stay on the primary after a write."""
+    return getattr(settings, "REPLICA_PIN_SECONDS", 5)
+
+
+def pin_replicas():
+    """Send the reads of every worker to the primary for a while.
+
+    Called when content changes, as replicas apply changes with some delay.
+    """
+    if not replicas():
+        return
+    seconds = _pin_seconds()
+    cache.set(PINNED_UNTIL_KEY, time.time() + seconds, seconds)
+    invalidate(PINNED_UNTIL_KEY)
+
+
+def _replicas_pinned():
+    """Return whether :func:`pin_replicas` was called recently in any worker."""
+    coherent = is_coherent()
+    if coherent:
+        pinned_until = local_cache.get(PINNED_UNTIL_KEY)
+        if pinned_until is not None:
+            return pinned_until > time.time()
+    generation = local_cache.generation
+    pinned_until = cache.get(PINNED_UNTIL_KEY, 0.0)
+    if coherent:
+        local_cache.set(PINNED_UNTIL_KEY, pinned_until, generation)
+    return pinned_until > time.time()
+
+
+class ReplicaRouter:
+    """Route the reads of :data:`REPLICATED_APPS` to a random replica."""
+
+    def db_for_read(self, model, **hints):
+        """Return a replica unless the current request reads from the primary."""
+        if model._meta.app_label not in REPLICATED_APPS:
+            return None
+        aliases = replicas()
+        if not aliases or _wrote.get():
+            return DEFAULT_DB_ALIAS
+        use_primary = _use_primary.get()
+        if use_primary is None:
+            # E.g. background cache refreshes, which must not cache stale rows.
+            use_primary = _replicas_pinned()
+        return DEFAULT_DB_ALIAS if use_primary else random.choice(aliases)
+
+    def db_for_write(self, model, **hints):
+        """Return the primary, which the request then reads from as well."""
+        # Outside requests, e.g. in management commands or background cache
+        # refreshes, nothing would reset the flag.
+        if _wrote.get() is not None:
+            _wrote.set(True)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        """Allow relations between objects of the primary and its replicas."""
+        databases = {DEFAULT_DB_ALIAS, *replicas()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        """Only migrate the primary, replicas copy its schema."""
+        return db == DEFAULT_DB_ALIAS
+
+
+class ReplicaRouterMiddleware:
+    """Tell :class:`ReplicaRouter` whether a request must use the primary."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def _use_primary(self, request):
+        """Return whether ``request`` must read from the primary."""
+        if request.method not in ("GET", "HEAD", "OPTIONS"):
+            return True
+        if request.path.startswith(reverse("admin:index")):
+            return True
+        try:
+            if float(request.COOKIES.get(PIN_COOKIE, 0)) > time.time():
+                return True
+        except ValueError:
+            pass
+        return _replicas_pinned()
+
+    def __call__(self, request):
+        # Threads serve many requests, so the state is reset for each of them.
+        use_primary = _use_primary.set(self._use_primary(request))
+        wrote = _wrote.set(False)
+        try:
+            response = self.get_response(request)
+            if _wrote.get():
+                seconds = _pin_seconds()
+                response.set_cookie(
+                    PIN_COOKIE,
+                    str(time.time() + seconds),
+                    max_age=seconds,
+                    secure=settings.SESSION_COOKIE_SECURE,
+                    httponly=True,
+                    samesite="Lax",
+                )
+        finally:
+            _wrote.reset(wrote)
+            _use_primary.reset(use_primary)
+        return response
@@ -0,0 +1,195 @@
+"""In-process cache tier kept in front of the shared Redis cache.
+
+Small, very hot values (namespace versions, the committee lists, ...) are kept
+in a bounded LRU mapping inside each worker so that serving them needs neither
+a Redis round trip nor unpickling. Values handed out by this tier are shared
+between requests and must be treated as read-only.
+
+Workers tell each other which local entries became invalid by publishing their
+keys on a Redis pub/sub channel. Local entries are only stored while this
+process is subscribed, so a lost connection can never leave a worker serving
+stale data for longer than it takes to notice.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django_redis import get_redis_connection
+from django_redis.cache import RedisCache
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "cache:invalidate"
+RECONNECT_DELAY = 5
+# Seconds the listener waits for a message before checking whether to stop.
+POLL_INTERVAL = 1
+
+
+class LocalCache:
+    """Thread-safe LRU mapping whose entries expire after ``timeout`` seconds."""
+
+    def __init__(self, max_entries, timeout):
+        self.max_entries = max_entries
+        self.timeout = timeout
+        # Incremented on every invalidation, see :meth:`set`.
+        self.generation = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def configure(self, max_entries, timeout):
+        """Change the size and timeout limits, dropping every entry."""
+        with self._lock:
+            self.max_entries = max_entries
+            self.timeout = timeout
+            self.generation += 1
+            self._entries.clear()
+
+    def get(self, key, default=None):
+        """Return the value stored under ``key`` or ``default``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            value, expiry = entry
+            if expiry <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, generation=None):
+        """Store ``value`` under ``key``, evicting the least recently used entry.
+
+        When ``generation`` is given, the value is discarded if an invalidation
+        happened since it was read, as it might predate that invalidation.
+        """
+        if self.timeout <= 0:
+            return
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = (value, time.monotonic() + self.timeout)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys):
+        """Remove ``keys`` from this process."""
+        with self._lock:
+            self.generation += 1
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove every entry from this process."""
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+
+def _options():
+    """Return the ``(max_entries, timeout)`` configured in ``settings.LOCAL_CACHE``."""
+    options = getattr(settings, "LOCAL_CACHE", {})
+    return options.get("MAX_ENTRIES", 512), options.get("TIMEOUT", 30)
+
+
+local_cache = LocalCache(*_options())
+
+
+def _uses_redis():
+    """Return whether the default cache is stored in Redis."""
+    return isinstance(caches["default"], RedisCache)
+
+
+class InvalidationListener(threading.Thread):
+    """Background thread evicting the local keys published by other workers."""
+
+    def __init__(self):
+        super().__init__(name="local-cache-invalidation", daemon=True)
+        self.subscribed = threading.Event()
+        self.stopped = threading.Event()
+
+    def stop(self):
+        """Make the thread unsubscribe and exit."""
+        self.stopped.set()
+
+    def run(self):
+        while not self.stopped.is_set():
+            try:
+                self.listen()
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                logger.warning("Lost local cache invalidation channel: %s", exc)
+            self.subscribed.clear()
+            local_cache.clear()
+            self.stopped.wait(RECONNECT_DELAY)
+
+    def listen(self):
+        """Evict the keys published on the channel until the thread is stopped."""
+        connection = get_redis_connection("default")
+        pubsub = connection.pubsub(ignore_subscribe_messages=True)
+        try:
+            pubsub.subscribe(INVALIDATION_CHANNEL)
+            # Anything stored before subscribing may have missed messages.
+            local_cache.clear()
+            self.subscribed.set()
+            while not self.stopped.is_set():
+                # Waiting with a timeout, rather than reading until a message
+                # arrives, keeps the cache's short SOCKET_TIMEOUT from failing
+                # while the channel is idle.
+                message = pubsub.get_message(timeout=POLL_INTERVAL)
+                if message is not None:
+                    local_cache.delete(*message["data"].decode().split())
+        finally:
+            pubsub.close()
+
+
+_listener = None
+_listener_pid = None
+_listener_lock = threading.Lock()
+
+
+def is_coherent():
+    """Return whether local entries will be told about invalidations.
+
+    Without Redis the cache backend is local to this process (or a dummy), so
+    invalidating the local tier in-process is sufficient.
+    """
+    global _listener, _listener_pid  # pylint: disable=global-statement
+    if local_cache.timeout <= 0:
+        return False
+    if not _uses_redis():
+        return True
+    # Threads do not survive a fork, so each worker starts its own listener.
+    if _listener_pid != os.getpid():
+        with _listener_lock:
+            if _listener_pid != os.getpid():
+                _listener = InvalidationListener()
+                _listener.start()
+                _listener_pid = os.getpid()
+    return _listener.subscribed.is_set()
+
+
+def invalidate(*keys):
+    """Evict ``keys`` from the local tier of every worker."""
+    local_cache.delete(*keys)
+    if not _uses_redis():
+        return
+    try:
+        get_redis_connection("default").publish(INVALIDATION_CHANNEL, " ".join(keys))
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        # Subscribers clear their local tier when they lose the connection.
+        logger.warning("Could not publish local cache invalidation: %s", exc)
+
+
+@receiver(setting_changed)
+def reset_local_cache(setting, **kwargs):
+    """Empty the local tier when the cache configuration changes."""
+    if setting in ("CACHES", "LOCAL_CACHE"):
+        local_cache.configure(*_options())
@@ -0,0 +1,94 @@
+"""Management command timing the connection handling of requests."""
+
+import copy
+import importlib.util
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.db.utils import load_backend
+
+
+def _settings_for(mode, settings_dict):
+    """Return ``settings_dict`` configured for the connection ``mode``."""
+    settings_dict = copy.deepcopy(settings_dict)
+    options = settings_dict.setdefault("OPTIONS", {})
+    options.pop("pool", None)
+    if mode == "new":
+        settings_dict["CONN_MAX_AGE"] = 0
+    elif mode == "persistent":
+        settings_dict["CONN_MAX_AGE"] = 60
+        settings_dict["CONN_HEALTH_CHECKS"] = True
+    elif mode == "pooled":
+        settings_dict["CONN_MAX_AGE"] = 0
+        options["pool"] = {"min_size": 1, "max_size": 1}
+    return settings_dict
+
+
+def time_requests(connection, queries, requests):
+    """Return the milliseconds spent on each of ``requests`` simulated requests.
+
+    Each request runs ``queries`` trivial queries between the connection
+    handling Django does when requests start and finish.
+    """
+    timings = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        connection.close_if_unusable_or_obsolete()
+        for _ in range(queries):
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+                cursor.fetchone()
+        connection.close_if_unusable_or_obsolete()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+class Command(BaseCommand):
+    """Compare the cost of new, persistent and pooled connections per request."""
+
+    help = (
+        "Time simulated requests opening a new database connection each, "
+        "reusing a persistent connection and, on PostgreSQL with psycopg-pool "
+        "installed, borrowing a pooled connection."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default="default")
+        parser.add_argument("--requests", type=int, default=200)
+        parser.add_argument(
+            "--queries", type=int, default=3, help="Queries run by each request."
+        )
+
+    def handle(self, *args, **options):
+        settings_dict = connections[options["database"]].settings_dict
+        backend = load_backend(settings_dict["ENGINE"])
+        modes = ["new", "persistent"]
+        if connections[options["database"]].vendor == "postgresql":
+            if importlib.util.find_spec("psycopg_pool"):
+                modes.append("pooled")
+            else:
+                self.stdout.write("psycopg-pool is not installed, skipping pooling.")
+
+        self.stdout.write(f"{'connections':<14}{'median ms':>12}{'p95 ms':>10}")
+        for mode in modes:
+            connection = backend.DatabaseWrapper(
+                _settings_for(mode, settings_dict), f"benchmark_{mode}"
+            )
+            try:
+                timings = time_requests(
+                    connection, options["queries"], options["requests"]
+                )
+            finally:
+                connection.close()
+                if mode == "pooled":
+                    connection.close_pool()
+            p95 = (
+                statistics.quantiles(timings, n=20)[-1]
+                if len(timings) > 1
+                else timings[0]
+            )
+            self.stdout.write(
+                f"{mode:<14}{statistics.median(timings):>12.3f}{p95:>10.3f}"
+            )
@@ -0,0 +1,178 @@
+"""Management command timing the list queries with and without their indexes."""
+
+import datetime
+import random
+import statistics
+import time
+
+from django.contrib.auth.models import Group
+from django.core.management.base import BaseCommand
+from django.db import connections, transaction
+from django.utils import timezone
+
+from activities.models import Activity
+from committees.models import Committee
+from news.models import Post
+
+
+class Rollback(Exception):
+    """Raised to roll the synthetic dataset back."""
+
+
+def _queries(database, committee_slug, now):
+    """Return the queries of the index and archive pages, by name."""
+    posts = Post.objects.using(database).filter(committee__slug=committee_slug)
+    activities = Activity.objects.using(database).filter(committee__slug=committee_slug)
+    upcoming = Activity.objects.using(database).filter(start__gte=now).order_by("start")
+    return {
+        "latest posts": Post.objects.using(database)[:5],
+        "committee posts": posts[:5],
+        "committee news months": posts.datetimes(
+            "created_at", "month", order="DESC", tzinfo=datetime.timezone.utc
+        ),
+        "upcoming activities": upcoming[:5],
+        "committee upcoming": upcoming.filter(committee__slug=committee_slug)[:5],
+        "committee activity months": activities.datetimes(
+            "created_at", "month", order="DESC", tzinfo=datetime.timezone.utc
+        ),
+    }
+
+
+class Command(BaseCommand):
+    """Compare the query plans and latency of list queries with and without indexes."""
+
+    help = (
+        "Fill the database with synthetic posts and activities, then print the "
+        "query plans and latency of the list queries with and without the "
+        "indexes of the models. Everything is rolled back afterwards, but the "
+        "tables stay locked meanwhile, so only run it against a database that "
+        "no site is using."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            required=True,
+            help=(
+                "Database to benchmark. Dropping the indexes locks the posts "
+                "and activities tables until the benchmark ends."
+            ),
+        )
+        parser.add_argument("--committees", type=int, default=20)
+        parser.add_argument("--posts", type=int, default=100_000)
+        parser.add_argument("--activities", type=int, default=100_000)
+        parser.add_argument(
+            "--repeat", type=int, default=20, help="Runs of each query."
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic(using=options["database"]):
+                self.run(options)
+                raise Rollback
+        except Rollback:
+            self.stdout.write(self.style.SUCCESS("Synthetic data rolled back."))
+
+    def run(self, options):
+        """Create the dataset and benchmark it, inside a transaction."""
+        now = timezone.now()
+        database = options["database"]
+        committee_slug = self.create_dataset(options, now)
+        queries = _queries(database, committee_slug, now)
+        with_indexes = self.benchmark(queries, options["repeat"])
+        self.drop_indexes(database)
+        without_indexes = self.benchmark(queries, options["repeat"])
+
+        self.stdout.write(
+            f"\n{'query':<28}{'indexed ms':>12}{'unindexed ms':>14}{'speedup':>10}"
+        )
+        for name in queries:
+            indexed, _ = with_indexes[name]
+            unindexed, _ = without_indexes[name]
+            speedup = f"{unindexed / indexed:.1f}x" if indexed else "-"
+            self.stdout.write(
+                f"{name:<28}{indexed:>12.2f}{unindexed:>14.2f}{speedup:>10}"
+            )
+        for name in queries:
+            self.stdout.write(f"\n{name}, with indexes:\n{with_indexes[name][1]}")
+            self.stdout.write(f"{name}, without indexes:\n{without_indexes[name][1]}")
+
+    def create_dataset(self, options, now):
+        """Create the synthetic rows and return the slug of one committee."""
+        database = options["database"]
+        committees = [
+            Committee.objects.using(database).create(
+                group=Group.objects.using(database).create(
+                    name=f"Benchmark committee {number}"
+                ),
+                slug=f"benchmark-committee-{number}",
+                description="Benchmark committee",
+                email="benchmark@example.com",
+            )
+            for number in range(options["committees"])
+        ]
+        rng = random.Random(0)
+        five_years = 5 * 365 * 24 * 3600
+
+        def moment():
+            return now - datetime.timedelta(seconds=rng.randrange(five_years))
+
+        Post.objects.using(database).bulk_create(
+            (
+                Post(
+                    title=f"Benchmark post {number}",
+                    slug=f"benchmark-post-{number}",
+                    content="Benchmark",
+                    committee=rng.choice(committees),
+                    created_at=moment(),
+                )
+                for number in range(options["posts"])
+            ),
+            batch_size=1000,
+        )
+        activities = []
+        for number in range(options["activities"]):
+            created_at = moment()
+            start = created_at + datetime.timedelta(days=rng.randrange(1, 365))
+            activities.append(
+                Activity(
+                    title=f"Benchmark activity {number}",
+                    slug=f"benchmark-activity-{number}",
+                    content="Benchmark",
+                    start=start,
+                    end=start + datetime.timedelta(hours=2),
+                    location="Benchmark",
+                    committee=rng.choice(committees),
+                    created_at=created_at,
+                )
+            )
+        Activity.objects.using(database).bulk_create(activities, batch_size=1000)
+        with connections[database].cursor() as cursor:
+            # Let the planner know about the new rows.
+            cursor.execute("ANALYZE")
+        return committees[0].slug
+
+    def benchmark(self, queries, repeat):
+        """Return the median milliseconds and plan of each query."""
+        results = {}
+        for name, queryset in queries.items():
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                list(queryset.all())
+                timings.append((time.perf_counter() - started) * 1000)
+            results[name] = (statistics.median(timings), queryset.explain())
+        return results
+
+    def drop_indexes(self, database):
+        """Drop the indexes declared in the ``Meta`` of the benchmarked models."""
+        connection = connections[database]
+        # The SQLite schema editor refuses to run inside a transaction, but
+        # dropping an index does not need it.
+        with connection.cursor() as cursor:
+            for model in (Post, Activity):
+                for index in model._meta.indexes:
+                    cursor.execute(
+                        f"DROP INDEX {connection.ops.quote_name(index.name)}"
+                    )
+            cursor.execute("ANALYZE")
@@ -0,0 +1,127 @@
+"""Management command measuring SQLite read throughput during writes."""
+
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from utils.sqlite import apply_pragmas
+
+
+def _connect(path, pragmas):
+    """Return a connection to ``path`` in autocommit mode, tuned with ``pragmas``."""
+    # Python's default busy timeout, which Django keeps, is five seconds.
+    connection = sqlite3.connect(path, timeout=5, isolation_level=None)
+    apply_pragmas(connection.cursor(), pragmas)
+    return connection
+
+
+def _create_database(path, rows, pragmas):
+    """Create a table of ``rows`` rows of 1 KB in a new database at ``path``."""
+    # The journal mode persists in the file, as it does on a deployed site.
+    connection = _connect(path, pragmas)
+    connection.execute("CREATE TABLE item (id INTEGER PRIMARY KEY, payload TEXT)")
+    connection.execute("BEGIN")
+    connection.executemany(
+        "INSERT INTO item (payload) VALUES (?)", (("x" * 1024,) for _ in range(rows))
+    )
+    connection.execute("COMMIT")
+    connection.close()
+
+
+def run_workload(path, pragmas, begin, options):
+    """Return the reads, writes and lock errors of concurrent readers and writers.
+
+    Readers fetch random rows while writers insert rows in transactions
+    started with the ``begin`` statement, for ``options["seconds"]`` seconds.
+    """
+    counts = {"reads": 0, "writes": 0, "locked": 0}
+    counts_lock = threading.Lock()
+    deadline = time.monotonic() + options["seconds"]
+
+    def work(operation):
+        connection = _connect(path, pragmas)
+        done = locked = 0
+        while time.monotonic() < deadline:
+            try:
+                operation(connection)
+                done += 1
+            except sqlite3.OperationalError as exc:
+                if "locked" not in str(exc):
+                    raise
+                locked += 1
+                if connection.in_transaction:
+                    connection.execute("ROLLBACK")
+        connection.close()
+        kind = "reads" if operation is read else "writes"
+        with counts_lock:
+            counts[kind] += done
+            counts["locked"] += locked
+
+    rng = random.Random(0)
+
+    def read(connection):
+        connection.execute(
+            "SELECT payload FROM item WHERE id = ?", (rng.randint(1, options["rows"]),)
+        ).fetchone()
+
+    def write(connection):
+        connection.execute(begin)
+        connection.executemany(
+            "INSERT INTO item (payload) VALUES (?)", [("y" * 1024,)] * 20
+        )
+        connection.execute("COMMIT")
+
+    threads = [
+        threading.Thread(target=work, args=(read,)) for _ in range(options["readers"])
+    ]
+    threads += [
+        threading.Thread(target=work, args=(write,)) for _ in range(options["writers"])
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return counts
+
+
+class Command(BaseCommand):
+    """Compare SQLite's default configuration with ``settings.SQLITE_PRAGMAS``."""
+
+    help = (
+        "Run readers and writers concurrently against a temporary SQLite "
+        "database, first with SQLite's defaults, then with SQLITE_PRAGMAS and "
+        "immediate transactions, and print the reads and writes per second "
+        "and the number of 'database is locked' errors."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--readers", type=int, default=4)
+        parser.add_argument("--writers", type=int, default=2)
+        parser.add_argument("--seconds", type=float, default=5)
+        parser.add_argument("--rows", type=int, default=10_000)
+
+    def handle(self, *args, **options):
+        configurations = [
+            ("default", {}, "BEGIN"),
+            ("tuned", getattr(settings, "SQLITE_PRAGMAS", {}), "BEGIN IMMEDIATE"),
+        ]
+        self.stdout.write(
+            f"{'configuration':<15}{'reads/s':>12}{'writes/s':>12}{'locked':>10}"
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            for name, pragmas, begin in configurations:
+                path = os.path.join(directory, f"{name}.sqlite3")
+                _create_database(path, options["rows"], pragmas)
+                counts = run_workload(path, pragmas, begin, options)
+                self.stdout.write(
+                    f"{name:<15}"
+                    f"{counts['reads'] / options['seconds']:>12.0f}"
+                    f"{counts['writes'] / options['seconds']:>12.0f}"
+                    f"{counts['locked']:>10}"
+                )
@@ -0,0 +1,40 @@
+"""Management command printing the cache metrics of every key family."""
+
+from django.core.management.base import BaseCommand
+
+from utils.metrics import metrics
+
+
+class Command(BaseCommand):
+    """Print the cache hits, misses, errors and latency per key family."""
+
+    help = "Print the cache hits, misses, errors and latency per key family."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Set the counters back to zero after printing them.",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f"{'family':<22}{'lookups':>10}{'hits':>10}{'misses':>10}"
+            f"{'hit ratio':>11}{'errors':>10}{'avg ms':>10}"
+        )
+        for family, counts in metrics.totals().items():
+            keys = counts["hits"] + counts["misses"]
+            ratio = f"{counts['hits'] / keys:.1%}" if keys else "-"
+            average = (
+                f"{counts['microseconds'] / counts['lookups'] / 1000:.2f}"
+                if counts["lookups"]
+                else "-"
+            )
+            self.stdout.write(
+                f"{family:<22}{counts['lookups']:>10}{counts['hits']:>10}"
+                f"{counts['misses']:>10}{ratio:>11}{counts['errors']:>10}"
+                f"{average:>10}"
+            )
+        if options["reset"]:
+            metrics.reset()
+            self.stdout.write(self.style.SUCCESS("Cache metrics reset."))
@@ -0,0 +1,160 @@
+"""Hit, miss, error and latency counters of the cache, per key family.
+
+Each worker accumulates its counters in memory and adds them to counters kept
+in the shared cache every ``FLUSH_INTERVAL`` seconds, so that the totals of all
+workers can be read by the ``cache_metrics`` command and the metrics endpoint.
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.core.cache import cache
+
+FLUSH_INTERVAL = 10
+
+# Families are matched against the start of each key, in this order.
+FAMILIES = (
+    "latest_posts",
+    "upcoming_activities",
+    "news_archive",
+    "activities_archive",
+    "all_committees",
+    "committee",
+    "last_modified",
+    "cache_page",
+    "typeahead",
+    "other",
+)
+# A lookup reads one or more keys, each of them counting as a hit or a miss.
+FIELDS = ("lookups", "hits", "misses", "errors", "microseconds")
+
+# Family of the cache operation in progress, to attribute errors to it.
+_current_family = ContextVar("current_family", default="other")
+
+
+def key_family(key):
+    """Return the family reported for the cache ``key``."""
+    for family in FAMILIES:
+        if key.startswith(family):
+            return family
+    return "other"
+
+
+def _metric_key(family, field):
+    """Return the cache key of a shared counter."""
+    return f"metrics:{family}:{field}"
+
+
+class CacheMetrics:
+    """Counters of this worker, periodically added to the shared counters."""
+
+    def __init__(self):
+        self._counts = defaultdict(float)
+        self._lock = threading.Lock()
+        self._flush_at = time.monotonic() + FLUSH_INTERVAL
+
+    def record(self, family, field, amount=1):
+        """Add ``amount`` to the ``field`` counter of ``family``."""
+        with self._lock:
+            self._counts[family, field] += amount
+            now = time.monotonic()
+            due = now >= self._flush_at
+            if due:
+                self._flush_at = now + FLUSH_INTERVAL
+        if due:
+            self.flush()
+
+    def flush(self):
+        """Add the counters of this worker to the shared counters."""
+        if not getattr(cache, "is_available", True):
+            # Kept until Redis is back rather than counted in this worker only.
+            return
+        with self._lock:
+            counts, self._counts = self._counts, defaultdict(float)
+        unsent = {}
+        token = _current_family.set("other")
+        try:
+            for (family, field), amount in counts.items():
+                amount, remainder = divmod(amount, 1)
+                if remainder:
+                    unsent[family, field] = remainder
+                if not amount:
+                    continue
+                key = _metric_key(family, field)
+                try:
+                    stored = cache.add(key, int(amount), None) or cache.incr(
+                        key, int(amount)
+                    )
+                except ValueError:
+                    # The counter was deleted in between.
+                    stored = None
+                if not stored:
+                    unsent[family, field] = unsent.get((family, field), 0) + amount
+        finally:
+            _current_family.reset(token)
+        # Counters the cache did not accept are sent with the next flush.
+        with self._lock:
+            for key, amount in unsent.items():
+                self._counts[key] += amount
+
+    def totals(self):
+        """Return the shared counters as ``{family: {field: value}}``."""
+        self.flush()
+        keys = {
+            _metric_key(family, field): (family, field)
+            for family in FAMILIES
+            for field in FIELDS
+        }
+        stored = cache.get_many(list(keys))
+        totals = {family: dict.fromkeys(FIELDS, 0) for family in FAMILIES}
+        for key, value in stored.items():
+            family, field = keys[key]
+            totals[family][field] = value
+        return totals
+
+    def reset(self):
+        """Set every shared counter back to zero."""
+        with self._lock:
+            self._counts.clear()
+        cache.delete_many(
+            [_metric_key(family, field) for family in FAMILIES for field in FIELDS]
+        )
+
+
+metrics = CacheMetrics()
+
+
+@contextmanager
+def track(family):
+    """Attribute the cache errors raised within the block to ``family``.
+
+    Yields a callable to call with the number of ``hits`` and ``misses`` once
+    the lookup is done, which records them along with its latency.
+    """
+    token = _current_family.set(family)
+    started = time.perf_counter()
+
+    def done(hits=0, misses=0):
+        microseconds = (time.perf_counter() - started) * 1_000_000
+        metrics.record(family, "lookups")
+        metrics.record(family, "microseconds", microseconds)
+        if hits:
+            metrics.record(family, "hits", hits)
+        if misses:
+            metrics.record(family, "misses", misses)
+
+    try:
+        yield done
+    finally:
+        _current_family.reset(token)
+
+
+class IgnoredExceptionHandler(logging.Handler):
+    """Count the cache errors hidden by django-redis' ``IGNORE_EXCEPTIONS``."""
+
+    def emit(self, record):
+        metrics.record(_current_family.get(), "errors")
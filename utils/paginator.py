@@ -0,0 +1,53 @@
+"""Paginator counting large tables from the planner's estimates."""
+
+import json
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+
+
+def estimated_count(queryset):
+    """Return the planner's estimate of the rows of ``queryset``, or ``None``.
+
+    Unfiltered querysets are counted from the statistics of their table, other
+    ones from the plan of the query. Only PostgreSQL keeps such estimates.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    if not queryset.query.where:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        # Tables that were never analyzed have no statistics (-1).
+        if row is None or row[0] < 0:
+            return None
+        return int(row[0])
+    plan = json.loads(queryset.order_by().explain(format="json"))
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator using the planner's estimates to count large querysets.
+
+    Counts estimated below ``settings.ESTIMATED_COUNT_THRESHOLD`` rows, and
+    every count on databases without estimates such as SQLite, are exact.
+    Above it, the last pages may be shorter than announced or missing.
+    """
+
+    @cached_property
+    def count(self):
+        """Return the estimated number of objects above the threshold."""
+        threshold = getattr(settings, "ESTIMATED_COUNT_THRESHOLD", 10_000)
+        estimate = None
+        if isinstance(self.object_list, QuerySet):
+            estimate = estimated_count(self.object_list)
+        if estimate is not None and estimate >= threshold:
+            return estimate
+        return super().count
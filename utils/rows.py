@@ -0,0 +1,116 @@
+"""Compact, read-only rows for caching lists of model instances.
+
+Pickled model instances carry every field, their related objects and Django's
+internal state. The public lists only display a handful of fields, so they are
+cached as :class:`Row` objects holding just those fields, serialised with
+msgpack and compressed with zlib once they grow large.
+"""
+
+import zlib
+
+import msgpack
+
+# Payloads of at least this many bytes are compressed.
+COMPRESS_MIN_SIZE = 1024
+
+_RAW = b"m"
+_ZLIB = b"z"
+_ROW_EXT_TYPE = 1
+
+
+class Row:
+    """Read-only stand-in for a model instance, built from selected fields.
+
+    Fields are exposed as attributes and ``str()`` returns the text of the
+    instance. Rows compare equal to the model instance they were built from.
+    """
+
+    __slots__ = ("label", "pk", "text", "fields")
+
+    def __init__(self, label, pk, text, fields):
+        object.__setattr__(self, "label", label)
+        object.__setattr__(self, "pk", pk)
+        object.__setattr__(self, "text", text)
+        object.__setattr__(self, "fields", fields)
+
+    @classmethod
+    def for_model(cls, model, pk, text, **fields):
+        """Return a row standing in for the ``model`` instance ``pk``."""
+        return cls(model._meta.label_lower, pk, text, fields)
+
+    @property
+    def id(self):  # pylint: disable=invalid-name
+        """Return the primary key, like a model's ``id`` field."""
+        return self.pk
+
+    def __getattr__(self, name):
+        try:
+            return object.__getattribute__(self, "fields")[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __str__(self):
+        return self.text
+
+    def __repr__(self):
+        return f"<Row {self.label} {self.pk}: {self.text}>"
+
+    def __eq__(self, other):
+        if isinstance(other, Row):
+            return (self.label, self.pk) == (other.label, other.pk)
+        meta = getattr(other, "_meta", None)
+        if meta is not None and hasattr(meta, "label_lower"):
+            return (self.label, self.pk) == (meta.label_lower, other.pk)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self.label, self.pk))
+
+    def __reduce__(self):
+        return (Row, (self.label, self.pk, self.text, self.fields))
+
+
+def _default(value):
+    """Encode :class:`Row` objects as a msgpack extension type."""
+    if isinstance(value, Row):
+        data = _packb([value.label, value.pk, value.text, value.fields])
+        return msgpack.ExtType(_ROW_EXT_TYPE, data)
+    raise TypeError(f"Cannot serialise {type(value).__name__} for the cache")
+
+
+def _ext_hook(code, data):
+    """Decode the extension types written by :func:`_default`."""
+    if code == _ROW_EXT_TYPE:
+        return Row(*_unpackb(data))
+    return msgpack.ExtType(code, data)
+
+
+def _packb(value):
+    return msgpack.packb(value, default=_default, datetime=True)
+
+
+def _unpackb(data):
+    # ``timestamp=3`` decodes timestamps as timezone-aware datetimes in UTC.
+    return msgpack.unpackb(data, ext_hook=_ext_hook, timestamp=3, strict_map_key=False)
+
+
+def pack(value):
+    """Serialise ``value``, made of rows and msgpack types, into bytes.
+
+    Datetimes must be timezone-aware.
+    """
+    data = _packb(value)
+    if len(data) >= COMPRESS_MIN_SIZE:
+        return _ZLIB + zlib.compress(data)
+    return _RAW + data
+
+
+def unpack(payload):
+    """Return the value serialised by :func:`pack`."""
+    marker, data = payload[:1], payload[1:]
+    if marker == _ZLIB:
+        data = zlib.decompress(data)
+    return _unpackb(data)
@@ -0,0 +1,212 @@
+"""Full-text search over the text fields of models.
+
+PostgreSQL matches a ``SearchVector`` of the fields, backed by a GIN index on
+the same expression. SQLite matches an FTS5 table holding a copy of the fields,
+kept up to date by triggers, which :func:`restore_search_index` recreates after
+migrations that remade the table. Other databases fall back to ``icontains``.
+
+The trigram indexes of the typeahead suggestions are created here as well.
+"""
+
+import operator
+from functools import reduce
+
+from django.db import connections
+from django.db.models import FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+# Text search configuration of PostgreSQL, matching the language of the site.
+SEARCH_CONFIG = "dutch"
+# FTS5 tokenizer folding case and accents, as the site's words carry many.
+FTS5_TOKENIZER = "unicode61 remove_diacritics 2"
+# Statements whose triggers copy the fields to the FTS5 table.
+TRIGGER_EVENTS = ("insert", "delete", "update")
+
+
+def _index_name(model):
+    """Return the name of the search index of ``model``."""
+    return f"{model._meta.db_table}_search_idx"
+
+
+def _trigram_index_name(model, column):
+    """Return the name of the trigram index of ``column`` of ``model``."""
+    return f"{model._meta.db_table}_{column}_trgm_idx"
+
+
+def _fts_table(model):
+    """Return the name of the FTS5 table of ``model`` on SQLite."""
+    return f"{model._meta.db_table}_fts"
+
+
+def _search_vector(fields):
+    """Return the PostgreSQL ``SearchVector`` of ``fields``."""
+    from django.contrib.postgres.search import SearchVector
+
+    return SearchVector(*fields, config=SEARCH_CONFIG)
+
+
+def _fts5_query(query):
+    """Return an FTS5 query matching the rows containing every word of ``query``.
+
+    Words are quoted so that FTS5 operators typed by users are matched as text.
+    """
+    return " ".join('"{}"'.format(word.replace('"', '""')) for word in query.split())
+
+
+def create_search_index(schema_editor, model, fields):
+    """Create the search index of ``fields`` of ``model``, for migrations.
+
+    On SQLite, only what is missing is created and the FTS5 table is refilled.
+    """
+    connection = schema_editor.connection
+    if connection.vendor == "postgresql":
+        from django.contrib.postgres.indexes import GinIndex
+
+        schema_editor.add_index(
+            model, GinIndex(_search_vector(fields), name=_index_name(model))
+        )
+    elif connection.vendor == "sqlite":
+        qn = connection.ops.quote_name
+        table = model._meta.db_table
+        fts = qn(_fts_table(model))
+        pk = qn(model._meta.pk.column)
+        columns = ", ".join(qn(field) for field in fields)
+        new = ", ".join(f"new.{qn(field)}" for field in fields)
+        old = ", ".join(f"old.{qn(field)}" for field in fields)
+        insert = f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.{pk}, {new});"
+        delete = (
+            f"INSERT INTO {fts}({fts}, rowid, {columns}) "
+            f"VALUES ('delete', old.{pk}, {old});"
+        )
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({columns}, "
+            f"content='{table}', content_rowid='{model._meta.pk.column}', "
+            f"tokenize='{FTS5_TOKENIZER}')"
+        )
+        triggers = {
+            "insert": f"AFTER INSERT ON {qn(table)} BEGIN {insert} END",
+            "delete": f"AFTER DELETE ON {qn(table)} BEGIN {delete} END",
+            "update": (
+                f"AFTER UPDATE OF {columns} ON {qn(table)} "
+                f"BEGIN {delete} {insert} END"
+            ),
+        }
+        for event, trigger in triggers.items():
+            name = qn(f"{_fts_table(model)}_{event}")
+            schema_editor.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {trigger}")
+        schema_editor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def drop_search_index(schema_editor, model):
+    """Drop the search index of ``model`` created by :func:`create_search_index`."""
+    connection = schema_editor.connection
+    qn = connection.ops.quote_name
+    if connection.vendor == "postgresql":
+        schema_editor.execute(f"DROP INDEX IF EXISTS {qn(_index_name(model))}")
+    elif connection.vendor == "sqlite":
+        for event in TRIGGER_EVENTS:
+            name = qn(f"{_fts_table(model)}_{event}")
+            schema_editor.execute(f"DROP TRIGGER IF EXISTS {name}")
+        schema_editor.execute(f"DROP TABLE IF EXISTS {qn(_fts_table(model))}")
+
+
+def restore_search_index(connection, model, fields):
+    """Recreate the SQLite triggers of the search index of ``model`` if missing.
+
+    Django's SQLite schema editor remakes tables to alter most of their
+    columns, which drops their triggers, so this runs after every migration
+    (see the ``post_migrate`` handlers). Returns whether anything was restored.
+    """
+    if connection.vendor != "sqlite":
+        return False
+    fts = _fts_table(model)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE name = %s "
+            "OR (type = 'trigger' AND tbl_name = %s)",
+            [fts, model._meta.db_table],
+        )
+        names = {name for (name,) in cursor.fetchall()}
+    triggers = {f"{fts}_{event}" for event in TRIGGER_EVENTS}
+    # Without the FTS5 table, the search migration is not applied.
+    if fts not in names or triggers <= names:
+        return False
+    with connection.schema_editor() as schema_editor:
+        create_search_index(schema_editor, model, fields)
+    return True
+
+
+def search(queryset, query, fields):
+    """Return the objects of ``queryset`` whose ``fields`` match ``query``.
+
+    Every word of ``query`` must appear in one of the fields. The objects are
+    annotated with their ``rank``, higher for better matches, and ordered by
+    it. ``fields`` must be the fields passed to :func:`create_search_index`.
+    """
+    if not query.split():
+        return queryset.none()
+    connection = connections[queryset.db]
+    model = queryset.model
+    if connection.vendor == "postgresql":
+        from django.contrib.postgres.search import SearchQuery, SearchRank
+
+        vector = _search_vector(fields)
+        search_query = SearchQuery(query, config=SEARCH_CONFIG, search_type="websearch")
+        queryset = queryset.annotate(
+            search=vector, rank=SearchRank(vector, search_query)
+        ).filter(search=search_query)
+    elif connection.vendor == "sqlite":
+        qn = connection.ops.quote_name
+        fts = qn(_fts_table(model))
+        pk = f"{qn(model._meta.db_table)}.{qn(model._meta.pk.column)}"
+        match = _fts5_query(query)
+        # bm25() is lower for better matches.
+        rank = RawSQL(
+            f"SELECT -bm25({fts}) FROM {fts} WHERE {fts} MATCH %s AND rowid = {pk}",
+            [match],
+            output_field=FloatField(),
+        )
+        matches = RawSQL(f"SELECT rowid FROM {fts} WHERE {fts} MATCH %s", [match])
+        queryset = queryset.filter(pk__in=matches).annotate(rank=rank)
+    else:
+        queryset = queryset.filter(
+            *(
+                reduce(
+                    operator.or_,
+                    (Q(**{f"{field}__icontains": word}) for field in fields),
+                )
+                for word in query.split()
+            )
+        ).annotate(rank=Value(0.0))
+    return queryset.order_by("-rank")
+
+
+def create_trigram_indexes(schema_editor, model, fields):
+    """Create the trigram indexes of ``fields`` of ``model`` on PostgreSQL.
+
+    They back the ``icontains`` lookups of :mod:`utils.typeahead`, hence
+    cover the ``UPPER()`` expression these lookups compare.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    qn = schema_editor.connection.ops.quote_name
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for field in fields:
+        column = model._meta.get_field(field).column
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {qn(_trigram_index_name(model, column))} "
+            f"ON {qn(model._meta.db_table)} "
+            f"USING gin (UPPER({qn(column)}::text) gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(schema_editor, model, fields):
+    """Drop the indexes created by :func:`create_trigram_indexes`."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    qn = schema_editor.connection.ops.quote_name
+    for field in fields:
+        column = model._meta.get_field(field).column
+        schema_editor.execute(
+            f"DROP INDEX IF EXISTS {qn(_trigram_index_name(model, column))}"
+        )
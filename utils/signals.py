@@ -0,0 +1,16 @@
+"""Signal handlers configuring the database connections."""
+
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+from .sqlite import apply_pragmas
+
+
+@receiver(connection_created)
+def tune_sqlite(sender, connection, **kwargs):
+    """Apply ``settings.SQLITE_PRAGMAS`` to new SQLite connections."""
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        apply_pragmas(cursor, getattr(settings, "SQLITE_PRAGMAS", {}))
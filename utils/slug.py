@@ -1,18 +1,132 @@
 """Utility helpers for slug generation."""
 
+import itertools
+import operator
+from functools import reduce
+
+from django.db import IntegrityError, router, transaction
+from django.db.models import Q
 from django.utils.text import slugify
 
+# Times a save is retried when another one took its slug in the meantime.
+SLUG_ATTEMPTS = 5
+# Base slugs whose possible clashes are fetched by a single query.
+SLUG_PREFIXES_PER_QUERY = 100
+
+
+def _base_slug(model, value):
+    """Return the slug of *value*, or the name of ``model`` if it has none.
+
+    Values without letters or digits, e.g. only punctuation or emoji, would
+    give an empty slug, which every existing slug starts with.
+    """
+    return slugify(value) or model._meta.model_name
+
+
+def _taken_slugs(queryset, slug, slug_field_name):
+    """Return the slugs in ``queryset`` that ``slug`` or ``slug-N`` could clash with."""
+    return set(
+        queryset.filter(**{f"{slug_field_name}__startswith": slug}).values_list(
+            slug_field_name, flat=True
+        )
+    )
+
+
+def _taken_slugs_of_bases(model, bases, slug_field_name="slug"):
+    """Return the slugs of ``model`` that any of the ``bases`` could clash with.
+
+    Only slugs starting with one of ``bases`` are fetched, from the database
+    objects of ``model`` are written to, whatever queryset is being filled.
+    """
+    queryset = model._default_manager.db_manager(router.db_for_write(model)).all()
+    bases = sorted(bases)
+    taken = set()
+    for start in range(0, len(bases), SLUG_PREFIXES_PER_QUERY):
+        prefixes = bases[start : start + SLUG_PREFIXES_PER_QUERY]
+        condition = reduce(
+            operator.or_,
+            (Q(**{f"{slug_field_name}__startswith": prefix}) for prefix in prefixes),
+        )
+        taken.update(queryset.filter(condition).values_list(slug_field_name, flat=True))
+    return taken
+
+
+def _candidate_slugs(slug):
+    """Yield ``slug``, then ``slug-1``, ``slug-2``, ..."""
+    yield slug
+    for counter in itertools.count(1):
+        yield f"{slug}-{counter}"
+
+
+def _first_free_slug(slug, taken):
+    """Return the first of the candidates for ``slug`` not in ``taken``."""
+    return next(
+        candidate for candidate in _candidate_slugs(slug) if candidate not in taken
+    )
+
 
 def generate_unique_slug(instance, value, slug_field_name="slug"):
-    """Generate a slug for *value* unique among ``instance``'s model."""
-    slug = slugify(value)
-    ModelClass = instance.__class__
-    unique_slug = slug
-    counter = 1
-    queryset = ModelClass.objects
+    """Generate a slug for *value* unique among ``instance``'s model.
+
+    The slugs it could clash with are fetched in a single query.
+    """
+    slug = _base_slug(instance.__class__, value)
+    queryset = instance.__class__._default_manager.all()
     if instance.pk:
         queryset = queryset.exclude(pk=instance.pk)
-    while queryset.filter(**{slug_field_name: unique_slug}).exists():
-        unique_slug = f"{slug}-{counter}"
-        counter += 1
-    return unique_slug
+    return _first_free_slug(slug, _taken_slugs(queryset, slug, slug_field_name))
+
+
+def save_with_unique_slug(instance, value, save, *args, **kwargs):
+    """Call ``save(*args, **kwargs)`` after giving ``instance`` a slug for *value*.
+
+    A concurrent save may take the slug before ``instance`` is inserted, in
+    which case the unique constraint is violated and another slug is generated.
+    """
+    model = instance.__class__
+    for attempt in range(SLUG_ATTEMPTS):
+        instance.slug = generate_unique_slug(instance, value)
+        try:
+            with transaction.atomic():
+                save(*args, **kwargs)
+            return
+        except IntegrityError:
+            taken = model._default_manager.filter(slug=instance.slug).exists()
+            if not taken or attempt == SLUG_ATTEMPTS - 1:
+                raise
+
+
+def bulk_create_with_unique_slugs(
+    queryset, objs, value_field, batch_size=None, slug_field_name="slug"
+):
+    """Insert ``objs`` with ``bulk_create``, generating their missing slugs.
+
+    Missing slugs are generated from the ``value_field`` of each object and
+    allocated in memory against the existing slugs they could clash with, so
+    that importing many objects needs a few queries per batch only. The
+    allocation is retried if concurrent saves took some of the slugs.
+    """
+    objs = list(objs)
+    model = queryset.model
+    missing = [obj for obj in objs if not getattr(obj, slug_field_name)]
+    given = {getattr(obj, slug_field_name) for obj in objs} - {"", None}
+    bases = [_base_slug(model, getattr(obj, value_field)) for obj in missing]
+    for attempt in range(SLUG_ATTEMPTS):
+        taken = given | _taken_slugs_of_bases(model, set(bases), slug_field_name)
+        # Candidates already taken are never tried again for the same base.
+        candidates = {}
+        for obj, base in zip(missing, bases):
+            remaining = candidates.setdefault(base, _candidate_slugs(base))
+            slug = next(candidate for candidate in remaining if candidate not in taken)
+            setattr(obj, slug_field_name, slug)
+            taken.add(slug)
+        try:
+            with transaction.atomic():
+                return queryset.bulk_create(objs, batch_size=batch_size)
+        except IntegrityError:
+            existing = _taken_slugs_of_bases(model, set(bases), slug_field_name)
+            clashed = not existing.isdisjoint(
+                getattr(obj, slug_field_name) for obj in missing
+            )
+            if not clashed or attempt == SLUG_ATTEMPTS - 1:
+                raise
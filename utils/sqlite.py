@@ -0,0 +1,19 @@
+"""Tuning of SQLite connections for concurrent use by several workers."""
+
+# PRAGMAs that only accept their documented keywords or an integer.
+_PRAGMAS = {"journal_mode", "synchronous", "mmap_size", "cache_size", "busy_timeout"}
+
+
+def apply_pragmas(cursor, pragmas):
+    """Run ``PRAGMA name = value`` with ``cursor`` for each item of ``pragmas``.
+
+    PRAGMA values cannot be passed as query parameters, so only the PRAGMAs
+    configured in ``settings.SQLITE_PRAGMAS`` are accepted, with keyword or
+    integer values.
+    """
+    for name, value in pragmas.items():
+        if name not in _PRAGMAS:
+            raise ValueError(f"Unsupported SQLite PRAGMA: {name}")
+        if not str(value).lstrip("-").isalnum():
+            raise ValueError(f"Invalid value for SQLite PRAGMA {name}: {value}")
+        cursor.execute(f"PRAGMA {name} = {value}")
@@ -0,0 +1,30 @@
+"""Helpers shared by the test suites of the apps."""
+
+import re
+from collections import defaultdict
+from contextlib import contextmanager
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+# A "table"."column" reference, as quoted by the SQLite and PostgreSQL backends.
+_COLUMN = re.compile(r'"(\w+)"\."(\w+)"')
+
+
+@contextmanager
+def loaded_columns():
+    """Collect the columns selected by the queries run within the block.
+
+    Yields a mapping of table names to the set of their selected columns,
+    filled once the block exits.
+    """
+    columns = defaultdict(set)
+    with CaptureQueriesContext(connection) as queries:
+        yield columns
+    for query in queries.captured_queries:
+        sql = query["sql"]
+        if not sql.startswith("SELECT"):
+            continue
+        select_clause = sql.split(" FROM ", 1)[0]
+        for table, column in _COLUMN.findall(select_clause):
+            columns[table].add(column)
@@ -0,0 +1,79 @@
+from django.contrib.admin.sites import site
+from django.contrib.auth.models import User, Group, Permission
+from django.test import RequestFactory, TestCase
+from committees.models import Committee
+from news.models import Post
+from utils.admin import committee_ids
+
+
+class CommitteePermissionMixinTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="staff_user", email="staff@example.com", password="password"
+        )
+        self.user.is_staff = True
+        self.user.save()
+        self.group = Group.objects.create(name="Test Committee")
+        self.committee = Committee.objects.create(
+            group=self.group,
+            slug="test-committee",
+            description="A test committee",
+            contact_person=self.user,
+            email="test@example.com",
+        )
+        self.group.user_set.add(self.user)
+        self.group.permissions.add(
+            Permission.objects.get(codename="view_post"),
+            Permission.objects.get(codename="change_post"),
+            Permission.objects.get(codename="delete_post"),
+        )
+        other_group = Group.objects.create(name="Other Committee")
+        self.other_committee = Committee.objects.create(
+            group=other_group,
+            slug="other-committee",
+            description="Another committee",
+            email="other@example.com",
+        )
+        self.post = Post.objects.create(
+            title="Own Post", content="Content", committee=self.committee
+        )
+        self.other_post = Post.objects.create(
+            title="Other Post", content="Content", committee=self.other_committee
+        )
+        self.admin = site._registry[Post]
+
+    def get_request(self, user):
+        request = RequestFactory().get("/admin/")
+        request.user = User.objects.get(pk=user.pk)
+        return request
+
+    def test_committee_ids_are_cached_on_request(self):
+        """Test that the committees of the user are fetched once per request."""
+        request = self.get_request(self.user)
+        with self.assertNumQueries(1):
+            self.assertEqual(committee_ids(request), {self.committee.pk})
+            committee_ids(request)
+
+    def test_permissions_compare_committee_ids(self):
+        """Test that row permissions never load committees or groups again."""
+        request = self.get_request(self.user)
+        post = Post.objects.get(pk=self.post.pk)
+        other_post = Post.objects.get(pk=self.other_post.pk)
+        # Two queries for the user and group permissions, one for the committees.
+        with self.assertNumQueries(3):
+            for _ in range(3):
+                self.assertTrue(self.admin.has_view_permission(request, post))
+                self.assertTrue(self.admin.has_change_permission(request, post))
+                self.assertTrue(self.admin.has_delete_permission(request, post))
+                self.assertFalse(self.admin.has_view_permission(request, other_post))
+                self.assertFalse(self.admin.has_change_permission(request, other_post))
+                self.assertFalse(self.admin.has_delete_permission(request, other_post))
+
+    def test_superuser_has_permission_on_every_committee(self):
+        """Test that superusers are not restricted to their committees."""
+        superuser = User.objects.create_superuser(
+            username="admin", email="admin@example.com", password="password"
+        )
+        request = self.get_request(superuser)
+        with self.assertNumQueries(0):
+            self.assertTrue(self.admin.has_change_permission(request, self.other_post))
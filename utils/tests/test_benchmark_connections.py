@@ -0,0 +1,13 @@
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+
+
+class BenchmarkConnectionsTest(TestCase):
+    def test_command_times_each_connection_mode(self):
+        """Test that the benchmark prints the timings of each connection mode."""
+        out = StringIO()
+        call_command("benchmark_connections", requests=3, queries=1, stdout=out)
+        self.assertIn("new", out.getvalue())
+        self.assertIn("persistent", out.getvalue())
+        self.assertNotIn("pooled", out.getvalue())
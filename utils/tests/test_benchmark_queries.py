@@ -0,0 +1,35 @@
+from io import StringIO
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase
+from activities.models import Activity
+from news.models import Post
+
+
+class BenchmarkQueriesTest(TestCase):
+    def test_command_compares_plans_and_rolls_back(self):
+        """Test that the benchmark prints every query and leaves no trace."""
+        out = StringIO()
+        call_command(
+            "benchmark_queries",
+            database="default",
+            committees=2,
+            posts=50,
+            activities=50,
+            repeat=1,
+            stdout=out,
+        )
+        self.assertIn("upcoming activities", out.getvalue())
+        self.assertIn("activity_start_idx", out.getvalue())
+        self.assertFalse(Post.objects.exists())
+        self.assertFalse(Activity.objects.exists())
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor, Activity._meta.db_table
+            )
+        self.assertIn("activity_start_idx", constraints)
+
+    def test_database_must_be_chosen(self):
+        """Test that the benchmark never runs against a database by default."""
+        with self.assertRaises(CommandError):
+            call_command("benchmark_queries", stdout=StringIO())
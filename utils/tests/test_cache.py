@@ -0,0 +1,236 @@
+import time
+from unittest import mock
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.core.cache import cache
+from utils.cache import (
+    LEASE_TIMEOUT,
+    _bump_namespaces,
+    _lease_key,
+    _served_stale,
+    get_many_or_set,
+    get_or_set,
+    versioned_condition,
+    versioned_key,
+)
+from utils.local_cache import local_cache
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class VersionedKeyTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        local_cache.clear()
+
+    def test_key_changes_when_namespace_is_bumped(self):
+        """Test that bumping a namespace changes the keys depending on it."""
+        key = versioned_key("example", "news", "committees")
+        self.assertEqual(key, versioned_key("example", "news", "committees"))
+        _bump_namespaces(["news"])
+        self.assertNotEqual(key, versioned_key("example", "news", "committees"))
+
+    def test_key_ignores_unrelated_namespaces(self):
+        """Test that bumping another namespace keeps the key unchanged."""
+        key = versioned_key("example", "news:sports")
+        versioned_key("other", "news:music")
+        _bump_namespaces(["news:music"])
+        self.assertEqual(key, versioned_key("example", "news:sports"))
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class GetOrSetTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        local_cache.clear()
+        self.compute = mock.Mock(return_value=["fresh"])
+
+    def test_value_is_computed_once(self):
+        """Test that a cached value is served without recomputing it."""
+        self.assertEqual(get_or_set("example:1", self.compute, 60), ["fresh"])
+        self.assertEqual(get_or_set("example:1", self.compute, 60), ["fresh"])
+        self.compute.assert_called_once()
+
+    def test_callable_timeout_receives_value(self):
+        """Test that a callable timeout is computed from the value."""
+        timeout = mock.Mock(return_value=60)
+        get_or_set("example:1", self.compute, timeout)
+        timeout.assert_called_once_with(["fresh"])
+
+    def test_none_is_not_cached(self):
+        """Test that ``None`` results are recomputed on the next call."""
+        compute = mock.Mock(return_value=None)
+        get_or_set("example:1", compute, 60)
+        get_or_set("example:1", compute, 60)
+        self.assertEqual(compute.call_count, 2)
+
+    def test_stale_value_served_while_lease_is_held(self):
+        """Test that other workers serve the previous version during a recompute."""
+        get_or_set("example:1", lambda: ["old"], 60)
+        cache.add(_lease_key("example:2"), True, LEASE_TIMEOUT)
+        self.assertEqual(get_or_set("example:2", self.compute, 60), ["old"])
+        self.compute.assert_not_called()
+
+    def test_no_stale_value_without_stale_copies(self):
+        """Test that values cached with ``keep_stale=False`` are never served stale."""
+        get_or_set("example:1", lambda: ["old"], 60, keep_stale=False)
+        cache.add(_lease_key("example:2"), True, LEASE_TIMEOUT)
+        with mock.patch("utils.cache.LEASE_WAIT", 0):
+            value = get_or_set("example:2", self.compute, 60, keep_stale=False)
+        self.assertEqual(value, ["fresh"])
+
+    def test_value_computed_when_lease_is_released_without_value(self):
+        """Test that a worker computes the value itself if nothing appears."""
+        cache.add(_lease_key("example:1"), True, LEASE_TIMEOUT)
+        with mock.patch("utils.cache.cache.get_many", return_value={}):
+            self.assertEqual(get_or_set("example:1", self.compute, 60), ["fresh"])
+
+    def test_entry_recomputed_early_before_expiry(self):
+        """Test that an entry close to its expiry may be recomputed early."""
+        get_or_set("example:1", lambda: ["old"], 60)
+        with mock.patch("utils.cache._should_recompute_early", return_value=True):
+            self.assertEqual(get_or_set("example:1", self.compute, 60), ["fresh"])
+        self.assertIsNone(cache.get(_lease_key("example:1")))
+
+    def test_early_recompute_skipped_while_lease_is_held(self):
+        """Test that only the lease holder recomputes an expiring entry."""
+        get_or_set("example:1", lambda: ["old"], 60)
+        cache.add(_lease_key("example:1"), True, LEASE_TIMEOUT)
+        with mock.patch("utils.cache._should_recompute_early", return_value=True):
+            self.assertEqual(get_or_set("example:1", self.compute, 60), ["old"])
+        self.compute.assert_not_called()
+
+    def test_local_value_served_without_shared_cache(self):
+        """Test that values kept locally do not need the shared cache."""
+        get_or_set("example:1", self.compute, 60, local=True)
+        cache.clear()
+        self.assertEqual(
+            get_or_set("example:1", self.compute, 60, local=True), ["fresh"]
+        )
+        self.compute.assert_called_once()
+
+    def test_local_versions_follow_bumps(self):
+        """Test that bumping a namespace replaces the locally kept version."""
+        key = versioned_key("example", "news")
+        with mock.patch("utils.cache.cache.get_many") as get_many:
+            self.assertEqual(key, versioned_key("example", "news"))
+        get_many.assert_not_called()
+        _bump_namespaces(["news"])
+        self.assertNotEqual(key, versioned_key("example", "news"))
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class GetManyOrSetTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        local_cache.clear()
+        self.compute = mock.Mock(side_effect=lambda keys: {key: [key] for key in keys})
+
+    def test_missing_values_are_computed_together(self):
+        """Test that only the missing values are computed, in a single call."""
+        get_many_or_set(["example:1"], self.compute, 60)
+        values = get_many_or_set(["example:1", "example:2"], self.compute, 60)
+        self.assertEqual(
+            values, {"example:1": ["example:1"], "example:2": ["example:2"]}
+        )
+        self.compute.assert_has_calls(
+            [mock.call(["example:1"]), mock.call(["example:2"])]
+        )
+
+    def test_values_are_read_in_one_round_trip(self):
+        """Test that cached values are fetched with a single ``get_many``."""
+        get_many_or_set(["example:1", "example:2"], self.compute, 60)
+        with mock.patch.object(cache, "get_many", wraps=cache.get_many) as get_many:
+            get_many_or_set(["example:1", "example:2"], self.compute, 60)
+        get_many.assert_called_once()
+        self.compute.assert_called_once()
+        self.assertIsNone(cache.get(_lease_key("example:1")))
+
+    def test_compact_values(self):
+        """Test that compact values are packed in the cache and unpacked on reads."""
+        values = get_many_or_set(["example:1"], self.compute, 60, compact=True)
+        self.assertEqual(values, {"example:1": ["example:1"]})
+        self.assertIsInstance(cache.get("example:1")[0], bytes)
+
+
+class InlineExecutor:
+    """Executor running submitted functions immediately, in the test thread."""
+
+    def submit(self, function, *args):
+        function(*args)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+@mock.patch("utils.cache._refresh_executor", return_value=InlineExecutor())
+# Running inline, the refresh must not close the test's database connection.
+@mock.patch("utils.cache.close_old_connections", mock.Mock())
+class StaleWhileRevalidateTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        local_cache.clear()
+        self.compute = mock.Mock(return_value=["fresh"])
+        # An entry whose soft expiry has passed but which is still stored.
+        cache.set("example:1", (["old"], time.time() - 1, 0.0), 60)
+
+    def test_expired_value_served_while_refreshing(self, executor):
+        """Test that an expired value is served and refreshed in the background."""
+        value = get_or_set("example:1", self.compute, 60, stale_while_revalidate=60)
+        self.assertEqual(value, ["old"])
+        self.compute.assert_called_once()
+        self.assertEqual(cache.get("example:1")[0], ["fresh"])
+        self.assertIsNone(cache.get(_lease_key("example:1")))
+
+    def test_single_refresh_while_lease_is_held(self, executor):
+        """Test that only the lease holder schedules a refresh."""
+        cache.add(_lease_key("example:1"), True, LEASE_TIMEOUT)
+        value = get_or_set("example:1", self.compute, 60, stale_while_revalidate=60)
+        self.assertEqual(value, ["old"])
+        self.compute.assert_not_called()
+
+    def test_failed_refresh_keeps_previous_value(self, executor):
+        """Test that a failing refresh releases the lease and keeps the entry."""
+        self.compute.side_effect = RuntimeError
+        with self.assertLogs("utils.cache", "ERROR"):
+            value = get_or_set("example:1", self.compute, 60, stale_while_revalidate=60)
+        self.assertEqual(value, ["old"])
+        self.assertEqual(cache.get("example:1")[0], ["old"])
+        self.assertIsNone(cache.get(_lease_key("example:1")))
+
+    def test_stored_past_timeout(self, executor):
+        """Test that entries are kept ``stale_while_revalidate`` seconds longer."""
+        with mock.patch.object(cache, "set_many", wraps=cache.set_many) as set_many:
+            get_or_set("example:2", self.compute, 60, stale_while_revalidate=30)
+        set_many.assert_any_call({"example:2": mock.ANY}, 90)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class VersionedConditionTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        local_cache.clear()
+        self.request = RequestFactory().get("/")
+        self.decorator = versioned_condition(lambda request: ["news"])
+
+    def test_fresh_page_has_etag(self):
+        """Test that pages built from fresh values carry an ETag."""
+        response = self.decorator(lambda request: HttpResponse())(self.request)
+        self.assertTrue(response.has_header("ETag"))
+
+    def test_stale_page_has_no_validators(self):
+        """Test that pages built from stale values carry no validators."""
+
+        def view(request):
+            _served_stale.set(True)
+            return HttpResponse()
+
+        response = self.decorator(view)(self.request)
+        self.assertFalse(response.has_header("ETag"))
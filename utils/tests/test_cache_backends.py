@@ -0,0 +1,119 @@
+from unittest import mock
+from django.test import SimpleTestCase
+from django_redis.exceptions import ConnectionInterrupted
+from utils import cache_backends
+from utils.cache_backends import CircuitBreaker, CircuitBreakerRedisCache
+
+
+class CircuitBreakerTest(SimpleTestCase):
+    def setUp(self):
+        self.breaker = CircuitBreaker(
+            failure_threshold=2, cooldown=30, max_dirty_keys=2
+        )
+
+    def test_circuit_opens_after_consecutive_failures(self):
+        """Test that Redis is skipped once the failure threshold is reached."""
+        self.breaker.record_failure()
+        self.assertTrue(self.breaker.allow())
+        self.breaker.record_failure()
+        self.assertFalse(self.breaker.allow())
+
+    def test_success_resets_the_failure_count(self):
+        """Test that only consecutive failures open the circuit."""
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+        self.assertTrue(self.breaker.allow())
+
+    def test_single_probe_after_cooldown(self):
+        """Test that one operation probes Redis once the cooldown is over."""
+        with mock.patch("utils.cache_backends.time.monotonic", return_value=100):
+            self.breaker.record_failure()
+            self.breaker.record_failure()
+        with mock.patch("utils.cache_backends.time.monotonic", return_value=131):
+            self.assertTrue(self.breaker.allow())
+            self.assertFalse(self.breaker.allow())
+
+    def test_success_returns_dirty_keys(self):
+        """Test that closing the circuit returns the keys changed meanwhile."""
+        self.assertIsNone(self.breaker.record_success())
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.breaker.mark_dirty(["a", "b", "c"])
+        self.assertEqual(self.breaker.record_success(), {"a", "b"})
+        self.assertIsNone(self.breaker.record_success())
+
+
+class CircuitBreakerRedisCacheTest(SimpleTestCase):
+    def setUp(self):
+        patcher = mock.patch.dict(cache_backends._breakers, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cache = CircuitBreakerRedisCache(
+            "redis://127.0.0.1:6379/15",
+            {
+                "OPTIONS": {
+                    "CIRCUIT_BREAKER": {
+                        "FAILURE_THRESHOLD": 2,
+                        "COOLDOWN": 30,
+                        "SHARED_PREFIXES": ["metrics:"],
+                    }
+                }
+            },
+        )
+        self.cache._client = mock.Mock()
+        self.cache._fallback.clear()
+
+    def fail(self):
+        """Make every Redis operation fail."""
+        error = ConnectionInterrupted(connection=None)
+        for method in ("get", "set", "add", "incr", "delete", "delete_many"):
+            getattr(self.cache._client, method).side_effect = error
+
+    def test_redis_is_used_while_available(self):
+        """Test that operations go to Redis while it answers."""
+        self.cache._client.get.return_value = "value"
+        self.assertEqual(self.cache.get("key"), "value")
+        self.assertTrue(self.cache.is_available)
+
+    def test_failures_fall_back_to_local_cache(self):
+        """Test that values are kept locally once Redis stops answering."""
+        self.fail()
+        self.cache.set("key", "value")
+        self.cache.set("key", "value")
+        self.assertFalse(self.cache.is_available)
+        self.cache._client.get.reset_mock()
+        self.assertEqual(self.cache.get("key"), "value")
+        self.cache._client.get.assert_not_called()
+
+    def test_set_returns_none(self):
+        """Test that ``set`` never replaces the response it caches."""
+        self.cache._client.set.return_value = True
+        self.assertIsNone(self.cache.set("key", "value"))
+
+    def test_recovery_deletes_keys_changed_during_outage(self):
+        """Test that Redis forgets versions bumped while it was unavailable."""
+        self.fail()
+        self.cache.set("ns:news", 1)
+        self.cache.set("ns:news", 1)
+        self.assertEqual(self.cache.incr("ns:news"), 2)
+
+        self.cache._client.get.side_effect = None
+        self.cache._client.get.return_value = 1
+        self.cache._client.delete_many.side_effect = None
+        with mock.patch("utils.cache_backends.time.monotonic", return_value=10**9):
+            self.assertEqual(self.cache.get("ns:news"), 1)
+        self.assertTrue(self.cache.is_available)
+        self.cache._client.delete_many.assert_called_once_with(["ns:news"])
+        self.assertIsNone(self.cache._fallback.get("ns:news"))
+
+    def test_shared_keys_are_not_changed_locally(self):
+        """Test that shared counters are neither kept locally nor marked dirty."""
+        self.fail()
+        self.cache.set("key", "value")
+        self.cache.set("key", "value")
+        self.assertFalse(self.cache.add("metrics:news:hits", 1, None))
+        with self.assertRaises(ValueError):
+            self.cache.incr("metrics:news:hits")
+        self.assertIsNone(self.cache._fallback.get("metrics:news:hits"))
+        self.assertEqual(self.cache._breaker.dirty_keys, set())
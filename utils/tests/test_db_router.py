@@ -0,0 +1,98 @@
+import time
+from unittest import mock
+from django.contrib.auth.models import Group
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from news.models import Post
+from utils.cache import bump_namespaces, NEWS
+from utils.db_router import (
+    PIN_COOKIE,
+    ReplicaRouter,
+    ReplicaRouterMiddleware,
+    pin_replicas,
+)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class ReplicaRouterTest(TestCase):
+    def setUp(self):
+        patcher = mock.patch("utils.db_router.replicas", return_value=["replica_1"])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.router = ReplicaRouter()
+        self.factory = RequestFactory()
+
+    def serve(self, request, write=False):
+        """Serve ``request`` and return the response and the database read from."""
+        read_from = []
+
+        def view(request):
+            if write:
+                self.router.db_for_write(Post)
+            read_from.append(self.router.db_for_read(Post))
+            return HttpResponse()
+
+        response = ReplicaRouterMiddleware(view)(request)
+        return response, read_from[0]
+
+    def test_public_reads_use_replicas(self):
+        """Test that public pages read the public apps from a replica."""
+        response, read_from = self.serve(self.factory.get("/news/"))
+        self.assertEqual(read_from, "replica_1")
+        self.assertNotIn(PIN_COOKIE, response.cookies)
+
+    def test_other_apps_follow_their_related_objects(self):
+        """Test that reads of other applications are not routed."""
+        self.assertIsNone(self.router.db_for_read(Group))
+
+    def test_admin_and_unsafe_requests_use_primary(self):
+        """Test that the admin site and form submissions read from the primary."""
+        _, read_from = self.serve(self.factory.get("/admin/news/post/"))
+        self.assertEqual(read_from, "default")
+        _, read_from = self.serve(self.factory.post("/news/"))
+        self.assertEqual(read_from, "default")
+
+    def test_writes_pin_the_session_to_primary(self):
+        """Test that a write sends the next requests of the browser to the primary."""
+        response, read_from = self.serve(self.factory.post("/news/"), write=True)
+        self.assertEqual(read_from, "default")
+        cookie = response.cookies[PIN_COOKIE]
+        self.assertEqual(cookie["max-age"], 5)
+
+        request = self.factory.get("/news/")
+        request.COOKIES[PIN_COOKIE] = cookie.value
+        _, read_from = self.serve(request)
+        self.assertEqual(read_from, "default")
+
+        request.COOKIES[PIN_COOKIE] = str(time.time() - 1)
+        _, read_from = self.serve(request)
+        self.assertEqual(read_from, "replica_1")
+
+    def test_writes_outside_requests_do_not_pin(self):
+        """Test that writes outside requests leave the later reads on replicas."""
+        self.router.db_for_write(Post)
+        self.assertEqual(self.router.db_for_read(Post), "replica_1")
+        _, read_from = self.serve(self.factory.get("/news/"))
+        self.assertEqual(read_from, "replica_1")
+
+    def test_content_changes_pin_every_worker_to_primary(self):
+        """Test that reads use the primary for a while after content changed."""
+        with self.captureOnCommitCallbacks(execute=True):
+            bump_namespaces(NEWS)
+        _, read_from = self.serve(self.factory.get("/news/"))
+        self.assertEqual(read_from, "default")
+        # Outside of requests, e.g. in background cache refreshes, too.
+        self.assertEqual(self.router.db_for_read(Post), "default")
+
+    @override_settings(REPLICA_PIN_SECONDS=0)
+    def test_pin_expires(self):
+        """Test that the pin only lasts ``REPLICA_PIN_SECONDS``."""
+        pin_replicas()
+        self.assertEqual(self.router.db_for_read(Post), "replica_1")
+
+    def test_only_primary_is_migrated(self):
+        """Test that migrations only run on the primary."""
+        self.assertTrue(self.router.allow_migrate("default", "news"))
+        self.assertFalse(self.router.allow_migrate("replica_1", "news"))
@@ -0,0 +1,185 @@
+import socketserver
+import threading
+import time
+from unittest import mock
+from django.conf import settings
+from django.test import SimpleTestCase, override_settings
+from utils import local_cache as local_cache_module
+from utils.local_cache import (
+    INVALIDATION_CHANNEL,
+    InvalidationListener,
+    LocalCache,
+    invalidate,
+    local_cache,
+)
+
+
+class LocalCacheTest(SimpleTestCase):
+    def setUp(self):
+        self.cache = LocalCache(max_entries=2, timeout=30)
+
+    def test_get_returns_stored_value(self):
+        """Test that stored values are returned until they are deleted."""
+        self.cache.set("a", 1)
+        self.assertEqual(self.cache.get("a"), 1)
+        self.cache.delete("a")
+        self.assertIsNone(self.cache.get("a"))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the cache never holds more than ``max_entries`` values."""
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+        self.cache.get("a")
+        self.cache.set("c", 3)
+        self.assertEqual(self.cache.get("a"), 1)
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.get("c"), 3)
+
+    def test_entries_expire(self):
+        """Test that entries are dropped after the timeout."""
+        with mock.patch("utils.local_cache.time.monotonic", return_value=100):
+            self.cache.set("a", 1)
+        with mock.patch("utils.local_cache.time.monotonic", return_value=131):
+            self.assertIsNone(self.cache.get("a"))
+
+    def test_value_read_before_invalidation_is_discarded(self):
+        """Test that a value read before an invalidation is not stored."""
+        generation = self.cache.generation
+        self.cache.delete("a")
+        self.cache.set("a", "outdated", generation)
+        self.assertIsNone(self.cache.get("a"))
+
+    def test_zero_timeout_disables_cache(self):
+        """Test that a zero timeout disables the local tier."""
+        self.cache.configure(max_entries=2, timeout=0)
+        self.cache.set("a", 1)
+        self.assertIsNone(self.cache.get("a"))
+
+
+class InvalidateTest(SimpleTestCase):
+    def setUp(self):
+        local_cache.clear()
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    )
+    def test_invalidate_without_redis_is_local(self):
+        """Test that invalidation only evicts in-process without Redis."""
+        local_cache.set("ns:news", 1)
+        with mock.patch.object(local_cache_module, "get_redis_connection") as redis:
+            invalidate("ns:news")
+        redis.assert_not_called()
+        self.assertIsNone(local_cache.get("ns:news"))
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django_redis.cache.RedisCache",
+                "LOCATION": "redis://127.0.0.1:6379/1",
+            }
+        }
+    )
+    def test_invalidate_publishes_keys_with_redis(self):
+        """Test that invalidated keys are published to the other workers."""
+        local_cache.set("ns:news", 1)
+        with mock.patch.object(local_cache_module, "get_redis_connection") as redis:
+            invalidate("ns:news", "ns:committees")
+        redis.return_value.publish.assert_called_once_with(
+            INVALIDATION_CHANNEL, "ns:news ns:committees"
+        )
+        self.assertIsNone(local_cache.get("ns:news"))
+
+
+class SilentPubSubServer(socketserver.ThreadingTCPServer):
+    """Redis server answering commands and staying silent once subscribed."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), SilentPubSubHandler)
+        self.subscriber = None
+        self.subscribed = threading.Event()
+
+    def publish(self, data):
+        """Send ``data`` on the invalidation channel to the subscriber."""
+        channel = INVALIDATION_CHANNEL.encode()
+        self.subscriber.sendall(
+            b"*3\r\n$7\r\nmessage\r\n"
+            + b"$%d\r\n%s\r\n" % (len(channel), channel)
+            + b"$%d\r\n%s\r\n" % (len(data), data)
+        )
+
+
+class SilentPubSubHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            arguments = []
+            for _ in range(int(line[1:])):
+                length = int(self.rfile.readline()[1:])
+                arguments.append(self.rfile.read(length + 2)[:-2])
+            if arguments[0].upper() == b"SUBSCRIBE":
+                channel = arguments[1]
+                self.wfile.write(
+                    b"*3\r\n$9\r\nsubscribe\r\n"
+                    + b"$%d\r\n%s\r\n:1\r\n" % (len(channel), channel)
+                )
+                self.server.subscriber = self.request
+                self.server.subscribed.set()
+            elif arguments[0].upper() == b"PING":
+                self.wfile.write(b"+PONG\r\n")
+            else:
+                self.wfile.write(b"+OK\r\n")
+
+
+class InvalidationListenerTest(SimpleTestCase):
+    def setUp(self):
+        self.server = SilentPubSubServer()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        local_cache.clear()
+
+    def test_listener_survives_idle_channel(self):
+        """Test that the listener stays subscribed with the production timeouts."""
+        host, port = self.server.server_address
+        options = {
+            key: value
+            for key, value in settings.CACHES["default"].get("OPTIONS", {}).items()
+            if key != "CIRCUIT_BREAKER"
+        }
+        caches = {
+            "default": {
+                "BACKEND": "django_redis.cache.RedisCache",
+                "LOCATION": f"redis://{host}:{port}/0",
+                "OPTIONS": {
+                    **options,
+                    "SOCKET_CONNECT_TIMEOUT": 0.1,
+                    "SOCKET_TIMEOUT": 0.1,
+                },
+            }
+        }
+        with override_settings(CACHES=caches):
+            listener = InvalidationListener()
+            listener.start()
+            try:
+                self.assertTrue(self.server.subscribed.wait(5))
+                self.assertTrue(listener.subscribed.wait(5))
+                with self.assertNoLogs("utils.local_cache"):
+                    # Many times the socket timeout without any message.
+                    time.sleep(0.5)
+                    self.assertTrue(listener.subscribed.is_set())
+                    local_cache.set("ns:news", 1)
+                    self.server.publish(b"ns:news")
+                    for _ in range(50):
+                        if local_cache.get("ns:news") is None:
+                            break
+                        time.sleep(0.02)
+                    self.assertIsNone(local_cache.get("ns:news"))
+            finally:
+                listener.stop()
+                listener.join(5)
+        self.assertFalse(listener.is_alive())
@@ -0,0 +1,68 @@
+import logging
+from unittest import mock
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from utils.cache import get_or_set
+from utils.local_cache import local_cache
+from utils.metrics import key_family, metrics, track
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class CacheMetricsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        local_cache.clear()
+        metrics.reset()
+
+    def test_key_family(self):
+        """Test that keys are reported under the family they start with."""
+        self.assertEqual(key_family("news_archive_all_2024_05:1"), "news_archive")
+        self.assertEqual(key_family("committee_sports:1"), "committee")
+        self.assertEqual(key_family("all_committees:1"), "all_committees")
+        self.assertEqual(key_family("unknown:1"), "other")
+
+    def test_hits_and_misses_are_counted(self):
+        """Test that lookups are counted as hits or misses of their family."""
+        get_or_set("latest_posts:1", lambda: ["post"], 60)
+        get_or_set("latest_posts:1", lambda: ["post"], 60)
+        counts = metrics.totals()["latest_posts"]
+        self.assertEqual(counts["lookups"], 2)
+        self.assertEqual(counts["hits"], 1)
+        self.assertEqual(counts["misses"], 1)
+        self.assertGreater(counts["microseconds"], 0)
+
+    def test_ignored_exceptions_are_counted(self):
+        """Test that errors logged by django-redis count for the current family."""
+        with track("committee"):
+            logging.getLogger("django_redis.cache").error("Exception ignored")
+        self.assertEqual(metrics.totals()["committee"]["errors"], 1)
+
+    def test_counters_are_kept_while_cache_is_down(self):
+        """Test that counters the cache did not accept are sent later."""
+        metrics.record("committee", "hits")
+        # django-redis returns None when IGNORE_EXCEPTIONS hides an error.
+        with mock.patch.object(cache, "add", return_value=None), mock.patch.object(
+            cache, "incr", return_value=None
+        ):
+            metrics.flush()
+        self.assertEqual(metrics.totals()["committee"]["hits"], 1)
+
+    def test_counters_are_not_flushed_during_outages(self):
+        """Test that counters are kept unsent while Redis is being skipped."""
+        metrics.record("committee", "hits")
+        with mock.patch.object(cache, "is_available", False, create=True):
+            metrics.flush()
+        self.assertIsNone(cache.get("metrics:committee:hits"))
+        self.assertEqual(metrics.totals()["committee"]["hits"], 1)
+
+    def test_command_prints_and_resets_counters(self):
+        """Test that the command prints the counters and can reset them."""
+        get_or_set("latest_posts:1", lambda: ["post"], 60)
+        out = StringIO()
+        call_command("cache_metrics", "--reset", stdout=out)
+        self.assertIn("latest_posts", out.getvalue())
+        self.assertEqual(metrics.totals()["latest_posts"]["lookups"], 0)
@@ -0,0 +1,58 @@
+from unittest import mock
+from django.contrib.auth.models import User, Group
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from committees.models import Committee
+from news.models import Post
+from utils.paginator import EstimatedCountPaginator, estimated_count
+
+
+class EstimatedCountPaginatorTest(TestCase):
+    def setUp(self):
+        self.group = Group.objects.create(name="Test Committee")
+        self.committee = Committee.objects.create(
+            group=self.group,
+            slug="test-committee",
+            description="A test committee",
+            email="test@example.com",
+        )
+        for number in range(3):
+            Post.objects.create(
+                title=f"Post {number}", content="Content", committee=self.committee
+            )
+
+    def test_sqlite_counts_are_exact(self):
+        """Test that databases without estimates fall back to exact counts."""
+        queryset = Post.objects.order_by("pk")
+        self.assertIsNone(estimated_count(queryset))
+        self.assertEqual(EstimatedCountPaginator(queryset, 2).count, 3)
+
+    @override_settings(ESTIMATED_COUNT_THRESHOLD=1000)
+    def test_estimate_used_above_threshold(self):
+        """Test that estimates above the threshold replace the exact count."""
+        queryset = Post.objects.order_by("pk")
+        with mock.patch("utils.paginator.estimated_count", return_value=5000):
+            with self.assertNumQueries(0):
+                self.assertEqual(EstimatedCountPaginator(queryset, 2).count, 5000)
+        with mock.patch("utils.paginator.estimated_count", return_value=999):
+            self.assertEqual(EstimatedCountPaginator(queryset, 2).count, 3)
+
+    def test_lists_are_counted_exactly(self):
+        """Test that object lists other than querysets are not estimated."""
+        with mock.patch("utils.paginator.estimated_count") as estimate:
+            self.assertEqual(EstimatedCountPaginator([1, 2, 3], 2).count, 3)
+        estimate.assert_not_called()
+
+    def test_changelist_counts_once(self):
+        """Test that the admin changelist no longer counts the full table."""
+        User.objects.create_superuser(
+            username="admin", email="admin@example.com", password="password"
+        )
+        self.client.login(username="admin", password="password")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("admin:news_post_changelist"))
+        self.assertEqual(response.status_code, 200)
+        counts = [q for q in queries.captured_queries if "COUNT(" in q["sql"]]
+        self.assertEqual(len(counts), 1)
@@ -0,0 +1,89 @@
+import datetime
+import pickle
+from django.contrib.auth.models import User, Group
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+from committees.models import Committee
+from news.models import Post
+from utils.rows import COMPRESS_MIN_SIZE, Row, pack, unpack
+
+
+class RowTest(SimpleTestCase):
+    def setUp(self):
+        self.row = Row.for_model(Post, 1, "Title", title="Title", slug="title")
+
+    def test_fields_are_attributes(self):
+        """Test that row fields are exposed as attributes."""
+        self.assertEqual(self.row.slug, "title")
+        self.assertEqual(self.row.id, 1)
+        self.assertEqual(str(self.row), "Title")
+        with self.assertRaises(AttributeError):
+            self.row.content  # pylint: disable=pointless-statement
+
+    def test_row_is_read_only(self):
+        """Test that rows cannot be modified."""
+        with self.assertRaises(AttributeError):
+            self.row.title = "Changed"
+
+    def test_pickle_round_trip(self):
+        """Test that rows survive pickling."""
+        self.assertEqual(pickle.loads(pickle.dumps(self.row)).slug, "title")
+
+
+class PackTest(SimpleTestCase):
+    def test_round_trip(self):
+        """Test that rows and datetimes survive packing."""
+        created_at = timezone.now()
+        committee = Row.for_model(Committee, 2, "Board", slug="board")
+        rows = [
+            Row.for_model(Post, 1, "Title", created_at=created_at, committee=committee)
+        ]
+        unpacked = unpack(pack(rows))
+        self.assertEqual(unpacked, rows)
+        self.assertEqual(unpacked[0].created_at, created_at)
+        self.assertEqual(unpacked[0].committee.slug, "board")
+
+    def test_grouped_values_round_trip(self):
+        """Test that mappings with non-string keys survive packing."""
+        grouped = {2024: {"January": [Row.for_model(Post, 1, "Title")]}}
+        self.assertEqual(unpack(pack(grouped)), grouped)
+
+    def test_large_payloads_are_compressed(self):
+        """Test that large payloads are compressed."""
+        rows = [Row.for_model(Post, pk, "Title " * 10) for pk in range(100)]
+        payload = pack(rows)
+        self.assertTrue(payload.startswith(b"z"))
+        self.assertEqual(unpack(payload), rows)
+        self.assertTrue(pack(rows[:1]).startswith(b"m"))
+        self.assertLess(len(pack(rows[:1])), COMPRESS_MIN_SIZE)
+
+
+class QuerySetRowsTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="user@example.com", password="password"
+        )
+        self.group = Group.objects.create(name="Test Committee")
+        self.committee = Committee.objects.create(
+            group=self.group,
+            slug="test-committee",
+            description="A test committee",
+            contact_person=self.user,
+            email="test@example.com",
+        )
+        self.post = Post.objects.create(
+            title="Test Post",
+            slug="test-post",
+            content="Content for test post",
+            committee=self.committee,
+            created_at=timezone.now() - datetime.timedelta(days=1),
+        )
+
+    def test_rows_compare_equal_to_instances(self):
+        """Test that rows compare equal to the instances they stand in for."""
+        with self.assertNumQueries(1):
+            rows = Post.objects.rows()
+        self.assertEqual(rows, [self.post])
+        self.assertEqual(rows[0].committee, self.committee)
+        self.assertEqual(str(rows[0].committee), "Test Committee")
+        self.assertNotEqual(rows[0], self.committee)
@@ -0,0 +1,116 @@
+import datetime
+from django.apps import apps
+from django.contrib.auth.models import Group
+from django.db import connection, models
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+from activities.models import Activity
+from committees.models import Committee
+from news.models import Post
+from news.signals import restore_post_search_index
+
+
+class SearchTest(TestCase):
+    def setUp(self):
+        self.group = Group.objects.create(name="Test Committee")
+        self.committee = Committee.objects.create(
+            group=self.group,
+            slug="test-committee",
+            description="A test committee",
+            email="test@example.com",
+        )
+        self.market = Post.objects.create(
+            title="Flea market",
+            content="The flea market returns to the square.",
+            committee=self.committee,
+        )
+        self.garden = Post.objects.create(
+            title="Garden day",
+            content="Bring your gloves, the market garden needs weeding.",
+            committee=self.committee,
+        )
+
+    def test_search_ranks_best_matches_first(self):
+        """Test that posts matching more often are listed first."""
+        results = list(Post.objects.search("market"))
+        self.assertEqual(results, [self.market, self.garden])
+        self.assertGreater(results[0].rank, results[1].rank)
+
+    def test_search_requires_every_word(self):
+        """Test that only posts containing every word of the query match."""
+        self.assertEqual(list(Post.objects.search("market gloves")), [self.garden])
+        self.assertEqual(list(Post.objects.search("market concert")), [])
+
+    def test_search_ignores_case_and_accents(self):
+        """Test that words match regardless of their case and accents."""
+        self.assertEqual(list(Post.objects.search("FLÉA")), [self.market])
+
+    def test_search_treats_operators_as_words(self):
+        """Test that query syntax typed by users does not raise errors."""
+        self.assertEqual(list(Post.objects.search('flea" OR (garden*')), [])
+        self.assertEqual(list(Post.objects.search("NOT")), [])
+
+    def test_empty_query_matches_nothing(self):
+        """Test that a blank query returns no results."""
+        self.assertEqual(list(Post.objects.search("   ")), [])
+
+    def test_index_follows_updates_and_deletions(self):
+        """Test that saved and deleted posts are reflected in the results."""
+        self.market.title = "Book swap"
+        self.market.content = "Swap your books."
+        self.market.save()
+        self.assertEqual(list(Post.objects.search("flea")), [])
+        self.assertEqual(list(Post.objects.search("books")), [self.market])
+        self.garden.delete()
+        self.assertEqual(list(Post.objects.search("market")), [])
+
+    def test_index_follows_bulk_operations(self):
+        """Test that bulk inserts and updates are reflected in the results."""
+        Post.objects.bulk_create_with_slugs(
+            [Post(title="Street party", content="Music", committee=self.committee)]
+        )
+        self.assertEqual(Post.objects.search("party").count(), 1)
+        Post.objects.filter(pk=self.garden.pk).update(content="Compost talk")
+        self.assertEqual(list(Post.objects.search("compost")), [self.garden])
+
+    def test_activity_search_includes_location(self):
+        """Test that activities are also found by their location."""
+        activity = Activity.objects.create(
+            title="Clean-up",
+            content="Tidy the neighbourhood.",
+            start=timezone.now(),
+            end=timezone.now() + datetime.timedelta(hours=2),
+            location="Community centre",
+            committee=self.committee,
+        )
+        self.assertEqual(list(Activity.objects.search("centre")), [activity])
+
+
+class SearchIndexRestoreTest(TransactionTestCase):
+    def alter_title(self, max_length):
+        """Alter the title column of posts, which remakes their table on SQLite."""
+        old_field = Post._meta.get_field("title")
+        new_field = models.CharField("title", max_length=max_length)
+        new_field.set_attributes_from_name("title")
+        new_field.model = Post
+        with connection.schema_editor() as schema_editor:
+            schema_editor.alter_field(Post, old_field, new_field)
+
+    def test_triggers_are_restored_after_migrations(self):
+        """Test that posts are indexed again once migrations remade their table."""
+        self.alter_title(300)
+        self.addCleanup(
+            restore_post_search_index, apps.get_app_config("news"), "default"
+        )
+        self.addCleanup(self.alter_title, 200)
+        restore_post_search_index(sender=apps.get_app_config("news"), using="default")
+        committee = Committee.objects.create(
+            group=Group.objects.create(name="Test Committee"),
+            slug="test-committee",
+            description="A test committee",
+            email="test@example.com",
+        )
+        post = Post.objects.create(
+            title="Flea market", content="Bargains.", committee=committee
+        )
+        self.assertEqual(list(Post.objects.search("flea")), [post])
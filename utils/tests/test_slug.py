@@ -0,0 +1,76 @@
+from unittest import mock
+from django.contrib.auth.models import Group
+from django.test import TestCase
+from committees.models import Committee
+from news.models import Post
+from utils.slug import _taken_slugs_of_bases, generate_unique_slug
+
+
+class GenerateUniqueSlugTest(TestCase):
+    def setUp(self):
+        self.committee = Committee.objects.create(
+            group=Group.objects.create(name="Test Committee"),
+            slug="test-committee",
+            description="A test committee",
+            email="test@example.com",
+        )
+
+    def create_post(self, slug):
+        """Create a post with the given ``slug``."""
+        return Post.objects.create(
+            title="Weekly Update",
+            slug=slug,
+            content="Content",
+            committee=self.committee,
+        )
+
+    def test_first_free_suffix_in_one_query(self):
+        """Test that collisions are resolved with a single query."""
+        for slug in ["weekly-update", "weekly-update-1", "weekly-update-2"]:
+            self.create_post(slug)
+        self.create_post("weekly-update-news")
+        with self.assertNumQueries(1):
+            slug = generate_unique_slug(Post(), "Weekly Update")
+        self.assertEqual(slug, "weekly-update-3")
+
+    def test_values_without_slug_use_model_name(self):
+        """Test that values slugifying to nothing never fetch every slug."""
+        self.create_post("post")
+        self.create_post("weekly-update")
+        self.assertEqual(generate_unique_slug(Post(), "!!! 🎉"), "post-1")
+
+    def test_gaps_are_reused(self):
+        """Test that the lowest free suffix is used."""
+        self.create_post("weekly-update")
+        self.create_post("weekly-update-2")
+        self.assertEqual(
+            generate_unique_slug(Post(), "Weekly Update"), "weekly-update-1"
+        )
+
+    def test_own_slug_is_kept(self):
+        """Test that an instance does not clash with itself."""
+        post = self.create_post("weekly-update")
+        self.assertEqual(generate_unique_slug(post, "Weekly Update"), "weekly-update")
+
+    def test_save_retries_when_slug_is_taken_concurrently(self):
+        """Test that a slug taken after it was generated is replaced."""
+        self.create_post("weekly-update")
+        post = Post(title="Weekly Update", content="Content", committee=self.committee)
+        with mock.patch(
+            "utils.slug.generate_unique_slug",
+            side_effect=["weekly-update", "weekly-update-1"],
+        ):
+            post.save()
+        self.assertEqual(post.slug, "weekly-update-1")
+        self.assertEqual(Post.objects.count(), 2)
+
+
+class TakenSlugsOfBasesTest(TestCase):
+    def test_slug_field_name_is_used(self):
+        """Test that clashes are looked up in the given slug field."""
+        Group.objects.create(name="sports")
+        Group.objects.create(name="sports-1")
+        Group.objects.create(name="music")
+        self.assertEqual(
+            _taken_slugs_of_bases(Group, {"sports"}, "name"), {"sports", "sports-1"}
+        )
@@ -0,0 +1,50 @@
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from utils.signals import tune_sqlite
+from utils.sqlite import apply_pragmas
+
+
+class SQLiteTuningTest(TestCase):
+    def pragma(self, name):
+        with connection.cursor() as cursor:
+            cursor.execute(f"PRAGMA {name}")
+            return cursor.fetchone()[0]
+
+    def restore_busy_timeout(self):
+        with connection.cursor() as cursor:
+            apply_pragmas(cursor, {"busy_timeout": 5000})
+
+    def test_connections_are_tuned(self):
+        """Test that new connections get the configured PRAGMAs."""
+        self.assertEqual(self.pragma("busy_timeout"), 5000)
+        # 1 is NORMAL.
+        self.assertEqual(self.pragma("synchronous"), 1)
+        self.assertEqual(self.pragma("cache_size"), -20000)
+
+    @override_settings(SQLITE_PRAGMAS={"busy_timeout": 1234})
+    def test_pragmas_are_configurable(self):
+        """Test that the PRAGMAs come from ``SQLITE_PRAGMAS``."""
+        # Restored outside of tune_sqlite, which can't run inside the test's
+        # transaction once the synchronous setting is back.
+        self.addCleanup(self.restore_busy_timeout)
+        tune_sqlite(sender=type(connection), connection=connection)
+        self.assertEqual(self.pragma("busy_timeout"), 1234)
+
+    def test_unsafe_pragmas_are_rejected(self):
+        """Test that only known PRAGMAs with plain values are run."""
+        with connection.cursor() as cursor:
+            with self.assertRaises(ValueError):
+                apply_pragmas(cursor, {"writable_schema": "ON"})
+            with self.assertRaises(ValueError):
+                apply_pragmas(cursor, {"journal_mode": "WAL; DROP TABLE news_post"})
+
+    def test_benchmark_compares_configurations(self):
+        """Test that the benchmark prints both configurations."""
+        out = StringIO()
+        call_command(
+            "benchmark_sqlite", readers=1, writers=1, seconds=0.1, rows=10, stdout=out
+        )
+        self.assertIn("default", out.getvalue())
+        self.assertIn("tuned", out.getvalue())
@@ -0,0 +1,132 @@
+import datetime
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from activities.models import Activity
+from committees.models import Committee
+from news.models import Post
+from utils import typeahead
+from utils.cache import _stale_key
+from utils.typeahead import TrigramIndex, suggestions, typeahead_key
+
+
+def entry(label):
+    return (label, {"type": "post", "label": label, "url": f"/{label}/"})
+
+
+class TrigramIndexTest(TestCase):
+    def setUp(self):
+        self.index = TrigramIndex(
+            [
+                entry("Flea market"),
+                entry("Market day"),
+                entry("Supermarket tour"),
+                entry("Café evening"),
+                entry("Garden day"),
+            ]
+        )
+
+    def labels(self, query, limit=10):
+        return [suggestion["label"] for suggestion in self.index.lookup(query, limit)]
+
+    def test_lookup_ranks_prefixes_then_word_starts(self):
+        """Test that texts starting with the query come before other matches."""
+        self.assertEqual(
+            self.labels("market"), ["Market day", "Flea market", "Supermarket tour"]
+        )
+
+    def test_lookup_ignores_case_and_accents(self):
+        """Test that case and accents do not prevent a match."""
+        self.assertEqual(self.labels("CAFE"), ["Café evening"])
+        self.assertEqual(self.labels("café"), ["Café evening"])
+
+    def test_lookup_matches_short_queries(self):
+        """Test that queries shorter than a trigram are matched too."""
+        self.assertEqual(self.labels("ga"), ["Garden day"])
+
+    def test_lookup_requires_the_whole_query(self):
+        """Test that sharing trigrams is not enough to match."""
+        self.assertEqual(self.labels("market garden"), [])
+
+    def test_lookup_limits_results(self):
+        """Test that at most ``limit`` suggestions are returned."""
+        self.assertEqual(len(self.labels("a", limit=2)), 2)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class SuggestionsTest(TestCase):
+    def setUp(self):
+        typeahead._index = None
+        self.committee = Committee.objects.create(
+            group=Group.objects.create(name="Market Committee"),
+            slug="market-committee",
+            description="A test committee",
+            email="test@example.com",
+        )
+        self.post = Post.objects.create(
+            title="Flea market", content="Content", committee=self.committee
+        )
+        self.activity = Activity.objects.create(
+            title="Clean-up",
+            content="Content",
+            start=timezone.now(),
+            end=timezone.now() + datetime.timedelta(hours=2),
+            location="Market square",
+            committee=self.committee,
+        )
+
+    def test_suggestions_cover_titles_locations_and_committees(self):
+        """Test that posts, activities and committees are all suggested."""
+        results = suggestions("  MARKET ")
+        self.assertEqual(
+            {(result["type"], result["url"]) for result in results},
+            {
+                ("post", self.post.get_absolute_url()),
+                ("activity", self.activity.get_absolute_url()),
+                ("committee", self.committee.get_absolute_url()),
+            },
+        )
+
+    def test_short_queries_have_no_suggestions(self):
+        """Test that a single character is not searched for."""
+        with self.assertNumQueries(0):
+            self.assertEqual(suggestions("m"), [])
+
+    def test_suggestions_are_cached_per_query(self):
+        """Test that repeated queries are served from the cache."""
+        suggestions("market")
+        with self.assertNumQueries(0):
+            suggestions("Market")
+
+    def test_suggestions_follow_content_changes(self):
+        """Test that saved posts are suggested once the index is rebuilt."""
+        self.assertEqual(suggestions("swap"), [])
+        with self.captureOnCommitCallbacks(execute=True):
+            post = Post.objects.create(
+                title="Book swap", content="Content", committee=self.committee
+            )
+        self.assertEqual(
+            [result["url"] for result in suggestions("swap")],
+            [post.get_absolute_url()],
+        )
+
+    def test_content_changes_replace_the_index(self):
+        """Test that a new index replaces the outdated one as a whole."""
+        suggestions("market")
+        _, index = typeahead._index
+        with self.captureOnCommitCallbacks(execute=True):
+            Post.objects.create(
+                title="Book swap", content="Content", committee=self.committee
+            )
+        suggestions("swap")
+        self.assertIsNot(typeahead._index[1], index)
+        self.assertEqual(index.lookup("swap", 10), [])
+
+    def test_suggestions_have_no_stale_copy(self):
+        """Test that suggestions are not kept for later versions of the content."""
+        suggestions("market")
+        self.assertIsNotNone(cache.get(typeahead_key("market")))
+        self.assertIsNone(cache.get(_stale_key(typeahead_key("market"))))
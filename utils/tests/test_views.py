@@ -0,0 +1,134 @@
+import datetime
+from django.contrib.auth.models import Group, User
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from activities.models import Activity
+from committees.models import Committee
+from news.models import Post
+from utils.tests.helpers import loaded_columns
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    METRICS_TOKEN="secret",
+)
+class CacheMetricsViewTest(TestCase):
+    def setUp(self):
+        self.url = reverse("metrics")
+
+    def test_anonymous_access_is_denied(self):
+        """Test that anonymous visitors cannot read the metrics."""
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+        response = self.client.get(self.url, headers={"authorization": "Bearer x"})
+        self.assertEqual(response.status_code, 403)
+
+    def test_token_grants_access(self):
+        """Test that scrapers sending the token get the metrics."""
+        response = self.client.get(self.url, headers={"authorization": "Bearer secret"})
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'cache_hits_total{family="latest_posts"}')
+
+    def test_staff_members_have_access(self):
+        """Test that staff members can read the metrics."""
+        user = User.objects.create_user(
+            username="staff", password="password", is_staff=True
+        )
+        self.client.force_login(user)
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+
+
+class SearchViewTest(TestCase):
+    def setUp(self):
+        self.group = Group.objects.create(name="Test Committee")
+        self.committee = Committee.objects.create(
+            group=self.group,
+            slug="test-committee",
+            description="A test committee",
+            email="test@example.com",
+        )
+        self.post = Post.objects.create(
+            title="Flea market",
+            content="The flea market returns.",
+            committee=self.committee,
+        )
+        Post.objects.create(
+            title="Garden day", content="Weeding.", committee=self.committee
+        )
+        self.activity = Activity.objects.create(
+            title="Market stall set-up",
+            content="Help set up the stalls.",
+            start=timezone.now(),
+            end=timezone.now() + datetime.timedelta(hours=2),
+            location="Square",
+            committee=self.committee,
+        )
+
+    def test_search_lists_matching_posts_and_activities(self):
+        """Test that the search page lists the matching posts and activities."""
+        response = self.client.get(reverse("search"), {"q": "market"})
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "search.html")
+        self.assertEqual(
+            [post.slug for post in response.context["posts"]], [self.post.slug]
+        )
+        self.assertEqual(
+            [activity.slug for activity in response.context["activities"]],
+            [self.activity.slug],
+        )
+        self.assertContains(response, self.post.get_absolute_url())
+        self.assertNotContains(response, "Garden day")
+
+    def test_search_without_query_shows_form_only(self):
+        """Test that the search page without a query runs no search."""
+        response = self.client.get(reverse("search"))
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("posts", response.context)
+        self.assertContains(response, 'name="q"')
+
+    def test_search_loads_list_columns(self):
+        """Test that the search page never loads the content or files of posts."""
+        with loaded_columns() as columns:
+            self.client.get(reverse("search"), {"q": "market"})
+        self.assertLessEqual(
+            columns["news_post"], {"id", "title", "slug", "created_at", "committee_id"}
+        )
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class TypeaheadViewTest(TestCase):
+    def setUp(self):
+        self.committee = Committee.objects.create(
+            group=Group.objects.create(name="Test Committee"),
+            slug="test-committee",
+            description="A test committee",
+            email="test@example.com",
+        )
+        self.post = Post.objects.create(
+            title="Flea market", content="Content", committee=self.committee
+        )
+
+    def test_typeahead_returns_json_suggestions(self):
+        """Test that the typeahead endpoint returns the matching suggestions."""
+        response = self.client.get(reverse("typeahead"), {"q": "flea"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {
+                "query": "flea",
+                "results": [
+                    {
+                        "type": "post",
+                        "label": "Flea market",
+                        "url": self.post.get_absolute_url(),
+                    }
+                ],
+            },
+        )
+
+    def test_typeahead_without_query_returns_no_results(self):
+        """Test that the typeahead endpoint accepts a missing query."""
+        response = self.client.get(reverse("typeahead"))
+        self.assertEqual(response.json(), {"query": "", "results": []})
@@ -0,0 +1,210 @@
+"""Search-as-you-type suggestions over titles, locations and committee names.
+
+PostgreSQL matches the text with ``icontains`` lookups backed by the trigram
+indexes of :func:`utils.search.create_trigram_indexes`, and ranks it by trigram
+word similarity (committee names are not indexed, as there are only a few
+committees). Other databases match it against an in-memory trigram index,
+rebuilt from the database in each worker whenever the content changes.
+Suggestions are cached per query, i.e. per prefix typed, until the content
+changes, without stale copies as these would be kept for every prefix.
+"""
+
+import hashlib
+import unicodedata
+from collections import defaultdict
+
+from django.db import connection
+from django.urls import reverse
+
+from activities.models import Activity
+from committees.models import Committee
+from news.models import Post
+
+from .cache import (
+    ACTIVITIES,
+    COMMITTEES,
+    LIST_TIMEOUT,
+    NEWS,
+    get_or_set,
+    namespace_versions,
+    versioned_key,
+)
+
+# Suggestions returned, and the length of the queries suggestions are made for.
+TYPEAHEAD_RESULTS = 8
+MIN_QUERY_LENGTH = 2
+MAX_QUERY_LENGTH = 50
+TYPEAHEAD_TIMEOUT = LIST_TIMEOUT
+
+_NAMESPACES = (NEWS, ACTIVITIES, COMMITTEES)
+
+# The versions of the content held by the in-memory index of this worker, and
+# the index, replaced as a whole so that threads never see a partial update.
+_index = None
+
+
+def normalize(query):
+    """Return ``query`` lowercased and with single spaces, as it is cached."""
+    return " ".join(query.casefold().split())[:MAX_QUERY_LENGTH]
+
+
+def _fold(text):
+    """Return ``text`` lowercased and without accents."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def _trigrams(text):
+    """Return the set of three-character substrings of ``text``."""
+    return {text[start : start + 3] for start in range(len(text) - 2)}
+
+
+def _sources():
+    """Return the querysets suggestions are made from.
+
+    Each source is a ``(type, queryset, matched field, label field, URL name)``
+    tuple.
+    """
+    return [
+        ("post", Post.objects.all(), "title", "title", "news:detail"),
+        ("activity", Activity.objects.all(), "title", "title", "activities:detail"),
+        ("activity", Activity.objects.all(), "location", "title", "activities:detail"),
+        (
+            "committee",
+            Committee.objects.all(),
+            "group__name",
+            "group__name",
+            "committees:detail",
+        ),
+    ]
+
+
+def _suggestion(kind, label, slug, url_name):
+    """Return the suggestion of the object ``slug`` labelled ``label``."""
+    return {"type": kind, "label": label, "url": reverse(url_name, args=[slug])}
+
+
+class TrigramIndex:
+    """In-memory trigram index of the texts suggestions are made from."""
+
+    def __init__(self, entries):
+        """Index ``entries``, a list of ``(text, suggestion)`` pairs."""
+        self.texts = [_fold(text) for text, _ in entries]
+        self.suggestions = [suggestion for _, suggestion in entries]
+        self.postings = defaultdict(set)
+        for number, text in enumerate(self.texts):
+            for trigram in _trigrams(text):
+                self.postings[trigram].add(number)
+
+    @classmethod
+    def from_database(cls):
+        """Return the index of the texts currently in the database."""
+        entries = []
+        for kind, queryset, field, label_field, url_name in _sources():
+            fields = list(dict.fromkeys([field, label_field, "slug"]))
+            for values in queryset.values(*fields):
+                if values[field]:
+                    suggestion = _suggestion(
+                        kind, values[label_field], values["slug"], url_name
+                    )
+                    entries.append((values[field], suggestion))
+        return cls(entries)
+
+    def lookup(self, query, limit):
+        """Return the suggestions of the texts containing ``query``.
+
+        Case and accents are ignored. Texts starting with the query come
+        first, then texts with a word starting with it, shorter texts first.
+        """
+        query = _fold(query)
+        trigrams = _trigrams(query)
+        if trigrams:
+            # Intersect the rarest trigrams first to keep the sets small.
+            postings = sorted(
+                (self.postings.get(trigram, set()) for trigram in trigrams), key=len
+            )
+            candidates = set.intersection(*postings)
+        else:
+            candidates = range(len(self.texts))
+        ranked = []
+        for number in candidates:
+            text = self.texts[number]
+            position = text.find(query)
+            if position < 0:
+                continue
+            word_start = position == 0 or not text[position - 1].isalnum()
+            ranked.append((position != 0, not word_start, len(text), text, number))
+        ranked.sort()
+        return _unique([self.suggestions[entry[-1]] for entry in ranked], limit)
+
+
+def _unique(suggestions, limit):
+    """Return the first ``limit`` distinct ``suggestions``."""
+    seen = set()
+    unique = []
+    for suggestion in suggestions:
+        if suggestion["url"] not in seen:
+            seen.add(suggestion["url"])
+            unique.append(suggestion)
+    return unique[:limit]
+
+
+def _memory_suggestions(query, limit):
+    """Return suggestions from the index of this worker, rebuilt if outdated."""
+    global _index  # pylint: disable=global-statement
+    versions = namespace_versions(*_NAMESPACES)
+    current = _index
+    if current is not None and current[0] == versions:
+        index = current[1]
+    else:
+        # Built without a lock, so lookups of other threads never wait for it.
+        index = TrigramIndex.from_database()
+        _index = (versions, index)
+    return index.lookup(query, limit)
+
+
+def _database_suggestions(query, limit):
+    """Return suggestions ranked by PostgreSQL's trigram word similarity."""
+    from django.contrib.postgres.search import TrigramWordSimilarity
+
+    ranked = []
+    for kind, queryset, field, label_field, url_name in _sources():
+        rows = (
+            queryset.filter(**{f"{field}__icontains": query})
+            .annotate(similarity=TrigramWordSimilarity(query, field))
+            .order_by("-similarity")
+            .values_list(label_field, "slug", "similarity")[:limit]
+        )
+        for label, slug, similarity in rows:
+            ranked.append(
+                (-similarity, label, _suggestion(kind, label, slug, url_name))
+            )
+    ranked.sort(key=lambda entry: entry[:2])
+    return _unique([suggestion for _, _, suggestion in ranked], limit)
+
+
+def typeahead_key(query):
+    """Return the cache key of the suggestions for the normalized ``query``."""
+    digest = hashlib.sha1(query.encode()).hexdigest()[:16]
+    return versioned_key(f"typeahead_{digest}", *_NAMESPACES)
+
+
+def suggestions(query):
+    """Return the suggestions for ``query``, best first.
+
+    Each suggestion is a dict with the ``type`` of object suggested (``post``,
+    ``activity`` or ``committee``), its ``label`` and its ``url``.
+    """
+    query = normalize(query)
+    if len(query) < MIN_QUERY_LENGTH:
+        return []
+    if connection.vendor == "postgresql":
+        compute = _database_suggestions
+    else:
+        compute = _memory_suggestions
+    return get_or_set(
+        typeahead_key(query),
+        lambda: compute(query, TYPEAHEAD_RESULTS),
+        TYPEAHEAD_TIMEOUT,
+        keep_stale=False,
+    )
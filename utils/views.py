@@ -0,0 +1,94 @@
+"""Site-wide views: search over all kinds of content and operational data."""
+
+import hmac
+import logging
+
+from django.conf import settings
+from django.core.exceptions import PermissionDenied
+from django.http import HttpResponse, JsonResponse
+from django.views.decorators.cache import never_cache
+from django.views.generic import TemplateView, View
+
+from activities.models import Activity
+from news.models import Post
+from .metrics import metrics
+from .typeahead import suggestions
+
+logger = logging.getLogger(__name__)
+
+# Results shown per kind of content, and characters of the query searched for.
+SEARCH_RESULTS = 20
+SEARCH_QUERY_LENGTH = 100
+
+# Prometheus metric name and help text of each counter.
+_COUNTERS = {
+    "lookups": ("cache_lookups_total", "Cache lookups."),
+    "hits": ("cache_hits_total", "Keys found in the cache."),
+    "misses": ("cache_misses_total", "Keys computed because they were missing."),
+    "errors": ("cache_errors_total", "Cache operations that failed."),
+    "microseconds": (
+        "cache_lookup_seconds_total",
+        "Time spent in cache lookups, including recomputations.",
+    ),
+}
+
+
+def _is_authorized(request):
+    """Return whether ``request`` may read the metrics."""
+    if request.user.is_staff:
+        return True
+    token = getattr(settings, "METRICS_TOKEN", "")
+    header = request.headers.get("Authorization", "")
+    return bool(token) and hmac.compare_digest(header, f"Bearer {token}")
+
+
+@never_cache
+def cache_metrics(request):
+    """Return the cache metrics in the Prometheus text format.
+
+    Available to staff members and to scrapers sending ``METRICS_TOKEN`` as a
+    bearer token.
+    """
+    if not _is_authorized(request):
+        raise PermissionDenied
+    totals = metrics.totals()
+    lines = []
+    for field, (name, description) in _COUNTERS.items():
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} counter")
+        for family, counts in totals.items():
+            value = counts[field]
+            if field == "microseconds":
+                value /= 1_000_000
+            lines.append(f'{name}{{family="{family}"}} {value}')
+    return HttpResponse(
+        "\n".join(lines) + "\n", content_type="text/plain; version=0.0.4"
+    )
+
+
+class SearchView(TemplateView):
+    """Render the news posts and activities matching the ``q`` query parameter."""
+
+    template_name = "search.html"
+
+    def get_context_data(self, **kwargs):
+        """Add the query and the best matching posts and activities."""
+        context = super().get_context_data(**kwargs)
+        query = self.request.GET.get("q", "").strip()[:SEARCH_QUERY_LENGTH]
+        context["query"] = query
+        if query:
+            logger.debug("Searching posts and activities for %r", query)
+            context["posts"] = Post.objects.search(query)[:SEARCH_RESULTS].rows()
+            context["activities"] = Activity.objects.search(query)[
+                :SEARCH_RESULTS
+            ].rows()
+        return context
+
+
+class TypeaheadView(View):
+    """Return the suggestions for the ``q`` query parameter as JSON."""
+
+    def get(self, request):
+        """Return the posts, activities and committees matching the query."""
+        query = request.GET.get("q", "")
+        return JsonResponse({"query": query, "results": suggestions(query)})